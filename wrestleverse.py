@@ -1,31 +1,1026 @@
-import tkinter as tk
-from tkinter import ttk
-from tkinter import messagebox
-from tkinter import filedialog
+try:
+    import tkinter as tk
+    from tkinter import ttk
+    from tkinter import messagebox
+    from tkinter import filedialog
+except ImportError:
+    # Headless installs can still run the command line batch mode
+    tk = None
 import json
-import pandas as pd
+import argparse
+import csv
+import sys
 import random
 import os
 import time
-import requests
-import pyodbc
-from openai import OpenAI
+import re
 import datetime
 import logging
-from PIL import Image
+import logging.handlers
+import atexit
 import io
+import base64
+import copy
+import hashlib
+import decimal
+import math
+import tempfile
+import shutil
+import tracemalloc
+import types
+import multiprocessing
+import itertools
+import sqlite3
+from contextlib import contextmanager
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+# pandas, openai, pyodbc, requests and PIL are imported where they are first used
+# so the main menu does not wait on them
+STARTUP_STARTED = time.perf_counter()
+
+LOG_PATH = "log.txt"
+EVENTS_PATH = "wrestleverse_events.jsonl"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+QUIET_LOGGERS = ["openai", "httpx", "httpcore", "urllib3", "requests", "PIL"]
+EVENT_LOGGER = logging.getLogger("wrestleverse.events")
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {"time": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"), "event": record.getMessage()}
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, default=json_default)
+
+def setup_logging(level=logging.INFO):
+    if any(isinstance(handler, logging.handlers.QueueHandler) for handler in logging.getLogger().handlers):
+        return
+    # Handlers write from a listener thread so file I/O stays off the worker threads
+    file_handler = logging.handlers.RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(threadName)s - %(message)s'))
+    events_handler = logging.handlers.RotatingFileHandler(
+        EVENTS_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True
+    )
+    events_handler.setFormatter(JsonLinesFormatter())
+
+    listeners = []
+    for logger, handler in [(logging.getLogger(), file_handler), (EVENT_LOGGER, events_handler)]:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        listeners.append(listener)
+    EVENT_LOGGER.propagate = False
+    EVENT_LOGGER.setLevel(logging.INFO)
+
+    logging.getLogger().setLevel(level)
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+    for listener in listeners:
+        atexit.register(listener.stop)
+
+WRESTLING_STYLES = (
+    "1-Regular\n2-Entertainer\n3-Comedy\n4-Powerhouse\n5-Impactful\n6-Striker\n"
+    "7-Brawler\n8-Hardcore\n9-Psychopath\n10-Luchador\n11-High Flyer\n"
+    "12-Technician\n13-Technician Flyer\n14-Technician Striker\n15-Daredevil\n"
+    "16-MMA Crossover\n17-Never Wrestles\n"
+)
 
-logging.basicConfig(
-    filename='log.txt',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+RACES = (
+    "1: White\n2: Black\n3: Asian\n4: Hispanic\n5: American Indian\n"
+    "6: Middle Eastern\n7: South Asian\n8: Pacific\n9: Other\n"
 )
 
-class WrestleverseApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Wrestleverse")
-        self.root.geometry("600x500")
+ROLE_KEYS = [
+    "Wrestler", "OccasionalWrestler", "Manager", "OnScreenPersonality",
+    "PlayByPlayCommentator", "ColourCommentator", "Referee", "RoadAgent"
+]
+
+DEFAULT_ROLES_LANG_BODY = {
+    "Wrestler": True,
+    "OccasionalWrestler": False,
+    "Manager": False,
+    "OnScreenPersonality": False,
+    "PlayByPlayCommentator": False,
+    "ColourCommentator": False,
+    "Referee": False,
+    "RoadAgent": False,
+    "Languages": {
+        "English": 4,
+        "Japanese": 1,
+        "Spanish": 2,
+        "French": 2,
+        "Germanic": 2,
+        "Mediterranean": 2,
+        "Slavic": 1,
+        "Hindi": 1
+    },
+    "BodyType": 1
+}
+
+DEFAULT_FINISHERS = {
+    "Finisher": {"MoveName":"Default Driver","MoveDesc":"A strong slam."},
+    "SecondaryFinisher": {"MoveName":"Lesser Lariat","MoveDesc":"A quick clothesline."},
+    "UberFinisher": {"MoveName":"Extreme End","MoveDesc":"A rare, devastating move."}
+}
+
+POPULARITY_REGIONS = ["America","Canada","Mexico","British Isles","Japan","Europe","Oceania","India"]
+
+POPULARITY_CATEGORIES = [
+    "Unknown", "Insignificant", "Indie Popularity", "Recognized", "Well Known", "Very Popular", "Superstar"
+]
+
+def int_in_range(value, low, high, default):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return value if low <= value <= high else default
+
+def is_json_object(text):
+    try:
+        return isinstance(json.loads(text), dict)
+    except ValueError:
+        return False
+
+def json_default(value):
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def json_object_hook(obj):
+    if "__datetime__" in obj and len(obj) == 1:
+        return datetime.datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+WORKERS_CHECKPOINT_PATH = "wrestleverse_workers.checkpoint.jsonl"
+COMPANIES_CHECKPOINT_PATH = "wrestleverse_companies.checkpoint.jsonl"
+WORKERS_STORE_PATH = "wrestleverse_workers.sqlite"
+WORKERS_EXCEL_PATH = "wrestleverse_workers.xlsx"
+WORKER_SHEETS = ["Workers", "Bios", "Skills", "Contracts", "Notes"]
+IMAGE_STATUS_PATH = "wrestleverse_images.sqlite"
+WORKER_FLUSH_SIZE = 50
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+METRICS_PATH = "wrestleverse_metrics.json"
+BANNER_ASPECT = 12.5
+LOGO_CROP_FRACTION = 0.5
+
+class CheckpointJournal:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def start(self, job):
+        with self.lock:
+            self.file = open(self.path, "w", encoding="utf-8")
+            self.write_line({"type": "job", "job": job})
+
+    def append(self, index, record):
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.write_line({"type": "record", "index": index, "record": record})
+
+    def mark_saved(self, indexes, job_updates=None, parts=None):
+        entry = {"type": "saved", "indexes": list(indexes), "job": job_updates or {}}
+        if parts is not None:
+            entry["parts"] = list(parts)
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.write_line(entry)
+
+    def write_line(self, entry):
+        self.file.write(json.dumps(entry, default=json_default) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def load(self):
+        job = None
+        completed = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line, object_hook=json_object_hook)
+                except json.JSONDecodeError:
+                    # A crash mid-write leaves at most one torn line at the end
+                    logging.warning(f"Skipping unreadable line in {self.path}")
+                    continue
+                if entry.get("type") == "job":
+                    job = entry["job"]
+                elif entry.get("type") == "record":
+                    completed[entry["index"]] = entry["record"]
+                elif entry.get("type") == "saved":
+                    # Saved records only need to be skipped on resume, not replayed
+                    for index in entry["indexes"]:
+                        if "parts" not in entry:
+                            completed[index] = None
+                        elif completed.get(index):
+                            # Partly saved records are replayed only into the targets they missed
+                            completed[index].setdefault("saved_parts", []).extend(entry["parts"])
+                    if job is not None:
+                        job.update(entry.get("job", {}))
+        return job, completed
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def clear(self):
+        self.close()
+        if self.exists():
+            os.remove(self.path)
+
+class JsonlSink:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+
+    def write(self, record):
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(json.dumps(record, default=json_default) + "\n")
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+class ResponseCache:
+    def __init__(self, path, enabled=True, ttl_days=30, max_entries=50000):
+        self.path = path
+        self.enabled = enabled
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT, created REAL, accessed REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)")
+            self.conn.commit()
+        return self.conn
+
+    def make_key(self, model, messages, params=None):
+        payload = json.dumps({"model": model, "messages": messages, "params": params or {}}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        with self.lock:
+            conn = self.connect()
+            row = conn.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl_days and now - row[1] > self.ttl_days * 86400):
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, model, response):
+        now = time.time()
+        with self.lock:
+            conn = self.connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now)
+            )
+            conn.commit()
+            self.writes += 1
+            if self.writes % 500 == 0:
+                self.evict()
+
+    def evict(self):
+        conn = self.connect()
+        if self.ttl_days:
+            conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_days * 86400,))
+        if self.max_entries:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        conn.commit()
+
+    def clear(self):
+        with self.lock:
+            conn = self.connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.evict()
+                self.conn.close()
+                self.conn = None
+
+    def stats_text(self):
+        return f"Response cache: {self.hits} hits, {self.misses} misses"
+
+WORKER_COLUMNS = [
+    "UID", "User", "Regen", "Active", "Name", "Shortname", "Gender", "Pronouns",
+    "Sexuality", "CompetesAgainst", "Outsiderel", "Birthday", "DebutDate", "DeathDate",
+    "BodyType", "WorkerHeight", "WorkerWeight", "WorkerMinWeight", "WorkerMaxWeight",
+    "Picture", "Nationality", "Race", "Based_In", "LeftBusiness", "Dead", "Retired",
+    "NonWrestler", "Celebridad", "Style", "Freelance", "Loyalty", "TrueBorn", "USA",
+    "Canada", "Mexico", "Japan", "UK", "Europe", "Oz", "India", "Speak_English",
+    "Speak_Japanese", "Speak_Spanish", "Speak_French", "Speak_Germanic", "Speak_Med",
+    "Speak_Slavic", "Speak_Hindi", "Moveset", "Position_Wrestler", "Position_Occasional",
+    "Position_Referee", "Position_Announcer", "Position_Colour", "Position_Manager",
+    "Position_Personality", "Position_Roadagent", "Mask", "Age_Matures", "Age_Declines",
+    "Age_TalkDeclines", "Age_Retires", "OrganicBio", "PlasterCaster_Face",
+    "PlasterCaster_FaceBasis", "PlasterCaster_Heel", "PlasterCaster_HeelBasis",
+    "CareerGoal"
+]
+
+WORKER_BOOL_COLUMNS = {
+    "User", "Active", "LeftBusiness", "Dead", "Retired", "NonWrestler", "Freelance", "TrueBorn",
+    "USA", "Canada", "Mexico", "Japan", "UK", "Europe", "Oz", "India", "Position_Wrestler",
+    "Position_Occasional", "Position_Referee", "Position_Announcer", "Position_Colour",
+    "Position_Manager", "Position_Personality", "Position_Roadagent", "OrganicBio"
+}
+
+WORKER_TEXT_LIMITS = {"Name": 30, "Shortname": 20, "Picture": 35, "PlasterCaster_Face": 30, "PlasterCaster_Heel": 30}
+
+SKILL_COLUMNS = [
+    "WorkerUID", "Brawl", "Air", "Technical", "Power", "Athletic", "Stamina",
+    "Psych", "Basics", "Tough", "Sell", "Charisma", "Mic", "Menace", "Respect",
+    "Reputation", "Safety", "Looks", "Star", "Consistency", "Act", "Injury",
+    "Puroresu", "Flash", "Hardcore", "Announcing", "Colour", "Refereeing",
+    "Experience", "PotentialPrimary", "PotentialMental", "PotentialPerformance",
+    "PotentialFundamental", "PotentialPhysical", "PotentialAnnouncing",
+    "PotentialColour", "PotentialRefereeing", "ScoutRing", "ScoutPhysical",
+    "ScoutEnt", "ScoutBroadcast", "ScoutRef"
+]
+
+CONTRACT_COLUMNS = [
+    "UID", "FedUID", "WorkerUID", "Name", "Shortname", "Picture",
+    "CompetesIn", "Face", "Division", "Manager", "Moveset", "WrittenContract",
+    "ExclusiveContract", "TouringContract", "PaidMonthly", "OnLoan", "Developmental",
+    "PrimaryUsage", "SecondaryUsage", "ExpectedShows", "BonusAmount", "BonusType",
+    "Creative", "HiringVeto", "WageMatch", "IronClad", "ContractBeganDate", "Daysleft",
+    "Dateslength", "DatesLeft", "ContractDebutDate", "Amount", "Downside", "Brand",
+    "Mask", "ContractMomentum", "Last_Turn", "Travel", "Position_Wrestler",
+    "Position_Occasional", "Position_Referee", "Position_Announcer", "Position_Colour",
+    "Position_Manager", "Position_Personality", "Position_Roadagent", "Merch",
+    "PlasterCaster_Gimmick", "PlasterCaster_Rating", "PlasterCaster_Lifespan"
+] + [f"PlasterCaster_Byte{i}" for i in range(1, 7)] + [f"PlasterCaster_Bool{i}" for i in range(1, 26)]
+
+MOVE_COLUMNS = [
+    "UID", "MoveName", "MoveDesc", "MoveType", "MoveBlood", "MoveChair", "MoveTable",
+    "MoveDive", "MoveInside", "MoveOutside", "VictimGender", "WeightDifference", "VictimMaxWeight"
+]
+
+ARSENAL_COLUMNS = ["UID", "MoveSetUID", "Move", "MoveLevel"]
+
+FINISHER_LEVELS = [("Finisher", 1), ("SecondaryFinisher", 2), ("UberFinisher", 3)]
+
+OVER_COLUMNS = ["WorkerUID"] + [f"Over{i}" for i in range(1, 58)]
+
+COMPANY_COLUMNS = [
+    "UID", "Name", "Initials", "URL", "CompanyOpening", "CompanyClosing", "Trading", "Mediagroup",
+    "Logo", "Backdrop", "Banner", "Based_In", "Prestige", "Influence", "Money", "Size", "LimitSize",
+    "Momentum", "Announce1", "Announce2", "Announce3", "FixBelts", "CompanyNotBefore", "CompanyNotAfter",
+    "AlliancePreset", "Ace", "AceLength", "Heir", "HeirLength", "TVFirst", "TVAsc", "EventAsc",
+    "TrueBorn", "YoungLion", "HomeArena", "TippyToe", "GeogTag1", "GeogTag2", "GeogTag3", "HQ", "HOF"
+]
+
+# Parent tables come first so a sync inserts rows in the same order as a save
+TEW_TABLES = {
+    "tblFed": COMPANY_COLUMNS,
+    "tblFedBio": ["UID", "Profile"],
+    "tblFedSchedule": ["FedUID", "Strategy"],
+    "tblMoveSet": ["UID", "recordName"],
+    "tblWrestlingMove": MOVE_COLUMNS,
+    "tblMoveSetArsenal": ARSENAL_COLUMNS,
+    "tblWorker": WORKER_COLUMNS,
+    "tblWorkerBio": ["UID", "Profile"],
+    "tblWorkerSkill": SKILL_COLUMNS,
+    "tblContract": CONTRACT_COLUMNS,
+    "tblWorkerOver": OVER_COLUMNS
+}
+
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+def worker_insert_values(worker_row):
+    values = []
+    for column in WORKER_COLUMNS:
+        value = worker_row[column]
+        if isinstance(value, bool):
+            value = -1 if value else 0
+        if column in ("Birthday", "DebutDate"):
+            values.append(value)
+        elif column == "DeathDate":
+            values.append("1666-01-01")
+        elif column in WORKER_BOOL_COLUMNS:
+            values.append(bool(value))
+        elif column in WORKER_TEXT_LIMITS:
+            values.append(str(value)[:WORKER_TEXT_LIMITS[column]])
+        else:
+            values.append(int(value))
+    return values
+
+class AccessDatabase:
+    def __init__(self, path, fast_executemany=False):
+        self.path = path
+        # The Access ODBC driver has patchy parameter-array support, so this is opt-in
+        self.fast_executemany = fast_executemany
+
+    def connect(self):
+        import pyodbc
+        conn_str = (
+            r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
+            f'DBQ={self.path};'
+            'PWD=20YearsOfTEW;'
+        )
+        logging.debug(f"Attempting to connect to Access database at: {self.path}")
+        return pyodbc.connect(conn_str, autocommit=False)
+
+    @contextmanager
+    def transaction(self):
+        conn = self.connect()
+        try:
+            yield conn.cursor()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def max_uid(self, cursor, table, column="UID"):
+        cursor.execute(f"SELECT MAX([{column}]) FROM {table}")
+        result = cursor.fetchone()
+        return result[0] if result and result[0] else 0
+
+    def insert_many(self, cursor, table, columns, rows):
+        rows = [list(row) for row in rows]
+        if not rows:
+            return
+        column_list = ", ".join(f"[{column}]" for column in columns)
+        placeholders = ", ".join(["?"] * len(columns))
+        cursor.fast_executemany = self.fast_executemany
+        cursor.executemany(f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", rows)
+
+class SqliteDatabase(AccessDatabase):
+    def __init__(self, path):
+        super().__init__(path)
+        self.schema_ready = False
+
+    def connect(self):
+        conn = sqlite3.connect(self.path)
+        if not self.schema_ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for table, columns in TEW_TABLES.items():
+                key = columns[0]
+                # Tables keyed by UID get it as the rowid; the rest are keyed by a parent UID
+                definitions = [f"[{key}] INTEGER PRIMARY KEY" if key == "UID" else f"[{key}] INTEGER"]
+                definitions += [f"[{column}]" for column in columns[1:]]
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})")
+                if key != "UID":
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_{key} ON {table} ([{key}])")
+            conn.commit()
+            self.schema_ready = True
+        return conn
+
+    def insert_many(self, cursor, table, columns, rows):
+        rows = [[sqlite_value(value) for value in row] for row in rows]
+        if not rows:
+            return
+        column_list = ", ".join(f"[{column}]" for column in columns)
+        placeholders = ", ".join(["?"] * len(columns))
+        cursor.executemany(f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", rows)
+
+def sqlite_value(value):
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    return value
+
+def open_tew_database(path, fast_executemany=False):
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SqliteDatabase(path)
+    if os.path.exists(path):
+        return AccessDatabase(path, fast_executemany=fast_executemany)
+    return None
+
+def sync_tew_tables(source, target):
+    copied = {}
+    with source.transaction() as source_cursor, target.transaction() as target_cursor:
+        for table, columns in TEW_TABLES.items():
+            key = columns[0]
+            target_cursor.execute(f"SELECT [{key}] FROM {table}")
+            existing = {row[0] for row in target_cursor.fetchall()}
+            column_list = ", ".join(f"[{column}]" for column in columns)
+            source_cursor.execute(f"SELECT {column_list} FROM {table}")
+            rows = [row for row in source_cursor.fetchall() if row[0] not in existing]
+            target.insert_many(target_cursor, table, columns, rows)
+            copied[table] = len(rows)
+    return copied
+
+class UidAllocator:
+    def __init__(self, database=None, default_uid=1):
+        self.database = database
+        self.default_uid = default_uid
+        self.next_uids = {}
+        self.lock = threading.Lock()
+
+    def load(self, floors):
+        with self.lock:
+            missing = {table: floor for table, floor in floors.items() if table not in self.next_uids}
+            if not missing:
+                return
+            if self.database:
+                with self.database.transaction() as cursor:
+                    for table, floor in missing.items():
+                        self.next_uids[table] = max(self.database.max_uid(cursor, table) + 1, floor)
+            else:
+                for table in missing:
+                    self.next_uids[table] = self.default_uid
+
+    def seed(self, table, next_uid):
+        with self.lock:
+            self.next_uids[table] = next_uid
+
+    def reserve(self, table, count=1):
+        if table not in self.next_uids:
+            self.load({table: 1})
+        with self.lock:
+            first_uid = self.next_uids[table]
+            self.next_uids[table] = first_uid + count
+            return first_uid
+
+class CompanyDirectory:
+    def __init__(self, companies):
+        self.companies = companies
+        self.uid_by_name = {}
+        for company_uid, company_name in companies:
+            self.uid_by_name.setdefault(company_name, company_uid)
+
+    def names(self):
+        return [company[1] for company in self.companies]
+
+    def uid_for(self, name):
+        return self.uid_by_name.get(name)
+
+    def random_uid(self):
+        return random.choice(self.companies)[0]
+
+class WorkerStore:
+    def __init__(self, path, legacy_excel_path=None):
+        self.path = path
+        self.legacy_excel_path = legacy_excel_path
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS sheet_rows ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, sheet TEXT NOT NULL, uid INTEGER, data TEXT NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS sheet_rows_sheet ON sheet_rows (sheet, id)")
+            self.conn.commit()
+            if self.legacy_excel_path and os.path.exists(self.legacy_excel_path) and self.count() == 0:
+                self.import_excel(self.legacy_excel_path)
+        return self.conn
+
+    def count(self, sheet="Workers"):
+        return self.connect().execute("SELECT COUNT(*) FROM sheet_rows WHERE sheet = ?", (sheet,)).fetchone()[0]
+
+    def append(self, sheets):
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                self.insert_rows(conn, sheets)
+
+    def insert_rows(self, conn, sheets):
+        for sheet, rows in sheets.items():
+            conn.executemany(
+                "INSERT INTO sheet_rows (sheet, uid, data) VALUES (?, ?, ?)",
+                [(sheet, row.get("UID", row.get("WorkerUID")), json.dumps(row, default=json_default)) for row in rows]
+            )
+
+    def rows(self, sheet):
+        with self.lock:
+            cursor = self.connect().execute("SELECT data FROM sheet_rows WHERE sheet = ? ORDER BY id", (sheet,))
+            return [json.loads(data, object_hook=json_object_hook) for (data,) in cursor]
+
+    def frame(self, sheet):
+        import pandas as pd
+        df = pd.DataFrame(self.rows(sheet))
+        if sheet == "Notes" and 'physical_description' not in df.columns:
+            df['physical_description'] = ''
+        return df
+
+    def import_excel(self, excel_path):
+        import pandas as pd
+        logging.debug(f"Importing existing workers from {excel_path}")
+        sheets = {}
+        for sheet in WORKER_SHEETS:
+            df = pd.read_excel(excel_path, sheet_name=sheet)
+            df = df.astype(object).where(df.notna(), None)
+            rows = df.to_dict("records")
+            for row in rows:
+                for key, value in row.items():
+                    # Excel hands 1900-01-01 back as a bare midnight time
+                    if isinstance(value, datetime.time):
+                        row[key] = datetime.datetime.combine(datetime.date(1900, 1, 1), value)
+            sheets[sheet] = rows
+        with self.conn:
+            self.insert_rows(self.conn, sheets)
+
+    def export_excel(self, excel_path, generated_pictures=()):
+        import pandas as pd
+        with pd.ExcelWriter(excel_path) as writer:
+            for sheet in WORKER_SHEETS:
+                df = self.frame(sheet)
+                if sheet == "Notes" and not df.empty:
+                    df.loc[df['Picture'].isin(generated_pictures), 'image_generated'] = True
+                df.to_excel(writer, sheet_name=sheet, index=False)
+
+class ImageStatusStore:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS image_status ("
+                "kind TEXT NOT NULL, name TEXT NOT NULL, generated_at TEXT NOT NULL, "
+                "PRIMARY KEY (kind, name)) WITHOUT ROWID"
+            )
+            self.conn.commit()
+        return self.conn
+
+    def done(self, kind):
+        with self.lock:
+            cursor = self.connect().execute("SELECT name FROM image_status WHERE kind = ?", (kind,))
+            return {name for (name,) in cursor}
+
+    def mark(self, kind, name):
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO image_status (kind, name, generated_at) VALUES (?, ?, ?)",
+                    (kind, name, datetime.datetime.now().isoformat())
+                )
+
+def resize_image(image, size):
+    from PIL import Image
+    factor = min(image.width // size[0], image.height // size[1])
+    if factor >= 2:
+        image = image.reduce(factor)
+    image = image.resize(size, Image.Resampling.LANCZOS)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    image.save(output, format='JPEG')
+    return output.getvalue()
+
+def derive_images(image_data, sizes):
+    from PIL import Image
+    image = Image.open(io.BytesIO(image_data))
+    # JPEG sources can decode straight at a reduced scale
+    image.draft("RGB", (max(size[0] for size, crop in sizes), max(size[1] for size, crop in sizes)))
+    image.load()
+    return [resize_image(crop_image(image, crop), size) for size, crop in sizes]
+
+def crop_image(image, crop):
+    from PIL import Image, ImageFilter
+    width, height = image.size
+    if crop in ("square", "logo"):
+        side = min(width, height)
+        if crop == "logo":
+            # The master prompt puts the logo in the middle of the artwork
+            side = max(1, round(side * LOGO_CROP_FRACTION))
+        left = (width - side) // 2
+        top = (height - side) // 2
+        return image.crop((left, top, left + side, top + side))
+    if crop == "banner":
+        band_height = max(1, min(height, round(width / BANNER_ASPECT)))
+        # Squash the edge map to one column so each pixel holds that row's detail,
+        # then slide a band-sized window over it to find the busiest strip
+        edges = image.convert("L").filter(ImageFilter.FIND_EDGES).resize((1, height), Image.Resampling.BOX)
+        row_detail = edges.tobytes()
+        window = sum(row_detail[:band_height])
+        best_top, best_window = 0, window
+        for top in range(1, height - band_height + 1):
+            window += row_detail[top + band_height - 1] - row_detail[top - 1]
+            if window > best_window:
+                best_top, best_window = top, window
+        return image.crop((0, best_top, width, best_top + band_height))
+    return image
+
+def image_target(kind, name, size, path, crop=None):
+    return {"kind": kind, "name": name, "size": size, "path": path, "crop": crop}
+
+class RateLimiter:
+    def __init__(self, requests_per_minute, kind="requests"):
+        self.kind = kind
+        self.capacity = max(1, requests_per_minute)
+        self.tokens = float(self.capacity)
+        self.fill_rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+        self.updated = now
+
+    def acquire(self, amount=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.refill(now)
+                needed = min(amount, self.capacity)
+                if now >= self.paused_until and self.tokens >= needed:
+                    self.tokens -= needed
+                    return
+                delay = max(self.paused_until - now, (needed - self.tokens) / self.fill_rate)
+            time.sleep(min(delay, 1.0))
+
+    def update_from_headers(self, headers):
+        limit = headers.get(f"x-ratelimit-limit-{self.kind}")
+        remaining = headers.get(f"x-ratelimit-remaining-{self.kind}")
+        reset = parse_reset_seconds(headers.get(f"x-ratelimit-reset-{self.kind}"))
+        with self.lock:
+            self.refill(time.monotonic())
+            if limit and limit.isdigit():
+                self.capacity = max(1, int(limit))
+                self.fill_rate = self.capacity / 60.0
+            if remaining and remaining.isdigit():
+                self.tokens = min(self.tokens, float(remaining))
+                if int(remaining) == 0 and reset:
+                    self.paused_until = time.monotonic() + reset
+
+def parse_reset_seconds(value):
+    # The API reports resets as durations like "1s", "6m0s" or "20ms"
+    if not value:
+        return None
+    total = 0.0
+    for amount, unit in re.findall(r"([\d.]+)(ms|h|m|s)", value):
+        total += float(amount) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return total
+
+def is_retryable_error(error):
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+def retry_delay(attempt, headers=None):
+    if headers:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms and retry_after_ms.isdigit():
+            return int(retry_after_ms) / 1000
+        retry_after = headers.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+    # Half of the backoff is random so parallel workers do not retry in lockstep
+    backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return backoff / 2 + random.uniform(0, backoff / 2)
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+class RunMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.labels = {}
+
+    def entry(self, label):
+        if label not in self.labels:
+            self.labels[label] = {
+                "calls": 0, "cache_hits": 0, "retries": 0, "failures": 0,
+                "prompt_tokens": 0, "completion_tokens": 0, "latencies": []
+            }
+        return self.labels[label]
+
+    def record_call(self, label, seconds, usage=None):
+        with self.lock:
+            entry = self.entry(label)
+            entry["calls"] += 1
+            entry["latencies"].append(seconds)
+            if usage is not None:
+                entry["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+                entry["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+    def record(self, label, key):
+        with self.lock:
+            self.entry(label)[key] += 1
+
+    def summary(self):
+        with self.lock:
+            labels = {}
+            for label, entry in sorted(self.labels.items()):
+                labels[label] = {
+                    "calls": entry["calls"],
+                    "cache_hits": entry["cache_hits"],
+                    "retries": entry["retries"],
+                    "failures": entry["failures"],
+                    "prompt_tokens": entry["prompt_tokens"],
+                    "completion_tokens": entry["completion_tokens"],
+                    "p50_seconds": round(percentile(entry["latencies"], 0.5), 3),
+                    "p95_seconds": round(percentile(entry["latencies"], 0.95), 3),
+                    "total_seconds": round(sum(entry["latencies"]), 3)
+                }
+            return labels
+
+    def report_text(self, summary):
+        header = f"{'Prompt':<24}{'Calls':>7}{'Cached':>8}{'Retries':>9}{'Failed':>8}{'p50 s':>8}{'p95 s':>8}{'Total s':>10}{'Tokens in':>11}{'Tokens out':>12}"
+        lines = [header, "-" * len(header)]
+        for label, entry in sorted(summary.items(), key=lambda item: -item[1]["total_seconds"]):
+            lines.append(
+                f"{label:<24}{entry['calls']:>7}{entry['cache_hits']:>8}{entry['retries']:>9}{entry['failures']:>8}"
+                f"{entry['p50_seconds']:>8.2f}{entry['p95_seconds']:>8.2f}{entry['total_seconds']:>10.1f}"
+                f"{entry['prompt_tokens']:>11}{entry['completion_tokens']:>12}"
+            )
+        return "\n".join(lines)
+
+class FakeModelError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"Fake backend returned HTTP {status_code}")
+        self.status_code = status_code
+        self.response = None
+
+class FakeRawResponse:
+    def __init__(self, response):
+        self.response = response
+        self.headers = {
+            "x-ratelimit-limit-requests": "100000",
+            "x-ratelimit-remaining-requests": "100000",
+            "x-ratelimit-limit-tokens": "100000000",
+            "x-ratelimit-remaining-tokens": "100000000"
+        }
+
+    def parse(self):
+        return self.response
+
+class FakeModelClient:
+    def __init__(self, latency_ms=100, latency_sigma=0.5, failure_rate=0.0, seed=0):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.image_data = None
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(
+            with_raw_response=types.SimpleNamespace(create=self.create_chat_completion)
+        ))
+        self.images = types.SimpleNamespace(with_raw_response=types.SimpleNamespace(generate=self.generate_image))
+
+    def simulate_call(self):
+        with self.lock:
+            # Latencies are log-normal around the configured median, like real API calls
+            delay = self.random.lognormvariate(math.log(max(self.latency_ms, 1) / 1000), self.latency_sigma) if self.latency_ms else 0
+            failed = self.random.random() < self.failure_rate
+            status = self.random.choice([429, 500, 503])
+        time.sleep(delay)
+        if failed:
+            raise FakeModelError(status)
+
+    def pick(self, options):
+        with self.lock:
+            return self.random.choice(options)
+
+    def create_chat_completion(self, model, messages, **kwargs):
+        self.simulate_call()
+        prompt = messages[-1]["content"]
+        content = self.chat_content(prompt)
+        usage = types.SimpleNamespace(prompt_tokens=len(prompt) // 4, completion_tokens=max(1, len(content) // 4))
+        message = types.SimpleNamespace(content=content)
+        return FakeRawResponse(types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)], usage=usage))
+
+    def chat_content(self, prompt):
+        lowered = prompt.lower()
+        if "json schema:" in lowered:
+            schema = json.loads(prompt.split("JSON schema:\n", 1)[1])
+            presets = schema["properties"]["SkillPreset"]["enum"]
+            return json.dumps({
+                "Age": self.pick(range(18, 45)),
+                "Style": self.pick(range(1, 18)),
+                "Race": self.pick(range(1, 10)),
+                "Alignment": self.pick(["face", "heel"]),
+                "FaceGimmick": "Fighting Champion",
+                "HeelGimmick": "Arrogant Bully",
+                "SkillPreset": self.pick(presets) if presets else "",
+                "Roles": {role: role == "Wrestler" for role in ROLE_KEYS},
+                "Languages": DEFAULT_ROLES_LANG_BODY["Languages"],
+                "BodyType": self.pick(range(1, 8)),
+                "Finishers": DEFAULT_FINISHERS,
+                "RegionPopularity": {region: self.pick(POPULARITY_CATEGORIES) for region in POPULARITY_REGIONS},
+                "PhysicalDescription": "A tall, muscular wrestler with a shaved head."
+            })
+        if "boolean values for" in lowered:
+            data = copy.deepcopy(DEFAULT_ROLES_LANG_BODY)
+            data["BodyType"] = self.pick(range(1, 8))
+            return json.dumps(data)
+        if "finishing moves" in lowered:
+            return json.dumps(DEFAULT_FINISHERS)
+        if "popularity categories" in lowered:
+            return json.dumps({region: self.pick(POPULARITY_CATEGORIES) for region in POPULARITY_REGIONS})
+        if "respond with just a number" in lowered:
+            return str(self.pick(range(18, 45)))
+        if "only the number (1-17)" in lowered:
+            return str(self.pick(range(1, 18)))
+        if "race from this list" in lowered:
+            return str(self.pick(range(1, 10)))
+        if "face or heel" in lowered:
+            return self.pick(["face", "heel"])
+        if "available skill presets:" in lowered:
+            presets = prompt.split("Available Skill Presets: ", 1)[1].split("\n", 1)[0].split(", ")
+            return self.pick(presets)
+        if "name and description" in lowered:
+            return f"Fake Name {self.pick(range(100000))}\nA hard-hitting veteran of the independent circuit."
+        if "generate a name for" in lowered:
+            return f"Fake Name {self.pick(range(100000))}"
+        if "generate a description for" in lowered:
+            if "wrestling company" in lowered:
+                return "A hard-hitting promotion built on the independent circuit."
+            return "A hard-hitting veteran of the independent circuit."
+        return "A hard-hitting veteran of the independent circuit."
+
+    def generate_image(self, **kwargs):
+        from PIL import Image
+        self.simulate_call()
+        with self.lock:
+            if self.image_data is None:
+                output = io.BytesIO()
+                Image.new("RGB", (256, 256), (90, 30, 30)).save(output, format="PNG")
+                self.image_data = base64.b64encode(output.getvalue()).decode("ascii")
+        return FakeRawResponse(types.SimpleNamespace(data=[types.SimpleNamespace(b64_json=self.image_data, url=None)], usage=None))
+
+class JobCancelled(Exception):
+    pass
+
+class TaskGraph:
+    def __init__(self, executor):
+        self.executor = executor
+        self.tasks = {}
+
+    def add(self, name, func, deps=()):
+        self.tasks[name] = (func, tuple(deps))
+
+    def run(self):
+        results = {}
+        running = {}
+        waiting = dict(self.tasks)
+        while waiting or running:
+            for name, (func, deps) in list(waiting.items()):
+                if all(dep in results for dep in deps):
+                    future = self.executor.submit(func, *[results[dep] for dep in deps])
+                    running[future] = name
+                    del waiting[name]
+            if not running:
+                raise ValueError(f"Unresolvable task dependencies: {', '.join(waiting)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+        return results
+
+class WrestleverseCore:
+    def __init__(self):
         self.api_key = ""
         self.uid_start = 1
         self.bio_prompt = "Create a biography for a professional wrestler."
@@ -33,249 +1028,107 @@ class WrestleverseApp:
         self.pictures_path = ""
         self.start_date_str = ""
         self.start_date = datetime.datetime(2020,1,1)
+        self.concurrency = 4
+        self.compact_mode = False
+        self.cache_enabled = True
+        self.cache_ttl_days = 30
+        self.cache_max_entries = 50000
+        self.fast_executemany = False
+        self.image_concurrency = 3
+        self.image_requests_per_minute = 5
+        self.image_b64 = True
+        self.image_model = "dall-e-3"
+        self.image_size = "1024x1024"
+        self.company_master_image = False
+        self.workers_jsonl_path = ""
+        self.max_retries = 5
+        self.chat_requests_per_minute = 500
+        self.chat_tokens_per_minute = 60000
+        self.retry_count = 0
+        self.fallback_count = 0
+        self.metrics = RunMetrics()
+        self.log_level = "INFO"
+        self.structured_events = False
+        self.model_backend = "openai"
+        self.fake_latency_ms = 100
+        self.fake_latency_sigma = 0.5
+        self.fake_failure_rate = 0.0
+        self.fake_seed = 0
+        self.http_session = None
+        self.http_lock = threading.Lock()
+        self.uid_allocator = UidAllocator()
+        self.job_started = 0.0
+        self.cancel_event = threading.Event()
+        self.calls_in_flight = 0
+        self.calls_lock = threading.Lock()
+        self.company_directory = None
+        self.company_directory_lock = threading.Lock()
         self.client = None
+        self.client_lock = threading.Lock()
         self.load_settings()
-        if self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
-        else:
-            self.client = None
+        logging.getLogger().setLevel(getattr(logging, str(self.log_level).upper(), logging.INFO))
+        self.worker_store = WorkerStore(WORKERS_STORE_PATH, WORKERS_EXCEL_PATH)
+        self.image_status = ImageStatusStore(IMAGE_STATUS_PATH)
+        self.image_rate_limiter = RateLimiter(self.image_requests_per_minute)
+        self.chat_request_limiter = RateLimiter(self.chat_requests_per_minute)
+        self.chat_token_limiter = RateLimiter(self.chat_tokens_per_minute, kind="tokens")
+        self.response_cache = ResponseCache(
+            "wrestleverse_cache.sqlite",
+            enabled=self.cache_enabled,
+            ttl_days=self.cache_ttl_days,
+            max_entries=self.cache_max_entries
+        )
         self.skill_presets = []
         self.load_skill_presets()
-        self.wrestlers = []
-        self.companies = []
-        self.setup_main_menu()
-
-    def add_company_form(self):
-        company_frame = ttk.Frame(self.companies_frame, relief="ridge", borderwidth=2)
-        company_frame.pack(fill="x", pady=5)
-        name_label = ttk.Label(company_frame, text="Name:")
-        name_label.grid(row=0, column=0, padx=5, pady=5)
-        name_entry = ttk.Entry(company_frame)
-        name_entry.grid(row=0, column=1, padx=5, pady=5)
-        description_label = ttk.Label(company_frame, text="Description:")
-        description_label.grid(row=1, column=0, padx=5, pady=5)
-        description_entry = ttk.Entry(company_frame, width=40)
-        description_entry.grid(row=1, column=1, columnspan=3, padx=5, pady=5)
-        size_label = ttk.Label(company_frame, text="Size:")
-        size_label.grid(row=2, column=0, padx=5, pady=5)
-        size_var = tk.StringVar(value="Medium")
-        size_dropdown = ttk.Combobox(company_frame, textvariable=size_var, values=["Tiny", "Small", "Medium", "Large"])
-        size_dropdown.grid(row=2, column=1, padx=5, pady=5)
-        remove_btn = ttk.Button(company_frame, text="❌", command=lambda: self.remove_company_form(company_frame))
-        remove_btn.grid(row=0, column=4, padx=5, pady=5)
-        self.companies.append({
-            "frame": company_frame,
-            "name": name_entry,
-            "description": description_entry,
-            "size": size_var
-        })
-
-    def remove_company_form(self, company_frame):
-        company_frame.destroy()
-        self.companies = [company for company in self.companies if company["frame"] != company_frame]
-
-    def generate_companies(self):
-        logging.debug("generate_companies function was invoked.")
-        
-        if not self.api_key:
-            messagebox.showerror("Error", "Please set your API key in settings before generating companies.")
-            logging.error("API key not set.")
-            return
 
+    def run_company_job(self, company_data_list, journal, job=None, completed=None):
+        import pandas as pd
+        completed = completed or {}
+        database = self.open_database()
         try:
-            companies_columns = [
-                "UID", "Name", "Initials", "URL", "CompanyOpening", "CompanyClosing", "Trading", "Mediagroup",
-                "Logo", "Backdrop", "Banner", "Based_In", "Prestige", "Influence", "Money", "Size", "LimitSize",
-                "Momentum", "Announce1", "Announce2", "Announce3", "FixBelts", "CompanyNotBefore", "CompanyNotAfter",
-                "AlliancePreset", "Ace", "AceLength", "Heir", "HeirLength", "TVFirst", "TVAsc", "EventAsc",
-                "TrueBorn", "YoungLion", "HomeArena", "TippyToe", "GeogTag1", "GeogTag2", "GeogTag3", "HQ", "HOF"
-            ]
+            uid_allocator = UidAllocator(database, self.uid_start)
+            if job:
+                uid = job["first_uid"]
+            else:
+                uid = uid_allocator.reserve("tblFed", len(company_data_list))
 
-            uid = self.uid_start
-            if self.access_db_path and os.path.exists(self.access_db_path):
-                conn_str = (
-                    r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
-                    f'DBQ={self.access_db_path};'
-                    'PWD=20YearsOfTEW;'
-                )
-                logging.debug(f"Attempting to connect to Access database at: {self.access_db_path}")
-                conn = pyodbc.connect(conn_str)
-                cursor = conn.cursor()
-                cursor.execute("SELECT MAX(UID) FROM tblFed")
-                result = cursor.fetchone()
-                last_uid = result[0] if result[0] else 0
-                uid = last_uid + 1
-                conn.close()
+            if not job:
+                journal.start({"kind": "companies", "first_uid": uid, "companies": company_data_list})
 
             companies_data = []
             bio_data = []
             notes_data = []
-
-            company_data_list = []
-            for company in self.companies:
-                name = company["name"].get().strip() if company["name"] else ""
-                description = company["description"].get().strip() if company["description"] else ""
-                size = company["size"].get().strip() if company["size"] else "Medium"
-                company_data_list.append({"name": name, "description": description, "size": size})
+            saved = True
 
             total_companies = len(company_data_list)
-            for index, company_data in enumerate(company_data_list, start=1):
-                self.status_label.config(text=f"Status: Generating company {index}/{total_companies}...")
-                self.root.update_idletasks()
-
-                name = company_data["name"]
-                description = company_data["description"]
-                size = company_data["size"]
-
-                if not name and not description:
-                    prompt = f"Generate a name and description for a {size.lower()} professional wrestling company."
-                    resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":prompt}]
-                    )
-                    text = resp.choices[0].message.content.strip()
-                    lines = text.split('\n')
-                    name = lines[0].strip() if lines else "Default Company"
-                    description = ' '.join(lines[1:]).strip() if len(lines)>1 else "A professional wrestling company."
-                elif not name:
-                    name_prompt = f"Generate a name for a {size.lower()} professional wrestling company with the following description: {description}"
-                    resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":name_prompt}]
-                    )
-                    name = resp.choices[0].message.content.strip()
-                elif not description:
-                    desc_prompt = f"Generate a description for a {size.lower()} professional wrestling company named {name}."
-                    resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":desc_prompt}]
-                    )
-                    description = resp.choices[0].message.content.strip()
-
-                base_name = name.replace(' ', '').replace('.', '').lower()
-                logo_name = f"{base_name[:26]}.jpg"
-                backdrop_name = f"{base_name[:24]}BD.jpg"
-                banner_name = f"{base_name[:24]}BN.jpg"
-
-                company_row = [
-                    uid,
-                    name,
-                    self.generate_company_initials(name),
-                    f"www.{name.replace(' ', '').lower()}.com"[:40],
-                    "1666-01-01",
-                    "1666-01-01",
-                    -1,
-                    0,
-                    logo_name,
-                    backdrop_name,
-                    banner_name,
-                    1,
-                    random.randint(1, 100),
-                    0,
-                    {"Tiny": 100000, "Small": 1000000, "Medium": 10000000, "Large": 100000000}.get(size, 1000000),
-                    0,
-                    10,
-                    random.randint(1, 100),
-                    0,
-                    0,
-                    0,
-                    0,
-                    "1666-01-01",
-                    "1666-01-01",
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    -1,
-                    -1,
-                    -1,
-                    -1,
-                    0,
-                    0,
-                    0,
-                    "",
-                    "",
-                    "",
-                    0,
-                    -1,
-                ]
-                companies_data.append(company_row)
-
-                bio = self.generate_company_bio(name, description, size)
-                bio_data.append([uid, bio])
-
-                notes_data.append({
-                    "Name": name,
-                    "Description": description,
-                    "Size": size,
-                    "Logo": f"{name.replace(' ', '').lower()}.jpg"[:35],
-                    "Backdrop": f"{name.replace(' ', '').lower()}BD.jpg"[:35],
-                    "Banner": f"{name.replace(' ', '').lower()}Banner.jpg"[:30],
-                    "image_generated": False
-                })
-
-                uid += 1
-
-            if self.access_db_path and os.path.exists(self.access_db_path):
+            for index, company_data in enumerate(company_data_list):
+                self.check_cancelled()
+                self.report_progress("company", index, total_companies)
+
+                record = completed.get(index)
+                if record is None:
+                    record = self.generate_company_record(company_data, uid + index)
+                    journal.append(index, record)
+                companies_data.append(record["row"])
+                bio_data.append([record["row"][0], record["bio"]])
+                notes_data.append(record["notes"])
+
+            if database:
                 logging.debug("Attempting to save to Access database.")
                 try:
-                    conn_str = (
-                        r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
-                        f'DBQ={self.access_db_path};'
-                        'PWD=20YearsOfTEW;'
-                    )
-                    for company_row in companies_data:
-                        conn = pyodbc.connect(conn_str)
-                        cursor = conn.cursor()
-                        sql_insert_company = """
-                            INSERT INTO tblFed 
-                            ([UID], [Name], [Initials], [URL], [CompanyOpening], [CompanyClosing], [Trading], [Mediagroup],
-                            [Logo], [Backdrop], [Banner], [Based_In], [Prestige], [Influence], [Money], [Size], [LimitSize],
-                            [Momentum], [Announce1], [Announce2], [Announce3], [FixBelts], [CompanyNotBefore], [CompanyNotAfter],
-                            [AlliancePreset], [Ace], [AceLength], [Heir], [HeirLength], [TVFirst], [TVAsc], [EventAsc],
-                            [TrueBorn], [YoungLion], [HomeArena], [TippyToe], [GeogTag1], [GeogTag2], [GeogTag3], [HQ], [HOF])
-                            VALUES 
-                            (?, ?, ?, ?, ?, ?, ?, ?,
-                             ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                             ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                             ?, ?, ?, ?, ?, ?,
-                             ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(sql_insert_company, company_row)
-                        sql_insert_schedule = "INSERT INTO tblFedSchedule ([FedUID], [Strategy]) VALUES (?, ?)"
-                        schedule_values = (company_row[0], '5')
-                        cursor.execute(sql_insert_schedule, schedule_values)
-                        conn.commit()
-                        conn.close()
-
-                    conn = pyodbc.connect(conn_str)
-                    cursor = conn.cursor()
-                    for bio_row in bio_data:
-                        sql_insert_bio = "INSERT INTO tblFedBio ([UID], [Profile]) VALUES (?, ?)"
-                        cursor.execute(sql_insert_bio, bio_row)
-                    conn.commit()
-                    conn.close()
+                    with database.transaction() as cursor:
+                        database.insert_many(cursor, "tblFed", COMPANY_COLUMNS, companies_data)
+                        database.insert_many(cursor, "tblFedSchedule", ["FedUID", "Strategy"], [(row[0], '5') for row in companies_data])
+                        database.insert_many(cursor, "tblFedBio", ["UID", "Profile"], bio_data)
+                    self.invalidate_company_directory()
                     logging.debug("Successfully saved to Access database.")
                 except Exception as e:
+                    saved = False
                     logging.error(f"Error saving to Access database: {e}", exc_info=True)
-                    messagebox.showerror("Error", f"Could not save to Access database: {str(e)}")
-
-            for note in notes_data:
-                try:
-                    logo_prompt = (
-                        f"For a professional wrestling company named '{note['Name']}' "
-                        f"with the following description: '{note['Description']}', "
-                        f"describe in a single sentence what their logo might look like."
-                    )
-                    logo_description = self.get_response_from_gpt(logo_prompt)
-                    note['logo_description'] = logo_description
-                except Exception as e:
-                    logging.error(f"Error generating logo description: {e}")
-                    note['logo_description'] = ""
+                    self.notify("error", "Error", f"Could not save to Access database: {str(e)}")
 
             try:
-                companies_df = pd.DataFrame(companies_data, columns=companies_columns)
+                companies_df = pd.DataFrame(companies_data, columns=COMPANY_COLUMNS)
                 bio_df = pd.DataFrame(bio_data, columns=["UID", "Bio"])
                 notes_df = pd.DataFrame(notes_data)
                 
@@ -285,17 +1138,122 @@ class WrestleverseApp:
                     bio_df.to_excel(writer, sheet_name="Bios", index=False)
                     notes_df.to_excel(writer, sheet_name="Notes", index=False)
                 
-                messagebox.showinfo("Success", f"Companies saved to {excel_path}")
+                self.notify("info", "Success", f"Companies saved to {excel_path}")
             except Exception as e:
-                logging.error(f"Error saving Excel file: {e}", exc_info=True)
-                messagebox.showerror("Error", f"Could not save Excel file: {str(e)}")
+                saved = False
+                logging.error(f"Error saving workers: {e}", exc_info=True)
+                self.notify("error", "Error", f"Could not save workers: {str(e)}")
+
+            if saved:
+                journal.clear()
+            else:
+                journal.close()
+            self.set_status("Status: Companies generated successfully!")
 
+        except JobCancelled:
+            journal.close()
+            self.set_status("Status: Cancelled. Use Resume Last Run to continue.")
         except Exception as e:
+            journal.close()
             logging.error(f"Unhandled error in generate_companies: {e}", exc_info=True)
-            messagebox.showerror("Error", f"Unhandled error: {e}")
+            self.set_status(f"Status: Error - {str(e)}")
+            self.notify("error", "Error", f"Unhandled error: {e}")
         finally:
-            self.status_label.config(text="Status: Companies generated successfully!")
-            self.root.update_idletasks()
+            logging.info(self.response_cache.stats_text())
+
+    def generate_company_record(self, company_data, uid):
+        started = time.perf_counter()
+        name = company_data["name"]
+        description = company_data["description"]
+        size = company_data["size"]
+
+        if not name and not description:
+            prompt = f"Generate a name and description for a {size.lower()} professional wrestling company."
+            text = self.chat_completion(prompt, "company_identity", use_cache=False)
+            lines = text.split('\n')
+            name = lines[0].strip() if lines else "Default Company"
+            description = ' '.join(lines[1:]).strip() if len(lines)>1 else "A professional wrestling company."
+        elif not name:
+            name_prompt = f"Generate a name for a {size.lower()} professional wrestling company with the following description: {description}"
+            name = self.chat_completion(name_prompt, "company_identity", use_cache=False)
+        elif not description:
+            desc_prompt = f"Generate a description for a {size.lower()} professional wrestling company named {name}."
+            description = self.chat_completion(desc_prompt, "company_identity", use_cache=False)
+
+        base_name = name.replace(' ', '').replace('.', '').lower()
+        logo_name = f"{base_name[:26]}.jpg"
+        backdrop_name = f"{base_name[:24]}BD.jpg"
+        banner_name = f"{base_name[:24]}BN.jpg"
+
+        company_row = [
+            uid,
+            name,
+            self.generate_company_initials(name),
+            f"www.{name.replace(' ', '').lower()}.com"[:40],
+            "1666-01-01",
+            "1666-01-01",
+            -1,
+            0,
+            logo_name,
+            backdrop_name,
+            banner_name,
+            1,
+            random.randint(1, 100),
+            0,
+            {"Tiny": 100000, "Small": 1000000, "Medium": 10000000, "Large": 100000000}.get(size, 1000000),
+            0,
+            10,
+            random.randint(1, 100),
+            0,
+            0,
+            0,
+            0,
+            "1666-01-01",
+            "1666-01-01",
+            0,
+            0,
+            0,
+            0,
+            0,
+            -1,
+            -1,
+            -1,
+            -1,
+            0,
+            0,
+            0,
+            "",
+            "",
+            "",
+            0,
+            -1,
+        ]
+
+        bio = self.generate_company_bio(name, description, size)
+
+        notes = {
+            "Name": name,
+            "Description": description,
+            "Size": size,
+            "Logo": f"{name.replace(' ', '').lower()}.jpg"[:35],
+            "Backdrop": f"{name.replace(' ', '').lower()}BD.jpg"[:35],
+            "Banner": f"{name.replace(' ', '').lower()}Banner.jpg"[:30],
+            "image_generated": False
+        }
+
+        try:
+            logo_prompt = (
+                f"For a professional wrestling company named '{name}' "
+                f"with the following description: '{description}', "
+                f"describe in a single sentence what their logo might look like."
+            )
+            notes['logo_description'] = self.get_response_from_gpt(logo_prompt, "logo_description")
+        except Exception as e:
+            logging.error(f"Error generating logo description: {e}")
+            notes['logo_description'] = ""
+
+        self.log_event("company_generated", uid=uid, name=name, seconds=round(time.perf_counter() - started, 3))
+        return {"row": company_row, "bio": bio, "notes": notes}
 
     def generate_company_name(self, description=None, size=None):
         prompt = "Generate a name for a professional wrestling company."
@@ -303,13 +1261,7 @@ class WrestleverseApp:
             prompt += f" The company's style or theme is: {description}."
         if size:
             prompt += f" The company is of {size.lower()} size."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return self.chat_completion(prompt, "company_name")
 
     def generate_company_initials(self, name):
         initials = ''.join([word[0] for word in name.split() if word[0].isalpha()])
@@ -323,13 +1275,7 @@ class WrestleverseApp:
             prompt += f" The company's name is {name}."
         if size:
             prompt += f" The company is of {size.lower()} size."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return self.chat_completion(prompt, "company_description")
 
     def generate_company_bio(self, name, description, size):
         prompt = f"Create a detailed profile for a professional wrestling company named {name}."
@@ -337,929 +1283,846 @@ class WrestleverseApp:
             prompt += f" Description: {description}."
         if size:
             prompt += f" The company is considered {size.lower()} in size."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
+        return self.chat_completion(prompt, "company_bio")
+
+    def get_client(self):
+        with self.client_lock:
+            if self.client is None and self.model_backend == "fake":
+                self.client = FakeModelClient(self.fake_latency_ms, self.fake_latency_sigma, self.fake_failure_rate, self.fake_seed)
+            elif self.client is None:
+                # Importing openai costs a noticeable slice of startup, so wait until the first call
+                from openai import OpenAI
+                # Retries are handled by call_with_retries so they can follow the rate limit headers
+                self.client = OpenAI(api_key=self.api_key, max_retries=0)
+            return self.client
+
+    def run_job(self, func, args):
+        self.cancel_event.clear()
+        self.job_started = time.monotonic()
+        self.retry_count = 0
+        self.fallback_count = 0
+        self.metrics = RunMetrics()
+        try:
+            func(*args)
+        except JobCancelled:
+            self.set_status("Status: Cancelled.")
+        except Exception as e:
+            logging.error(f"Unhandled error in background job: {e}", exc_info=True)
+            self.notify("error", "Error", str(e))
+        logging.info(f"Model calls retried {self.retry_count} times, {self.fallback_count} answers fell back to defaults")
+        self.log_event(
+            "job_finished", job=func.__name__, seconds=round(time.monotonic() - self.job_started, 3),
+            retries=self.retry_count, fallbacks=self.fallback_count
         )
-        return response.choices[0].message.content.strip()
+        self.write_metrics_report()
+        if self.fallback_count:
+            self.notify(
+                "info", "Defaults Used",
+                f"{self.fallback_count} answers fell back to defaults after failed calls "
+                f"({self.retry_count} retries). See log.txt for details."
+            )
 
-    def setup_main_menu(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        title_label = ttk.Label(self.root, text="Wrestleverse", font=("Helvetica", 20))
-        title_label.pack(pady=20)
-        generate_wrestlers_btn = ttk.Button(self.root, text="Generate Wrestlers", command=self.open_wrestler_generator)
-        generate_wrestlers_btn.pack(pady=10)
-        generate_company_btn = ttk.Button(self.root, text="Generate Company", command=self.open_company_generator)
-        generate_company_btn.pack(pady=10)
-        skill_presets_btn = ttk.Button(self.root, text="Skill Presets", command=self.open_skill_presets)
-        skill_presets_btn.pack(pady=10)
-        generate_images_btn = ttk.Button(self.root, text="Generate Images", command=self.open_image_generator)
-        generate_images_btn.pack(pady=10)
-        settings_btn = ttk.Button(self.root, text="⚙ Settings", command=self.open_settings)
-        settings_btn.pack(side="bottom", pady=10)
+    def write_metrics_report(self):
+        summary = self.metrics.summary()
+        if not summary:
+            return
+        report = {
+            "finished_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "elapsed_seconds": round(time.monotonic() - self.job_started, 3),
+            "retries": self.retry_count,
+            "fallbacks": self.fallback_count,
+            "labels": summary
+        }
+        try:
+            with open(METRICS_PATH, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            logging.error(f"Could not write {METRICS_PATH}: {e}")
+        self.show_metrics(self.metrics.report_text(summary))
 
-    def open_company_generator(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        title_label = ttk.Label(self.root, text="Company Generator", font=("Helvetica", 16))
-        title_label.pack(pady=10)
-        add_company_btn = ttk.Button(self.root, text="Add Company", command=self.add_company_form)
-        add_company_btn.pack(pady=10)
-        self.companies_frame = ttk.Frame(self.root)
-        self.companies_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        self.status_label = ttk.Label(self.root, text="Status: Waiting to generate companies...")
-        self.status_label.pack(pady=10)
-        generate_btn = ttk.Button(self.root, text="Generate Companies", command=self.generate_companies)
-        generate_btn.pack(side="bottom", pady=10)
-        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
-        back_btn.pack(side="bottom", pady=10)
+    def show_metrics(self, text):
+        logging.info(f"Model call summary:\n{text}")
 
-    def open_wrestler_generator(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        title_label = ttk.Label(self.root, text="Wrestler Generator", font=("Helvetica", 16))
-        title_label.pack(pady=10)
-        add_wrestler_btn = ttk.Button(self.root, text="Add Wrestler", command=self.add_wrestler_form)
-        add_wrestler_btn.pack(pady=10)
-        self.wrestlers_frame = ttk.Frame(self.root)
-        self.wrestlers_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        self.status_label = ttk.Label(self.root, text="Status: Waiting to generate wrestlers...")
-        self.status_label.pack(pady=10)
-        generate_btn = ttk.Button(self.root, text="Generate Wrestlers", command=self.generate_wrestlers)
-        generate_btn.pack(side="bottom", pady=10)
-        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
-        back_btn.pack(side="bottom", pady=10)
+    def log_event(self, event, **fields):
+        if self.structured_events:
+            EVENT_LOGGER.info(event, extra={"fields": fields})
 
-    def add_wrestler_form(self):
-        wrestler_frame = ttk.Frame(self.wrestlers_frame, relief="ridge", borderwidth=2)
-        wrestler_frame.pack(fill="x", pady=5)
-        name_label = ttk.Label(wrestler_frame, text="Name:")
-        name_label.grid(row=0, column=0, padx=5, pady=5)
-        name_entry = ttk.Entry(wrestler_frame)
-        name_entry.grid(row=0, column=1, padx=5, pady=5)
-        gender_label = ttk.Label(wrestler_frame, text="Gender:")
-        gender_label.grid(row=0, column=2, padx=5, pady=5)
-        gender_var = tk.StringVar(value="Male")
-        gender_dropdown = ttk.Combobox(wrestler_frame, textvariable=gender_var, values=["Male", "Female"])
-        gender_dropdown.grid(row=0, column=3, padx=5, pady=5)
-        company_label = ttk.Label(wrestler_frame, text="Company:")
-        company_label.grid(row=1, column=0, padx=5, pady=5)
-        
-        companies = self.get_companies()
-        company_names = ["Random"] + [company[1] for company in companies]
-        
-        company_var = tk.StringVar(value="Random")
-        company_dropdown = ttk.Combobox(wrestler_frame, textvariable=company_var, values=company_names)
-        company_dropdown.grid(row=1, column=1, padx=5, pady=5)
-        exclusive_label = ttk.Label(wrestler_frame, text="Exclusive:")
-        exclusive_label.grid(row=1, column=2, padx=5, pady=5)
-        exclusive_var = tk.StringVar(value="Random")
-        exclusive_dropdown = ttk.Combobox(wrestler_frame, textvariable=exclusive_var, values=["Random", "Yes", "No"])
-        exclusive_dropdown.grid(row=1, column=3, padx=5, pady=5)
-        description_label = ttk.Label(wrestler_frame, text="Description:")
-        description_label.grid(row=2, column=0, padx=5, pady=5)
-        description_entry = ttk.Entry(wrestler_frame, width=40)
-        description_entry.grid(row=2, column=1, columnspan=3, padx=5, pady=5)
-        skill_preset_label = ttk.Label(wrestler_frame, text="Skill Preset:")
-        skill_preset_label.grid(row=3, column=0, padx=5, pady=5)
-        skill_preset_var = tk.StringVar(value="Interpret")
-        skill_preset_names = ["Interpret"] + [preset["name"] for preset in self.skill_presets]
-        skill_preset_dropdown = ttk.Combobox(wrestler_frame, textvariable=skill_preset_var, values=skill_preset_names)
-        skill_preset_dropdown.grid(row=3, column=1, padx=5, pady=5)
-        remove_btn = ttk.Button(wrestler_frame, text="❌", command=lambda: self.remove_wrestler_form(wrestler_frame))
-        remove_btn.grid(row=0, column=4, padx=5, pady=5)
-        self.wrestlers.append({
-            "frame": wrestler_frame,
-            "name": name_entry,
-            "gender": gender_var,
-            "company": company_var,
-            "exclusive": exclusive_var,
-            "description": description_entry,
-            "skill_preset": skill_preset_var
-        })
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
 
-    def remove_wrestler_form(self, wrestler_frame):
-        wrestler_frame.destroy()
-        self.wrestlers = [wrestler for wrestler in self.wrestlers if wrestler["frame"] != wrestler_frame]
+    def set_status(self, text):
+        logging.info(text)
 
-    def generate_wrestlers(self):
-        if not self.api_key:
-            messagebox.showerror("Error", "Please set your API key in settings before generating wrestlers.")
-            return
+    def notify(self, kind, title, message):
+        if kind == "error":
+            logging.error(f"{title}: {message}")
+        else:
+            logging.info(f"{title}: {message}")
+
+    def report_progress(self, noun, done, total, resumed=0):
+        elapsed_minutes = max(time.monotonic() - self.job_started, 1e-6) / 60
+        self.set_status(
+            f"Status: Generating {noun} {done}/{total} "
+            f"({(done - resumed) / elapsed_minutes:.1f}/min, {self.calls_in_flight} calls in flight"
+            f"{f', {self.retry_count} retries' if self.retry_count else ''}"
+            f"{f', {self.fallback_count} defaults' if self.fallback_count else ''})"
+        )
 
+    def track_call(self, delta):
+        with self.calls_lock:
+            self.calls_in_flight += delta
+
+    def record_retry(self, label, error, delay):
+        self.metrics.record(label, "retries")
+        with self.calls_lock:
+            self.retry_count += 1
+        logging.warning(f"Retrying {label} call in {delay:.1f}s after error: {error}")
+
+    def record_fallback(self, label, error):
+        if isinstance(error, JobCancelled):
+            raise error
+        with self.calls_lock:
+            self.fallback_count += 1
+        logging.warning(f"Using default {label} after error: {error}")
+
+    def call_with_retries(self, label, request, limits):
+        attempt = 0
+        while True:
+            for limiter, amount in limits:
+                limiter.acquire(amount)
+            self.check_cancelled()
+            self.track_call(1)
+            started = time.perf_counter()
+            try:
+                raw_response = request()
+                error = None
+            except Exception as e:
+                raw_response = None
+                error = e
+            finally:
+                self.track_call(-1)
+
+            response = raw_response if error is None else getattr(error, "response", None)
+            headers = getattr(response, "headers", None)
+            if headers:
+                for limiter, amount in limits:
+                    limiter.update_from_headers(headers)
+            if error is None:
+                parsed = raw_response.parse()
+                self.metrics.record_call(label, time.perf_counter() - started, getattr(parsed, "usage", None))
+                return parsed
+
+            attempt += 1
+            if attempt > self.max_retries or not is_retryable_error(error):
+                self.metrics.record(label, "failures")
+                raise error
+            delay = retry_delay(attempt, headers)
+            self.record_retry(label, error, delay)
+            if self.cancel_event.wait(delay):
+                raise JobCancelled()
+
+    def run_wrestler_job(self, wrestler_data_list, journal, job=None, completed=None):
+        database = self.open_database()
+        sink = JsonlSink(self.workers_jsonl_path) if self.workers_jsonl_path else None
         try:
-            workers_data = []
-            bio_data = []
-            skills_data = []
-            contract_data = []
-            notes_data = []
+            completed = completed or {}
 
+            if job:
+                self.start_date_str = job.get("start_date", self.start_date_str)
             try:
                 if self.start_date_str:
                     self.start_date = datetime.datetime.strptime(self.start_date_str, "%Y-%m-%d")
                 else:
                     self.start_date = datetime.datetime(2020,1,1)
-            except:
+            except ValueError:
                 self.start_date = datetime.datetime(2020,1,1)
 
-            uid = self.uid_start
-            contract_uid = self.uid_start
-            
-            if self.access_db_path and os.path.exists(self.access_db_path):
-                conn_str = (
-                    r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
-                    f'DBQ={self.access_db_path};'
-                    'PWD=20YearsOfTEW;'
+            self.uid_allocator = UidAllocator(database, self.uid_start)
+            if job:
+                # Contract UIDs are handed out in roster order as wrestlers finish, so skip past any already journaled
+                next_contract_uid = max(
+                    [job["contract_uid"]] +
+                    [record["contract"]["UID"] + 1 for record in completed.values() if record and record["contract"]]
                 )
-                conn = pyodbc.connect(conn_str)
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT MAX(UID) FROM tblWorker")
-                result = cursor.fetchone()
-                last_uid = result[0] if result[0] else 0
-                uid = max(last_uid + 1, self.uid_start)
-                
-                cursor.execute("SELECT MAX(UID) FROM tblContract")
-                result = cursor.fetchone()
-                last_contract_uid = result[0] if result[0] else 0
-                contract_uid = max(last_contract_uid + 1, self.uid_start)
-                conn.close()
-
-            wrestler_data_list = []
-            for wrestler in self.wrestlers:
-                try:
-                    if wrestler["frame"].winfo_exists():
-                        data = {
-                            'name': wrestler["name"].get().strip() if wrestler["name"].winfo_exists() else "",
-                            'gender': wrestler["gender"].get().strip() if hasattr(wrestler["gender"], "get") else "Male",
-                            'company': wrestler["company"].get().strip() if hasattr(wrestler["company"], "get") else "Random",
-                            'exclusive': wrestler["exclusive"].get().strip() if hasattr(wrestler["exclusive"], "get") else "Random",
-                            'description': wrestler["description"].get().strip() if wrestler["description"].winfo_exists() else "",
-                            'skill_preset': wrestler["skill_preset"].get().strip() if hasattr(wrestler["skill_preset"], "get") else "Default"
-                        }
-                        wrestler_data_list.append(data)
-                except (tk.TclError, AttributeError):
-                    continue
-
-            total_wrestlers = len(wrestler_data_list)
-            for index, wrestler_data in enumerate(wrestler_data_list, start=1):
-                self.status_label.config(text=f"Status: Generating wrestler {index}/{total_wrestlers}...")
-                self.root.update_idletasks()
-
-                name = wrestler_data['name']
-                gender = wrestler_data['gender']
-                description = wrestler_data['description']
+                self.uid_allocator.seed("tblWorker", job["first_uid"] + len(wrestler_data_list))
+                self.uid_allocator.seed("tblContract", next_contract_uid)
+            self.uid_allocator.load({
+                "tblWorker": self.uid_start,
+                "tblContract": self.uid_start,
+                "tblWorkerBio": 1,
+                "tblMoveSet": 1,
+                "tblWrestlingMove": 1,
+                "tblMoveSetArsenal": 1
+            })
+            if job:
+                uid = job["first_uid"]
+                contract_uid = job["contract_uid"]
+            else:
+                uid = self.uid_allocator.reserve("tblWorker", len(wrestler_data_list))
+                contract_uid = self.uid_allocator.next_uids["tblContract"]
+
+            if not job:
+                journal.start({
+                    "kind": "wrestlers",
+                    "first_uid": uid,
+                    "contract_uid": contract_uid,
+                    "start_date": self.start_date_str,
+                    "roster": wrestler_data_list
+                })
 
-                player_description = description if description else ""
+            batch = []
+            state = {"saved": True, "database": database, "database_failed": False, "count": 0, "next": 0}
+            # Wrestlers finish in any order; hold them back so contract UIDs and saves follow the roster
+            order = [index for index in range(len(wrestler_data_list)) if index not in completed or completed[index] is not None]
+            waiting = {}
 
-                if not name and not description:
-                    prompt = f"Generate a name and description for a professional wrestler. The wrestler's gender is {gender}."
-                    resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":prompt}]
-                    )
-                    text = resp.choices[0].message.content.strip()
-                    lines = text.split('\n')
-                    name = lines[0].strip() if lines else "Default Wrestler"
-                    description = ' '.join(lines[1:]).strip() if len(lines)>1 else "A professional wrestler."
-                elif not name:
-                    prompt = f"Generate a name for a professional wrestler. The wrestler's gender is {gender}. Description: {description}"
-                    resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":prompt}]
-                    )
-                    name = resp.choices[0].message.content.strip()
-                elif not description:
-                    prompt = f"Generate a description for a professional wrestler named {name}. The wrestler's gender is {gender}."
-                    resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":prompt}]
-                    )
-                    description = resp.choices[0].message.content.strip()
+            def flush():
+                if not batch:
+                    return
+                indexes = [index for index, record in batch]
+                saved, parts = self.flush_worker_batch(state, [record for index, record in batch])
+                self.log_event("workers_flushed", uids=[record["uid"] for index, record in batch], saved=saved)
+                job_updates = {"contract_uid": self.uid_allocator.next_uids["tblContract"]}
+                if saved:
+                    journal.mark_saved(indexes, job_updates)
+                else:
+                    state["saved"] = False
+                    if parts:
+                        journal.mark_saved(indexes, job_updates, parts)
+                state["count"] += len(batch)
+                batch.clear()
+
+            def on_record(index, record, resumed):
+                waiting[index] = (record, resumed)
+                while state["next"] < len(order) and order[state["next"]] in waiting:
+                    index = order[state["next"]]
+                    state["next"] += 1
+                    record, resumed = waiting.pop(index)
+                    if not resumed:
+                        if record["contract"]:
+                            record["contract"]["UID"] = self.uid_allocator.reserve("tblContract")
+                        journal.append(index, record)
+                        if sink:
+                            sink.write(record)
+                    batch.append((index, record))
+                    if len(batch) >= WORKER_FLUSH_SIZE:
+                        flush()
+
+            self.run_wrestler_pool(wrestler_data_list, uid, on_record, completed)
+            flush()
+
+            if state["count"]:
+                destinations = WORKERS_STORE_PATH if not sink else f"{WORKERS_STORE_PATH} and {sink.path}"
+                self.notify("info", "Success", f"Wrestlers saved to {destinations}. Use Export to Excel for a workbook.")
+
+            if state["saved"]:
+                journal.clear()
+            else:
+                journal.close()
 
-                name = name.replace('.', '').strip()
-                name = name[:30]
+            logging.info(self.response_cache.stats_text())
+            self.set_status("Status: Generation complete!")
 
-                shortname = name.split()[0][:20] if name else ''
-                gender_value = 1 if gender.lower() == 'male' else 5
+        except JobCancelled:
+            journal.close()
+            self.set_status("Status: Cancelled. Use Resume Last Run to continue.")
+        except Exception as e:
+            journal.close()
+            logging.error(f"Unhandled error in generate_wrestlers: {e}", exc_info=True)
+            error_message = f"Error generating wrestlers: {str(e)}"
+            self.set_status(f"Status: Error - {str(e)}")
+            self.notify("error", "Error", error_message)
+        finally:
+            if sink:
+                sink.close()
 
-                age_prompt = (
-                    f"Given this wrestler's description: {description}\n"
-                    f"and gender {gender}, estimate their age at the start date. If the description suggests 'old', choose an older age (40-50). If 'young' choose younger (16-20). Otherwise pick an age between 16 and 50.\n"
-                    "Respond with just a number."
-                )
-                age = 30
-                try:
-                    age_resp = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role":"user","content":age_prompt}]
-                    )
-                    age_str = age_resp.choices[0].message.content.strip()
-                    age_val = int(age_str)
-                    if 16 <= age_val <= 50:
-                        age = age_val
-                except:
-                    pass
+    def flush_worker_batch(self, state, records):
+        saved = True
+        parts = []
 
-                birth_year = self.start_date.year - age
-                birth_month = random.randint(1,12)
-                birth_day = random.randint(1,28)
-                birth_date = datetime.datetime(birth_year, birth_month, birth_day)
-
-                debut_age = random.randint(16, age)
-                debut_year = birth_year + debut_age
-                if debut_year >= self.start_date.year:
-                    debut_year = self.start_date.year - 1
-                debut_month = random.randint(1,12)
-                debut_day = random.randint(1,28)
-                debut_date = datetime.datetime(debut_year, debut_month, debut_day)
-                if debut_date >= self.start_date:
-                    debut_date = self.start_date - datetime.timedelta(days=30)
-
-                style = wrestler_data['skill_preset'] if wrestler_data['skill_preset'] != "Interpret" else "Interpret"
-                bio_prompt = (
-                    f"{self.bio_prompt} The wrestler's name is {name}. "
-                    f"Their gender is {gender}. Description: {description}. "
-                    f"Their wrestling style is best described as {style}."
+        database_records = [record for record in records if "database" not in record.get("saved_parts", [])]
+        if state["database"] and database_records:
+            try:
+                self.save_wrestlers_to_database(
+                    state["database"], database_records,
+                    [record["worker"] for record in database_records],
+                    [[record["uid"], record["bio"]] for record in database_records],
+                    [record["skills"] for record in database_records],
+                    [record["contract"] for record in database_records if record["contract"]]
                 )
-                bio = self.get_response_from_gpt(bio_prompt)
-                if not bio:
-                    bio = "A professional wrestler."
-
-                style_num = self.get_style_from_gpt(bio) 
-                race = self.get_race_from_gpt(name, f"{description}\n\nBiography: {bio}")
-                picture_name = f"{name.replace(' ', '').lower()[:26]}.jpg"
-
-                roles_lang_body_prompt = (
-                    f"Given the wrestler's name: {name}, description: {player_description if player_description else description}, and bio: {bio}, "
-                    "provide a JSON response with the following:\n"
-                    "- Boolean values for: Wrestler, OccasionalWrestler, Manager, OnScreenPersonality, PlayByPlayCommentator, ColourCommentator, Referee, RoadAgent\n"
-                    "- Language fluencies (1-4) for English (always 4), Japanese, Spanish, French, Germanic, Mediterranean, Slavic, Hindi\n"
-                    "- A body type number (1-7)\n\n"
-                    "Return JSON only."
+                parts.append("database")
+            except Exception as e:
+                # Stop writing to Access for the rest of the run; the journal keeps these for a resume
+                state["database"] = None
+                state["database_failed"] = True
+                saved = False
+                logging.error(f"Error saving to Access database: {e}", exc_info=True)
+                self.notify("error", "Error", f"Could not save to Access database: {str(e)}")
+        elif state["database_failed"] and database_records:
+            saved = False
+
+        # Records whose rows already reached the store on an earlier run must not be appended twice
+        store_records = [record for record in records if "store" not in record.get("saved_parts", [])]
+        try:
+            if store_records:
+                self.worker_store.append({
+                    "Workers": [record["worker"] for record in store_records],
+                    "Bios": [{"UID": record["uid"], "Bio": record["bio"]} for record in store_records],
+                    "Skills": [record["skills"] for record in store_records],
+                    "Contracts": [record["contract"] for record in store_records if record["contract"]],
+                    "Notes": [record["notes"] for record in store_records]
+                })
+                parts.append("store")
+        except Exception as e:
+            saved = False
+            logging.error(f"Error saving workers: {e}", exc_info=True)
+            self.notify("error", "Error", f"Could not save workers: {str(e)}")
+        return saved, parts
+
+    def save_wrestlers_to_database(self, database, records, workers_data, bio_data, skills_data, contract_data):
+        for record in records:
+            # Records journaled while no database was set skipped the popularity call
+            if not record.get("popularity"):
+                record["popularity"] = self.get_region_popularity_from_gpt(
+                    record["notes"]["Name"], record["bio"], record["notes"]["Description"]
                 )
+        over_rows = [
+            [record["uid"]] + self.convert_popularity_categories_to_values(record["popularity"])
+            for record in records
+        ]
 
-                attempts = 0
-                roles_lang_body_data = None
-                while attempts < 3 and roles_lang_body_data is None:
-                    attempts += 1
-                    try:
-                        roles_lang_body_response = self.client.chat.completions.create(
-                            model="gpt-3.5-turbo",
-                            messages=[{"role":"user","content":roles_lang_body_prompt}]
-                        )
-                        roles_lang_body_content = roles_lang_body_response.choices[0].message.content.strip()
-                        roles_lang_body_data = json.loads(roles_lang_body_content)
-                    except:
-                        roles_lang_body_data = None
-
-                if roles_lang_body_data is None:
-                    roles_lang_body_data = {
-                        "Wrestler": True,
-                        "OccasionalWrestler": False,
-                        "Manager": False,
-                        "OnScreenPersonality": False,
-                        "PlayByPlayCommentator": False,
-                        "ColourCommentator": False,
-                        "Referee": False,
-                        "RoadAgent": False,
-                        "Languages": {
-                            "English": 4,
-                            "Japanese": 1,
-                            "Spanish": 2,
-                            "French": 2,
-                            "Germanic": 2,
-                            "Mediterranean": 2,
-                            "Slavic": 1,
-                            "Hindi": 1
-                        },
-                        "BodyType": 1
-                    }
+        moveset_rows = []
+        move_rows = []
+        arsenal_rows = []
+        for record in records:
+            moveset_uid = self.uid_allocator.reserve("tblMoveSet")
+            record["worker"]["Moveset"] = moveset_uid
+            moveset_rows.append([moveset_uid, record["notes"]["Name"]])
+            for move_key, move_level in FINISHER_LEVELS:
+                move_data = record["moves"][move_key]
+                move_uid = self.uid_allocator.reserve("tblWrestlingMove")
+                move_rows.append([
+                    move_uid, move_data["MoveName"][:35], move_data["MoveDesc"][:75], move_level,
+                    False, False, False, False, True, False, 0, 850, 850
+                ])
+                arsenal_rows.append([self.uid_allocator.reserve("tblMoveSetArsenal"), moveset_uid, move_uid, move_level])
+
+        with database.transaction() as cursor:
+            database.insert_many(cursor, "tblMoveSet", ["UID", "recordName"], moveset_rows)
+            database.insert_many(cursor, "tblWrestlingMove", MOVE_COLUMNS, move_rows)
+            database.insert_many(cursor, "tblMoveSetArsenal", ARSENAL_COLUMNS, arsenal_rows)
+            database.insert_many(cursor, "tblWorker", WORKER_COLUMNS, [worker_insert_values(row) for row in workers_data])
+
+            first_bio_uid = self.uid_allocator.reserve("tblWorkerBio", len(bio_data))
+            database.insert_many(
+                cursor, "tblWorkerBio", ["UID", "Profile"],
+                [[first_bio_uid + offset, b[1]] for offset, b in enumerate(bio_data)]
+            )
 
-                def bool_to_access(val):
-                    return -1 if val else 0
-
-                position_wrestler = bool_to_access(roles_lang_body_data.get("Wrestler", False))
-                position_occasional = bool_to_access(roles_lang_body_data.get("OccasionalWrestler", False))
-                position_manager = bool_to_access(roles_lang_body_data.get("Manager", False))
-                position_personality = bool_to_access(roles_lang_body_data.get("OnScreenPersonality", False))
-                position_announcer = bool_to_access(roles_lang_body_data.get("PlayByPlayCommentator", False))
-                position_colour = bool_to_access(roles_lang_body_data.get("ColourCommentator", False))
-                position_referee = bool_to_access(roles_lang_body_data.get("Referee", False))
-                position_roadagent = bool_to_access(roles_lang_body_data.get("RoadAgent", False))
-
-                languages = roles_lang_body_data.get("Languages", {})
-                speak_english = languages.get("English", 4)
-                speak_japanese = languages.get("Japanese", 1)
-                speak_spanish = languages.get("Spanish", 2)
-                speak_french = languages.get("French", 2)
-                speak_germanic = languages.get("Germanic", 2)
-                speak_med = languages.get("Mediterranean", 2)
-                speak_slavic = languages.get("Slavic", 1)
-                speak_hindi = languages.get("Hindi", 1)
-
-                body_type_code = roles_lang_body_data.get("BodyType", 1)
-
-                if wrestler_data['skill_preset'] == "Interpret":
-                    preset_name = self.select_skill_preset_with_chatgpt(
-                        name,
-                        description,
-                        gender
-                    )
-                else:
-                    preset_name = wrestler_data['skill_preset']
-
-                preset = next((p for p in self.skill_presets if p["name"] == preset_name), self.skill_presets[0])
-                skills = self.generate_skills(uid, preset)
-                skills_data.append(skills)
-
-                move_conn_str = ""
-                if self.access_db_path and os.path.exists(self.access_db_path):
-                    move_conn_str = (
-                        r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
-                        f'DBQ={self.access_db_path};'
-                        'PWD=20YearsOfTEW;'
-                    )
+            database.insert_many(
+                cursor, "tblWorkerSkill", SKILL_COLUMNS,
+                [[row["WorkerUID"]] + [row.get(skill, 0) for skill in SKILL_COLUMNS[1:]] for row in skills_data]
+            )
 
-                moves_prompt = (
-                    f"Generate three unique finishing moves for wrestler {name} (Gender: {gender}). "
-                    "Each move should have a short unique name and a short description (max 75 chars). "
-                    "The first is a 'Finisher' (type 1), the second is a 'Secondary Finisher' (type 2), "
-                    "the third is an 'Uber Finisher' (type 3). Return JSON with keys 'Finisher', 'SecondaryFinisher', 'UberFinisher'. "
-                    "Each value an object with 'MoveName' and 'MoveDesc'."
-                )
-                attempts = 0
-                moves_data_gpt = None
-                while attempts < 3 and moves_data_gpt is None:
-                    attempts += 1
+            database.insert_many(
+                cursor, "tblContract", CONTRACT_COLUMNS,
+                [[contract[column] for column in CONTRACT_COLUMNS] for contract in contract_data]
+            )
+
+            database.insert_many(cursor, "tblWorkerOver", OVER_COLUMNS, over_rows)
+
+    def run_wrestler_pool(self, wrestler_data_list, first_uid, on_record, completed=None):
+        total_wrestlers = len(wrestler_data_list)
+        completed = {index: record for index, record in (completed or {}).items() if index < total_wrestlers}
+        done_count = len(completed)
+        resumed_count = done_count
+        max_workers = max(1, int(self.concurrency or 1))
+        self.report_progress("wrestlers", done_count, total_wrestlers, resumed_count)
+        for index, record in completed.items():
+            if record is not None:
+                on_record(index, record, True)
+
+        # Each wrestler fans its independent prompts out onto the stage pool, so it
+        # needs room for roughly one graph level's worth of calls per wrestler.
+        self.stage_executor = ThreadPoolExecutor(max_workers=max_workers * 8)
+        with self.stage_executor, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Only keep a couple of wrestlers queued per worker so memory stays flat
+            # however long the roster is; finished futures are dropped once handled.
+            remaining = (
+                (index, wrestler_data) for index, wrestler_data in enumerate(wrestler_data_list)
+                if index not in completed
+            )
+            futures = {}
+            while True:
+                for index, wrestler_data in itertools.islice(remaining, max_workers * 2 - len(futures)):
+                    futures[executor.submit(self.generate_wrestler_record, wrestler_data, first_uid + index)] = index
+                if not futures:
+                    break
+                if self.cancel_event.is_set():
+                    for other in futures:
+                        other.cancel()
+                    raise JobCancelled()
+                done, pending = wait(futures, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
                     try:
-                        move_resp = self.client.chat.completions.create(
-                            model="gpt-3.5-turbo",
-                            messages=[{"role":"user","content":moves_prompt}]
-                        )
-                        moves_json_str = move_resp.choices[0].message.content.strip()
-                        moves_data_gpt = json.loads(moves_json_str)
-                    except:
-                        moves_data_gpt = None
-
-                if moves_data_gpt is None:
-                    moves_data_gpt = {
-                        "Finisher": {"MoveName":"Default Driver","MoveDesc":"A strong slam."},
-                        "SecondaryFinisher": {"MoveName":"Lesser Lariat","MoveDesc":"A quick clothesline."},
-                        "UberFinisher": {"MoveName":"Extreme End","MoveDesc":"A rare, devastating move."}
-                    }
-
-                moveset_uid_val = None
-                if move_conn_str:
-                    move_conn = pyodbc.connect(move_conn_str)
-                    move_cursor = move_conn.cursor()
-                    move_cursor.execute("SELECT MAX(UID) FROM tblMoveSet")
-                    result = move_cursor.fetchone()
-                    moveset_uid_val = (result[0] if result[0] else 0) + 1
-                    sql_insert_moveset = "INSERT INTO tblMoveSet ([UID],[recordName]) VALUES (?,?)"
-                    move_cursor.execute(sql_insert_moveset, (moveset_uid_val, name))
-                    move_conn.commit()
-
-                    def insert_move(move_data, move_type):
-                        move_cursor.execute("SELECT MAX(UID) FROM tblWrestlingMove")
-                        result = move_cursor.fetchone()
-                        move_uid = (result[0] if result[0] else 0) + 1
-
-                        MoveName = move_data["MoveName"][:35]
-                        MoveDesc = move_data["MoveDesc"][:75]
-
-                        MoveBlood = False
-                        MoveChair = False
-                        MoveTable = False
-                        MoveDive = False
-                        MoveInside = True
-                        MoveOutside = False
-                        VictimGender = 0
-                        WeightDifference = 850
-                        VictimMaxWeight = 850
-
-                        sql_insert_move = """
-                            INSERT INTO tblWrestlingMove (
-                                [UID],[MoveName],[MoveDesc],[MoveType],[MoveBlood],[MoveChair],[MoveTable],
-                                [MoveDive],[MoveInside],[MoveOutside],[VictimGender],[WeightDifference],[VictimMaxWeight]
-                            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-                        """
-                        move_cursor.execute(sql_insert_move,
-                            (
-                                move_uid,
-                                MoveName,
-                                MoveDesc,
-                                move_type,
-                                bool(MoveBlood),
-                                bool(MoveChair),
-                                bool(MoveTable),
-                                bool(MoveDive),
-                                bool(MoveInside),
-                                bool(MoveOutside),
-                                VictimGender,
-                                WeightDifference,
-                                VictimMaxWeight
-                            )
-                        )
+                        record = future.result()
+                    except Exception:
+                        for other in pending:
+                            other.cancel()
+                        raise
+                    on_record(futures.pop(future), record, False)
+                    done_count += 1
+                if done:
+                    self.report_progress("wrestlers", done_count, total_wrestlers, resumed_count)
+
+    def generate_wrestler_record(self, wrestler_data, uid):
+        started = time.perf_counter()
+        gender = wrestler_data['gender']
+        player_description = wrestler_data['description'] if wrestler_data['description'] else ""
+        freelancer = wrestler_data['company'] == "Freelancer"
+
+        graph = TaskGraph(self.stage_executor)
+        graph.add("identity", lambda: self.resolve_wrestler_identity(wrestler_data['name'], wrestler_data['description'], gender))
+        graph.add("bio", lambda identity: self.get_wrestler_bio(identity[0], gender, identity[1], wrestler_data['skill_preset']), ["identity"])
+        if self.compact_mode:
+            graph.add("attributes", lambda identity, bio: self.get_compact_attributes_from_gpt(identity[0], player_description or identity[1], gender, bio), ["identity", "bio"])
+        else:
+            graph.add("age", lambda identity: self.get_age_from_gpt(identity[1], gender), ["identity"])
+            graph.add("gimmick_face", lambda identity: self.generate_gimmick(identity[0], identity[1], gender, "face"), ["identity"])
+            graph.add("gimmick_heel", lambda identity: self.generate_gimmick(identity[0], identity[1], gender, "heel"), ["identity"])
+            graph.add("moves", lambda identity: self.get_finishers_from_gpt(identity[0], gender), ["identity"])
+            if wrestler_data['skill_preset'] == "Interpret":
+                graph.add("preset", lambda identity: self.select_skill_preset_with_chatgpt(identity[0], identity[1], gender), ["identity"])
+            graph.add("style", self.get_style_from_gpt, ["bio"])
+            graph.add("race", lambda identity, bio: self.get_race_from_gpt(identity[0], f"{identity[1]}\n\nBiography: {bio}"), ["identity", "bio"])
+            graph.add("roles_lang_body", lambda identity, bio: self.get_roles_lang_body_from_gpt(identity[0], player_description or identity[1], bio), ["identity", "bio"])
+            if not freelancer:
+                graph.add("alignment", lambda identity: self.get_alignment_from_gpt(identity[0]), ["identity"])
+                graph.add("physical", lambda identity, race: self.get_physical_description_from_gpt(identity[0], player_description or identity[1], gender, race), ["identity", "race"])
+            # Popularity only feeds tblWorkerOver, so skip the call when there is no database
+            if self.open_database():
+                graph.add("popularity", lambda identity, bio: self.get_region_popularity_from_gpt(identity[0], bio, player_description or identity[1]), ["identity", "bio"])
+        results = graph.run()
+        if self.compact_mode:
+            attributes = results.pop("attributes")
+            if wrestler_data['skill_preset'] != "Interpret":
+                attributes.pop("preset")
+            results.update(attributes)
+
+        name, description = results["identity"]
+        age = results["age"]
+        bio = results["bio"]
+        style_num = results["style"]
+        race = results["race"]
+        roles_lang_body_data = results["roles_lang_body"]
+        moves_data_gpt = results["moves"]
+
+        shortname = name.split()[0][:20] if name else ''
+        gender_value = 1 if gender.lower() == 'male' else 5
+
+        birth_year = self.start_date.year - age
+        birth_month = random.randint(1,12)
+        birth_day = random.randint(1,28)
+        birth_date = datetime.datetime(birth_year, birth_month, birth_day)
+
+        debut_age = random.randint(16, age)
+        debut_year = birth_year + debut_age
+        if debut_year >= self.start_date.year:
+            debut_year = self.start_date.year - 1
+        debut_month = random.randint(1,12)
+        debut_day = random.randint(1,28)
+        debut_date = datetime.datetime(debut_year, debut_month, debut_day)
+        if debut_date >= self.start_date:
+            debut_date = self.start_date - datetime.timedelta(days=30)
+
+        picture_name = f"{name.replace(' ', '').lower()[:26]}.jpg"
+
+        def bool_to_access(val):
+            return -1 if val else 0
+
+        position_wrestler = bool_to_access(roles_lang_body_data.get("Wrestler", False))
+        position_occasional = bool_to_access(roles_lang_body_data.get("OccasionalWrestler", False))
+        position_manager = bool_to_access(roles_lang_body_data.get("Manager", False))
+        position_personality = bool_to_access(roles_lang_body_data.get("OnScreenPersonality", False))
+        position_announcer = bool_to_access(roles_lang_body_data.get("PlayByPlayCommentator", False))
+        position_colour = bool_to_access(roles_lang_body_data.get("ColourCommentator", False))
+        position_referee = bool_to_access(roles_lang_body_data.get("Referee", False))
+        position_roadagent = bool_to_access(roles_lang_body_data.get("RoadAgent", False))
+
+        languages = roles_lang_body_data.get("Languages", {})
+        speak_english = languages.get("English", 4)
+        speak_japanese = languages.get("Japanese", 1)
+        speak_spanish = languages.get("Spanish", 2)
+        speak_french = languages.get("French", 2)
+        speak_germanic = languages.get("Germanic", 2)
+        speak_med = languages.get("Mediterranean", 2)
+        speak_slavic = languages.get("Slavic", 1)
+        speak_hindi = languages.get("Hindi", 1)
+
+        body_type_code = roles_lang_body_data.get("BodyType", 1)
+
+        preset_name = results.get("preset", wrestler_data['skill_preset'])
+        preset = next((p for p in self.skill_presets if p["name"] == preset_name), self.skill_presets[0])
+        skills = self.generate_skills(uid, preset)
+
+        worker_row = {
+            "UID": int(uid),
+            "User": False,
+            "Regen": self.ensure_byte(0),
+            "Active": True,
+            "Name": name[:30],
+            "Shortname": shortname[:20],
+            "Gender": self.ensure_byte(gender_value),
+            "Pronouns": self.ensure_byte(1 if gender_value == 1 else 2),
+            "Sexuality": self.ensure_byte(1),
+            "CompetesAgainst": self.ensure_byte(2 if gender_value == 1 else 3),
+            "Outsiderel": self.ensure_byte(0),
+            "Birthday": birth_date,
+            "DebutDate": debut_date,
+            "DeathDate": "1666-01-01",
+            "BodyType": self.ensure_byte(body_type_code),
+            "WorkerHeight": self.ensure_byte(random.randint(20, 42)),
+            "WorkerWeight": random.randint(150,350),
+            "WorkerMinWeight": 150,
+            "WorkerMaxWeight": 350,
+            "Picture": picture_name,
+            "Nationality": int(1),
+            "Race": self.ensure_byte(race),
+            "Based_In": self.ensure_byte(1),
+            "LeftBusiness": False,
+            "Dead": False,
+            "Retired": False,
+            "NonWrestler": False,
+            "Celebridad": self.ensure_byte(0),
+            "Style": style_num,
+            "Freelance": False,
+            "Loyalty": 0,
+            "TrueBorn": False,
+            "USA": True,
+            "Canada": True,
+            "Mexico": True,
+            "Japan": True,
+            "UK": True,
+            "Europe": True,
+            "Oz": True,
+            "India": True,
+            "Speak_English": int(speak_english),
+            "Speak_Japanese": int(speak_japanese),
+            "Speak_Spanish": int(speak_spanish),
+            "Speak_French": int(speak_french),
+            "Speak_Germanic": int(speak_germanic),
+            "Speak_Med": int(speak_med),
+            "Speak_Slavic": int(speak_slavic),
+            "Speak_Hindi": int(speak_hindi),
+            "Moveset": 0,
+            "Position_Wrestler": position_wrestler,
+            "Position_Occasional": position_occasional,
+            "Position_Referee": position_referee,
+            "Position_Announcer": position_announcer,
+            "Position_Colour": position_colour,
+            "Position_Manager": position_manager,
+            "Position_Personality": position_personality,
+            "Position_Roadagent": position_roadagent,
+            "Mask": int(0),
+            "Age_Matures": self.ensure_byte(0),
+            "Age_Declines": self.ensure_byte(0),
+            "Age_TalkDeclines": self.ensure_byte(0),
+            "Age_Retires": self.ensure_byte(0),
+            "OrganicBio": True,
+            "PlasterCaster_Face": results["gimmick_face"][:30],
+            "PlasterCaster_FaceBasis": self.ensure_byte(1),
+            "PlasterCaster_Heel": results["gimmick_heel"][:30],
+            "PlasterCaster_HeelBasis": self.ensure_byte(1),
+            "CareerGoal": self.ensure_byte(0)
+        }
 
-                        move_cursor.execute("SELECT MAX(UID) FROM tblMoveSetArsenal")
-                        result = move_cursor.fetchone()
-                        moveset_entry_uid = (result[0] if result[0] else 0) + 1
-                        sql_insert_movesetarsenal = "INSERT INTO tblMoveSetArsenal ([UID],[MoveSetUID],[Move],[MoveLevel]) VALUES (?,?,?,?)"
-                        move_cursor.execute(sql_insert_movesetarsenal, (moveset_entry_uid, moveset_uid_val, move_uid, move_type))
-
-                        return move_uid
-
-                    insert_move(moves_data_gpt["Finisher"], 1)
-                    insert_move(moves_data_gpt["SecondaryFinisher"], 2)
-                    insert_move(moves_data_gpt["UberFinisher"], 3)
-
-                    move_conn.commit()
-                    move_conn.close()
-
-                worker_moveset_val = moveset_uid_val if moveset_uid_val else 0
-
-                worker_row = {
-                    "UID": int(uid),
-                    "User": False,
-                    "Regen": self.ensure_byte(0),
-                    "Active": True,
-                    "Name": name[:30],
-                    "Shortname": shortname[:20],
-                    "Gender": self.ensure_byte(gender_value),
-                    "Pronouns": self.ensure_byte(1 if gender_value == 1 else 2),
-                    "Sexuality": self.ensure_byte(1),
-                    "CompetesAgainst": self.ensure_byte(2 if gender_value == 1 else 3),
-                    "Outsiderel": self.ensure_byte(0),
-                    "Birthday": birth_date,
-                    "DebutDate": debut_date,
-                    "DeathDate": "1666-01-01",
-                    "BodyType": self.ensure_byte(body_type_code),
-                    "WorkerHeight": self.ensure_byte(random.randint(20, 42)),
-                    "WorkerWeight": random.randint(150,350),
-                    "WorkerMinWeight": 150,
-                    "WorkerMaxWeight": 350,
-                    "Picture": picture_name,
-                    "Nationality": int(1),
-                    "Race": self.ensure_byte(race),
-                    "Based_In": self.ensure_byte(1),
-                    "LeftBusiness": False,
-                    "Dead": False,
-                    "Retired": False,
-                    "NonWrestler": False,
-                    "Celebridad": self.ensure_byte(0),
-                    "Style": style_num,
-                    "Freelance": False,
-                    "Loyalty": 0,
-                    "TrueBorn": False,
-                    "USA": True,
-                    "Canada": True,
-                    "Mexico": True,
-                    "Japan": True,
-                    "UK": True,
-                    "Europe": True,
-                    "Oz": True,
-                    "India": True,
-                    "Speak_English": int(speak_english),
-                    "Speak_Japanese": int(speak_japanese),
-                    "Speak_Spanish": int(speak_spanish),
-                    "Speak_French": int(speak_french),
-                    "Speak_Germanic": int(speak_germanic),
-                    "Speak_Med": int(speak_med),
-                    "Speak_Slavic": int(speak_slavic),
-                    "Speak_Hindi": int(speak_hindi),
-                    "Moveset": worker_moveset_val,
-                    "Position_Wrestler": position_wrestler,
-                    "Position_Occasional": position_occasional,
-                    "Position_Referee": position_referee,
-                    "Position_Announcer": position_announcer,
-                    "Position_Colour": position_colour,
-                    "Position_Manager": position_manager,
-                    "Position_Personality": position_personality,
-                    "Position_Roadagent": position_roadagent,
-                    "Mask": int(0),
-                    "Age_Matures": self.ensure_byte(0),
-                    "Age_Declines": self.ensure_byte(0),
-                    "Age_TalkDeclines": self.ensure_byte(0),
-                    "Age_Retires": self.ensure_byte(0),
-                    "OrganicBio": True,
-                    "PlasterCaster_Face": self.generate_gimmick(name, description, gender, "face")[:30],
-                    "PlasterCaster_FaceBasis": self.ensure_byte(1),
-                    "PlasterCaster_Heel": self.generate_gimmick(name, description, gender, "heel")[:30],
-                    "PlasterCaster_HeelBasis": self.ensure_byte(1),
-                    "CareerGoal": self.ensure_byte(0)
-                }
+        worker_row_converted = {
+            key: (-1 if (isinstance(value, bool) and value) else (0 if isinstance(value, bool) else value))
+            for key, value in worker_row.items()
+        }
 
-                worker_row_converted = {
-                    key: (-1 if (isinstance(value, bool) and value) else (0 if isinstance(value, bool) else value))
-                    for key, value in worker_row.items()
-                }
-                workers_data.append(worker_row_converted)
-                bio_data.append([uid, bio])
-
-                if wrestler_data['company'] != "Freelancer":
-                    contract = self.generate_contract(wrestler_data, uid, wrestler_data['company'], contract_uid)
-                    if contract:
-                        contract_data.append(contract)
-                        contract_uid += 1
-
-                    physical_prompt = (
-                        f"Based on this wrestler's details:\n"
-                        f"Name: {name}\n"
-                        f"Description: {player_description if player_description else description}\n"
-                        f"Gender: {gender}\n"
-                        f"Race: {self.get_race_name(race)}\n"
-                        f"Please provide a single sentence describing their physical appearance. "
-                        f"Focus on height, build, and distinctive features."
-                    )
-                    physical_description = self.get_response_from_gpt(physical_prompt)
-                else:
-                    physical_description = ""
-
-                notes_data.append({
-                    "Name": name,
-                    "Description": player_description if player_description else description,
-                    "Gender": gender,
-                    "Company": wrestler_data.get('company', 'Random'),
-                    "Exclusive": wrestler_data.get('exclusive', 'Random'),
-                    "Skill_Preset": wrestler_data.get('skill_preset', 'Default'),
-                    "Picture": f"{name.replace(' ', '').lower()}.jpg"[:35],
-                    "physical_description": physical_description,
-                    "image_generated": False,
-                    "Race": race
-                })
+        contract = None
+        physical_description = ""
+        if not freelancer:
+            contract = self.generate_contract(dict(wrestler_data, name=name), uid, wrestler_data['company'], None, results["alignment"])
+            physical_description = results["physical"]
+
+        notes = {
+            "Name": name,
+            "Description": player_description if player_description else description,
+            "Gender": gender,
+            "Company": wrestler_data.get('company', 'Random'),
+            "Exclusive": wrestler_data.get('exclusive', 'Random'),
+            "Skill_Preset": wrestler_data.get('skill_preset', 'Default'),
+            "Picture": f"{name.replace(' ', '').lower()}.jpg"[:35],
+            "physical_description": physical_description,
+            "image_generated": False,
+            "Race": race
+        }
 
-                uid += 1
+        self.log_event(
+            "wrestler_generated", uid=uid, name=name, company=wrestler_data.get('company', 'Random'),
+            seconds=round(time.perf_counter() - started, 3)
+        )
+        return {
+            "uid": uid,
+            "worker": worker_row_converted,
+            "bio": bio,
+            "skills": skills,
+            "contract": contract,
+            "notes": notes,
+            "moves": moves_data_gpt,
+            "popularity": results.get("popularity")
+        }
 
-            if self.access_db_path and os.path.exists(self.access_db_path):
-                try:
-                    conn_str = (
-                        r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
-                        f'DBQ={self.access_db_path};'
-                        'PWD=20YearsOfTEW;'
-                    )
-                    conn = pyodbc.connect(conn_str)
-                    cursor = conn.cursor()
-
-                    for worker_row in workers_data:
-                        worker_row_converted = {
-                            key: (-1 if (isinstance(value, bool) and value) else (0 if isinstance(value, bool) else value))
-                            for key, value in worker_row.items()
-                        }
-
-                        worker_row_converted["Name"] = worker_row_converted["Name"][:30]
-                        worker_row_converted["Shortname"] = worker_row_converted["Shortname"][:20]
-                        worker_row_converted["Picture"] = worker_row_converted["Picture"][:35]
-                        worker_row_converted["PlasterCaster_Face"] = worker_row_converted["PlasterCaster_Face"][:30]
-                        worker_row_converted["PlasterCaster_Heel"] = worker_row_converted["PlasterCaster_Heel"][:30]
-
-                        sql_insert_worker = """
-                            INSERT INTO tblWorker (
-                                [UID], [User], [Regen], [Active], [Name], [Shortname], [Gender], [Pronouns],
-                                [Sexuality], [CompetesAgainst], [Outsiderel], [Birthday], [DebutDate], [DeathDate],
-                                [BodyType], [WorkerHeight], [WorkerWeight], [WorkerMinWeight], [WorkerMaxWeight],
-                                [Picture], [Nationality], [Race], [Based_In], [LeftBusiness], [Dead], [Retired],
-                                [NonWrestler], [Celebridad], [Style], [Freelance], [Loyalty], [TrueBorn], [USA],
-                                [Canada], [Mexico], [Japan], [UK], [Europe], [Oz], [India], [Speak_English],
-                                [Speak_Japanese], [Speak_Spanish], [Speak_French], [Speak_Germanic], [Speak_Med],
-                                [Speak_Slavic], [Speak_Hindi], [Moveset], [Position_Wrestler], [Position_Occasional],
-                                [Position_Referee], [Position_Announcer], [Position_Colour], [Position_Manager],
-                                [Position_Personality], [Position_Roadagent], [Mask], [Age_Matures], [Age_Declines],
-                                [Age_TalkDeclines], [Age_Retires], [OrganicBio], [PlasterCaster_Face],
-                                [PlasterCaster_FaceBasis], [PlasterCaster_Heel], [PlasterCaster_HeelBasis],
-                                [CareerGoal]
-                            ) VALUES (
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,  ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                            )
-                        """
-
-                        cursor.execute(sql_insert_worker, [
-                            int(worker_row_converted["UID"]),
-                            bool(worker_row_converted["User"]),
-                            int(worker_row_converted["Regen"]),
-                            bool(worker_row_converted["Active"]),
-                            str(worker_row_converted["Name"]),
-                            str(worker_row_converted["Shortname"]),
-                            int(worker_row_converted["Gender"]),
-                            int(worker_row_converted["Pronouns"]),
-                            int(worker_row_converted["Sexuality"]),
-                            int(worker_row_converted["CompetesAgainst"]),
-                            int(worker_row_converted["Outsiderel"]),
-                            worker_row["Birthday"],
-                            worker_row["DebutDate"],
-                            "1666-01-01",
-                            int(worker_row_converted["BodyType"]),
-                            int(worker_row_converted["WorkerHeight"]),
-                            int(worker_row_converted["WorkerWeight"]),
-                            int(worker_row_converted["WorkerMinWeight"]),
-                            int(worker_row_converted["WorkerMaxWeight"]),
-                            str(worker_row_converted["Picture"]),
-                            int(worker_row_converted["Nationality"]),
-                            int(worker_row_converted["Race"]),
-                            int(worker_row_converted["Based_In"]),
-                            bool(worker_row_converted["LeftBusiness"]),
-                            bool(worker_row_converted["Dead"]),
-                            bool(worker_row_converted["Retired"]),
-                            bool(worker_row_converted["NonWrestler"]),
-                            int(worker_row_converted["Celebridad"]),
-                            int(worker_row_converted["Style"]),
-                            bool(worker_row_converted["Freelance"]),
-                            int(worker_row_converted["Loyalty"]),
-                            bool(worker_row_converted["TrueBorn"]),
-                            bool(worker_row_converted["USA"]),
-                            bool(worker_row_converted["Canada"]),
-                            bool(worker_row_converted["Mexico"]),
-                            bool(worker_row_converted["Japan"]),
-                            bool(worker_row_converted["UK"]),
-                            bool(worker_row_converted["Europe"]),
-                            bool(worker_row_converted["Oz"]),
-                            bool(worker_row_converted["India"]),
-                            int(worker_row_converted["Speak_English"]),
-                            int(worker_row_converted["Speak_Japanese"]),
-                            int(worker_row_converted["Speak_Spanish"]),
-                            int(worker_row_converted["Speak_French"]),
-                            int(worker_row_converted["Speak_Germanic"]),
-                            int(worker_row_converted["Speak_Med"]),
-                            int(worker_row_converted["Speak_Slavic"]),
-                            int(worker_row_converted["Speak_Hindi"]),
-                            int(worker_row_converted["Moveset"]),
-                            bool(worker_row_converted["Position_Wrestler"]),
-                            bool(worker_row_converted["Position_Occasional"]),
-                            bool(worker_row_converted["Position_Referee"]),
-                            bool(worker_row_converted["Position_Announcer"]),
-                            bool(worker_row_converted["Position_Colour"]),
-                            bool(worker_row_converted["Position_Manager"]),
-                            bool(worker_row_converted["Position_Personality"]),
-                            bool(worker_row_converted["Position_Roadagent"]),
-                            int(worker_row_converted["Mask"]),
-                            int(worker_row_converted["Age_Matures"]),
-                            int(worker_row_converted["Age_Declines"]),
-                            int(worker_row_converted["Age_TalkDeclines"]),
-                            int(worker_row_converted["Age_Retires"]),
-                            bool(worker_row_converted["OrganicBio"]),
-                            str(worker_row_converted["PlasterCaster_Face"]),
-                            int(worker_row_converted["PlasterCaster_FaceBasis"]),
-                            str(worker_row_converted["PlasterCaster_Heel"]),
-                            int(worker_row_converted["PlasterCaster_HeelBasis"]),
-                            int(worker_row_converted["CareerGoal"])
-                        ])
-
-                    cursor.execute("SELECT MAX(UID) FROM tblWorkerBio")
-                    result = cursor.fetchone()
-                    max_workerbio_uid = result[0] if result[0] else 0
-
-                    for b in bio_data:
-                        max_workerbio_uid += 1
-                        new_bio_val = [max_workerbio_uid, b[1]]
-                        sql_insert_bio = "INSERT INTO tblWorkerBio ([UID], [Profile]) VALUES (?, ?)"
-                        cursor.execute(sql_insert_bio, new_bio_val)
-
-                    for skills_row in skills_data:
-                        sql_insert_skills = """
-                            INSERT INTO tblWorkerSkill (
-                                WorkerUID, Brawl, Air, Technical, Power, Athletic, Stamina, 
-                                Psych, Basics, Tough, Sell, Charisma, Mic, Menace, Respect, 
-                                Reputation, Safety, Looks, Star, Consistency, Act, Injury, 
-                                Puroresu, Flash, Hardcore, Announcing, Colour, Refereeing, 
-                                Experience, PotentialPrimary, PotentialMental, PotentialPerformance, 
-                                PotentialFundamental, PotentialPhysical, PotentialAnnouncing, 
-                                PotentialColour, PotentialRefereeing, ScoutRing, ScoutPhysical, 
-                                ScoutEnt, ScoutBroadcast, ScoutRef
-                            ) VALUES (
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                            )
-                        """
-                        cursor.execute(sql_insert_skills, [
-                            skills_row["WorkerUID"],
-                            skills_row.get("Brawl", 0),
-                            skills_row.get("Air", 0),
-                            skills_row.get("Technical", 0),
-                            skills_row.get("Power", 0),
-                            skills_row.get("Athletic", 0),
-                            skills_row.get("Stamina", 0),
-                            skills_row.get("Psych", 0),
-                            skills_row.get("Basics", 0),
-                            skills_row.get("Tough", 0),
-                            skills_row.get("Sell", 0),
-                            skills_row.get("Charisma", 0),
-                            skills_row.get("Mic", 0),
-                            skills_row.get("Menace", 0),
-                            skills_row.get("Respect", 0),
-                            skills_row.get("Reputation", 0),
-                            skills_row.get("Safety", 0),
-                            skills_row.get("Looks", 0),
-                            skills_row.get("Star", 0),
-                            skills_row.get("Consistency", 0),
-                            skills_row.get("Act", 0),
-                            skills_row.get("Injury", 0),
-                            skills_row.get("Puroresu", 0),
-                            skills_row.get("Flash", 0),
-                            skills_row.get("Hardcore", 0),
-                            skills_row.get("Announcing", 0),
-                            skills_row.get("Colour", 0),
-                            skills_row.get("Refereeing", 0),
-                            skills_row.get("Experience", 0),
-                            skills_row.get("PotentialPrimary", 0),
-                            skills_row.get("PotentialMental", 0),
-                            skills_row.get("PotentialPerformance", 0),
-                            skills_row.get("PotentialFundamental", 0),
-                            skills_row.get("PotentialPhysical", 0),
-                            skills_row.get("PotentialAnnouncing", 0),
-                            skills_row.get("PotentialColour", 0),
-                            skills_row.get("PotentialRefereeing", 0),
-                            skills_row.get("ScoutRing", 0),
-                            skills_row.get("ScoutPhysical", 0),
-                            skills_row.get("ScoutEnt", 0),
-                            skills_row.get("ScoutBroadcast", 0),
-                            skills_row.get("ScoutRef", 0)
-                        ])
-
-                    cursor.execute("SELECT MAX(UID) FROM tblContract")
-                    result = cursor.fetchone()
-                    current_contract_max_uid = result[0] if result[0] else 0
-
-                    for contract in contract_data:
-                        current_contract_max_uid += 1
-                        contract["UID"] = current_contract_max_uid
-                        sql_insert_contract = """
-                            INSERT INTO tblContract (
-                                [UID], [FedUID], [WorkerUID], [Name], [Shortname], [Picture], 
-                                [CompetesIn], [Face], [Division], [Manager], [Moveset], [WrittenContract],
-                                [ExclusiveContract], [TouringContract], [PaidMonthly], [OnLoan], [Developmental],
-                                [PrimaryUsage], [SecondaryUsage], [ExpectedShows], [BonusAmount], [BonusType],
-                                [Creative], [HiringVeto], [WageMatch], [IronClad], [ContractBeganDate], [Daysleft],
-                                [Dateslength], [DatesLeft], [ContractDebutDate], [Amount], [Downside], [Brand],
-                                [Mask], [ContractMomentum], [Last_Turn], [Travel], [Position_Wrestler],
-                                [Position_Occasional], [Position_Referee], [Position_Announcer], [Position_Colour],
-                                [Position_Manager], [Position_Personality], [Position_Roadagent], [Merch],
-                                [PlasterCaster_Gimmick], [PlasterCaster_Rating], [PlasterCaster_Lifespan],
-                                [PlasterCaster_Byte1], [PlasterCaster_Byte2], [PlasterCaster_Byte3],
-                                [PlasterCaster_Byte4], [PlasterCaster_Byte5], [PlasterCaster_Byte6],
-                                [PlasterCaster_Bool1], [PlasterCaster_Bool2], [PlasterCaster_Bool3],
-                                [PlasterCaster_Bool4], [PlasterCaster_Bool5], [PlasterCaster_Bool6],
-                                [PlasterCaster_Bool7], [PlasterCaster_Bool8], [PlasterCaster_Bool9],
-                                [PlasterCaster_Bool10], [PlasterCaster_Bool11], [PlasterCaster_Bool12],
-                                [PlasterCaster_Bool13], [PlasterCaster_Bool14], [PlasterCaster_Bool15],
-                                [PlasterCaster_Bool16], [PlasterCaster_Bool17], [PlasterCaster_Bool18],
-                                [PlasterCaster_Bool19], [PlasterCaster_Bool20], [PlasterCaster_Bool21],
-                                [PlasterCaster_Bool22], [PlasterCaster_Bool23], [PlasterCaster_Bool24],
-                                [PlasterCaster_Bool25]
-                            ) VALUES (
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?
-                            )
-                        """
-                        cvals = [
-                            contract["UID"],
-                            contract["FedUID"],
-                            contract["WorkerUID"],
-                            contract["Name"],
-                            contract["Shortname"],
-                            contract["Picture"],
-                            contract["CompetesIn"],
-                            contract["Face"],
-                            contract["Division"],
-                            contract["Manager"],
-                            contract["Moveset"],
-                            contract["WrittenContract"],
-                            contract["ExclusiveContract"],
-                            contract["TouringContract"],
-                            contract["PaidMonthly"],
-                            contract["OnLoan"],
-                            contract["Developmental"],
-                            contract["PrimaryUsage"],
-                            contract["SecondaryUsage"],
-                            contract["ExpectedShows"],
-                            contract["BonusAmount"],
-                            contract["BonusType"],
-                            contract["Creative"],
-                            contract["HiringVeto"],
-                            contract["WageMatch"],
-                            contract["IronClad"],
-                            contract["ContractBeganDate"],
-                            contract["Daysleft"],
-                            contract["Dateslength"],
-                            contract["DatesLeft"],
-                            contract["ContractDebutDate"],
-                            contract["Amount"],
-                            contract["Downside"],
-                            contract["Brand"],
-                            contract["Mask"],
-                            contract["ContractMomentum"],
-                            contract["Last_Turn"],
-                            contract["Travel"],
-                            contract["Position_Wrestler"],
-                            contract["Position_Occasional"],
-                            contract["Position_Referee"],
-                            contract["Position_Announcer"],
-                            contract["Position_Colour"],
-                            contract["Position_Manager"],
-                            contract["Position_Personality"],
-                            contract["Position_Roadagent"],
-                            contract["Merch"],
-                            contract["PlasterCaster_Gimmick"],
-                            contract["PlasterCaster_Rating"],
-                            contract["PlasterCaster_Lifespan"],
-                            contract["PlasterCaster_Byte1"],
-                            contract["PlasterCaster_Byte2"],
-                            contract["PlasterCaster_Byte3"],
-                            contract["PlasterCaster_Byte4"],
-                            contract["PlasterCaster_Byte5"],
-                            contract["PlasterCaster_Byte6"]
-                        ]
-                        for i in range(1, 26):
-                            cvals.append(contract[f"PlasterCaster_Bool{i}"])
-                        cursor.execute(sql_insert_contract, cvals)
-
-                    # Insert popularity into tblWorkerOver (WorkerUID as PK)
-                    for worker_row in workers_data:
-                        worker_uid = worker_row["UID"]
-                        worker_name = ""
-                        worker_bio = ""
-                        for n in notes_data:
-                            if n["Name"][:30] == worker_row["Name"]:
-                                worker_name = n["Name"]
-                                break
-                        for b in bio_data:
-                            if b[0] == worker_uid:
-                                worker_bio = b[1]
-                                break
-
-                        popularity_categories = self.get_region_popularity_from_gpt(worker_name, worker_bio, description)
-                        popularity_values = self.convert_popularity_categories_to_values(popularity_categories)
-
-                        columns = ["WorkerUID"] + [f"Over{i}" for i in range(1,58)]
-                        placeholders = ", ".join(["?"] * 58)
-                        sql_insert_over = f"INSERT INTO tblWorkerOver ({', '.join(columns)}) VALUES ({placeholders})"
-                        over_values = [worker_uid] + popularity_values
-                        cursor.execute(sql_insert_over, over_values)
-
-                    conn.commit()
-                    conn.close()
-                except Exception as e:
-                    logging.error(f"Error saving to Access database: {e}", exc_info=True)
-                    messagebox.showerror("Error", f"Could not save to Access database: {str(e)}")
+    def resolve_wrestler_identity(self, name, description, gender):
+        if not name and not description:
+            prompt = f"Generate a name and description for a professional wrestler. The wrestler's gender is {gender}."
+            text = self.chat_completion(prompt, "wrestler_identity", use_cache=False)
+            lines = text.split('\n')
+            name = lines[0].strip() if lines else "Default Wrestler"
+            description = ' '.join(lines[1:]).strip() if len(lines)>1 else "A professional wrestler."
+        elif not name:
+            prompt = f"Generate a name for a professional wrestler. The wrestler's gender is {gender}. Description: {description}"
+            name = self.chat_completion(prompt, "wrestler_identity", use_cache=False)
+        elif not description:
+            prompt = f"Generate a description for a professional wrestler named {name}. The wrestler's gender is {gender}."
+            description = self.chat_completion(prompt, "wrestler_identity", use_cache=False)
+
+        name = name.replace('.', '').strip()
+        name = name[:30]
+        return name, description
+
+    def get_age_from_gpt(self, description, gender):
+        age_prompt = (
+            f"Given this wrestler's description: {description}\n"
+            f"and gender {gender}, estimate their age at the start date. If the description suggests 'old', choose an older age (40-50). If 'young' choose younger (16-20). Otherwise pick an age between 16 and 50.\n"
+            "Respond with just a number."
+        )
+        age = 30
+        try:
+            age_str = self.chat_completion(age_prompt, "age", validate=lambda text: int_in_range(text, 16, 50, None) is not None)
+            age_val = int(age_str)
+            if 16 <= age_val <= 50:
+                age = age_val
+        except ValueError:
+            pass
+        except Exception as e:
+            self.record_fallback("age", e)
+        return age
+
+    def get_wrestler_bio(self, name, gender, description, skill_preset):
+        style = skill_preset if skill_preset != "Interpret" else "Interpret"
+        bio_prompt = (
+            f"{self.bio_prompt} The wrestler's name is {name}. "
+            f"Their gender is {gender}. Description: {description}. "
+            f"Their wrestling style is best described as {style}."
+        )
+        bio = self.get_response_from_gpt(bio_prompt, "wrestler_bio")
+        if not bio:
+            bio = "A professional wrestler."
+        return bio
+
+    def get_roles_lang_body_from_gpt(self, name, description, bio):
+        roles_lang_body_prompt = (
+            f"Given the wrestler's name: {name}, description: {description}, and bio: {bio}, "
+            "provide a JSON response with the following:\n"
+            "- Boolean values for: Wrestler, OccasionalWrestler, Manager, OnScreenPersonality, PlayByPlayCommentator, ColourCommentator, Referee, RoadAgent\n"
+            "- Language fluencies (1-4) for English (always 4), Japanese, Spanish, French, Germanic, Mediterranean, Slavic, Hindi\n"
+            "- A body type number (1-7)\n\n"
+            "Return JSON only."
+        )
 
+        # Failed calls are already retried with backoff; these attempts only re-ask for unreadable JSON
+        attempts = 0
+        roles_lang_body_data = None
+        error = None
+        while attempts < 3 and roles_lang_body_data is None:
+            attempts += 1
             try:
-                excel_path = "wrestleverse_workers.xlsx"
-                if os.path.exists(excel_path):
-                    existing_workers = pd.read_excel(excel_path, sheet_name="Workers")
-                    existing_bios = pd.read_excel(excel_path, sheet_name="Bios")
-                    existing_skills = pd.read_excel(excel_path, sheet_name="Skills")
-                    existing_contracts = pd.read_excel(excel_path, sheet_name="Contracts")
-                    existing_notes = pd.read_excel(excel_path, sheet_name="Notes")
-                    
-                    new_workers = pd.DataFrame(workers_data)
-                    new_bios = pd.DataFrame(bio_data, columns=["UID", "Bio"])
-                    new_skills = pd.DataFrame(skills_data)
-                    new_contracts = pd.DataFrame(contract_data)
-                    new_notes = pd.DataFrame(notes_data)
-                    
-                    workers_df = pd.concat([existing_workers, new_workers], ignore_index=True)
-                    bio_df = pd.concat([existing_bios, new_bios], ignore_index=True)
-                    skills_df = pd.concat([existing_skills, new_skills], ignore_index=True)
-                    contracts_df = pd.concat([existing_contracts, new_contracts], ignore_index=True)
-                    notes_df = pd.concat([existing_notes, new_notes], ignore_index=True)
-                else:
-                    workers_df = pd.DataFrame(workers_data)
-                    bio_df = pd.DataFrame(bio_data, columns=["UID", "Bio"])
-                    skills_df = pd.DataFrame(skills_data)
-                    contracts_df = pd.DataFrame(contract_data)
-                    notes_df = pd.DataFrame(notes_data)
-
-                if 'physical_description' not in notes_df.columns:
-                    notes_df['physical_description'] = ''
-                
-                with pd.ExcelWriter(excel_path) as writer:
-                    workers_df.to_excel(writer, sheet_name="Workers", index=False)
-                    bio_df.to_excel(writer, sheet_name="Bios", index=False)
-                    skills_df.to_excel(writer, sheet_name="Skills", index=False)
-                    contracts_df.to_excel(writer, sheet_name="Contracts", index=False)
-                    notes_df.to_excel(writer, sheet_name="Notes", index=False)
-                
-                messagebox.showinfo("Success", f"Wrestlers saved to {excel_path}")
+                roles_lang_body_content = self.chat_completion(roles_lang_body_prompt, "roles_lang_body", validate=is_json_object, refresh=attempts > 1)
             except Exception as e:
-                logging.error(f"Error saving Excel file: {e}", exc_info=True)
-                messagebox.showerror("Error", f"Could not save Excel file: {str(e)}")
+                error = e
+                break
+            try:
+                roles_lang_body_data = json.loads(roles_lang_body_content)
+            except ValueError as e:
+                error = e
+
+        if roles_lang_body_data is None:
+            self.record_fallback("roles_lang_body", error)
+            roles_lang_body_data = copy.deepcopy(DEFAULT_ROLES_LANG_BODY)
+        return roles_lang_body_data
+
+    def get_finishers_from_gpt(self, name, gender):
+        moves_prompt = (
+            f"Generate three unique finishing moves for wrestler {name} (Gender: {gender}). "
+            "Each move should have a short unique name and a short description (max 75 chars). "
+            "The first is a 'Finisher' (type 1), the second is a 'Secondary Finisher' (type 2), "
+            "the third is an 'Uber Finisher' (type 3). Return JSON with keys 'Finisher', 'SecondaryFinisher', 'UberFinisher'. "
+            "Each value an object with 'MoveName' and 'MoveDesc'."
+        )
+        attempts = 0
+        moves_data_gpt = None
+        error = None
+        while attempts < 3 and moves_data_gpt is None:
+            attempts += 1
+            try:
+                moves_json_str = self.chat_completion(moves_prompt, "finishers", validate=is_json_object, refresh=attempts > 1)
+            except Exception as e:
+                error = e
+                break
+            try:
+                moves_data_gpt = json.loads(moves_json_str)
+            except ValueError as e:
+                error = e
 
-            self.status_label.config(text="Status: Generation complete!")
-            self.root.update_idletasks()
+        if moves_data_gpt is None:
+            self.record_fallback("finishers", error)
+            moves_data_gpt = copy.deepcopy(DEFAULT_FINISHERS)
+        return moves_data_gpt
 
+    def get_alignment_from_gpt(self, name):
+        alignment_prompt = f"For a wrestler named {name}, should they be face or heel? Answer with 'face' or 'heel'."
+        try:
+            alignment = self.chat_completion(alignment_prompt, "alignment").lower()
+            return alignment == "face"
         except Exception as e:
-            logging.error(f"Unhandled error in generate_wrestlers: {e}", exc_info=True)
-            error_message = f"Error generating wrestlers: {str(e)}"
-            self.status_label.config(text=f"Status: Error - {str(e)}")
-            messagebox.showerror("Error", error_message)
+            self.record_fallback("alignment", e)
+            return random.choice([True, False])
+
+    def get_physical_description_from_gpt(self, name, description, gender, race):
+        physical_prompt = (
+            f"Based on this wrestler's details:\n"
+            f"Name: {name}\n"
+            f"Description: {description}\n"
+            f"Gender: {gender}\n"
+            f"Race: {self.get_race_name(race)}\n"
+            f"Please provide a single sentence describing their physical appearance. "
+            f"Focus on height, build, and distinctive features."
+        )
+        return self.get_response_from_gpt(physical_prompt, "physical_description")
+
+    def compact_attributes_schema(self):
+        move_schema = {
+            "type": "object",
+            "properties": {
+                "MoveName": {"type": "string", "maxLength": 35},
+                "MoveDesc": {"type": "string", "maxLength": 75}
+            },
+            "required": ["MoveName", "MoveDesc"]
+        }
+        return {
+            "type": "object",
+            "properties": {
+                "Age": {"type": "integer", "minimum": 16, "maximum": 50},
+                "Style": {"type": "integer", "minimum": 1, "maximum": 17, "description": WRESTLING_STYLES.strip().replace("\n", ", ")},
+                "Race": {"type": "integer", "minimum": 1, "maximum": 9, "description": RACES.strip().replace("\n", ", ")},
+                "Alignment": {"enum": ["face", "heel"]},
+                "FaceGimmick": {"type": "string", "description": "A couple of words for their face gimmick"},
+                "HeelGimmick": {"type": "string", "description": "A couple of words for their heel gimmick"},
+                "SkillPreset": {"enum": [preset["name"] for preset in self.skill_presets]},
+                "Roles": {"type": "object", "properties": {role: {"type": "boolean"} for role in ROLE_KEYS}},
+                "Languages": {
+                    "type": "object",
+                    "description": "Fluency 1-4, English is always 4",
+                    "properties": {lang: {"type": "integer", "minimum": 1, "maximum": 4} for lang in DEFAULT_ROLES_LANG_BODY["Languages"]}
+                },
+                "BodyType": {"type": "integer", "minimum": 1, "maximum": 7},
+                "Finishers": {
+                    "type": "object",
+                    "properties": {key: move_schema for key in DEFAULT_FINISHERS}
+                },
+                "RegionPopularity": {
+                    "type": "object",
+                    "properties": {region: {"enum": POPULARITY_CATEGORIES} for region in POPULARITY_REGIONS}
+                },
+                "PhysicalDescription": {"type": "string", "description": "One sentence on height, build and distinctive features"}
+            },
+            "required": [
+                "Age", "Style", "Race", "Alignment", "FaceGimmick", "HeelGimmick", "SkillPreset", "Roles",
+                "Languages", "BodyType", "Finishers", "RegionPopularity", "PhysicalDescription"
+            ]
+        }
+
+    def get_compact_attributes_from_gpt(self, name, description, gender, bio):
+        prompt = (
+            f"Wrestler name: {name}\n"
+            f"Gender: {gender}\n"
+            f"Description: {description}\n"
+            f"Biography: {bio}\n\n"
+            "Fill in this wrestler's attributes. Finishers are a 'Finisher', a 'SecondaryFinisher' and an 'UberFinisher', "
+            "each with a short unique name. Respond with a single JSON object matching this JSON schema:\n"
+            f"{json.dumps(self.compact_attributes_schema())}"
+        )
+        data = {}
+        attempts = 0
+        error = None
+        while attempts < 3 and not data:
+            attempts += 1
+            try:
+                content = self.chat_completion(prompt, "compact_attributes", validate=is_json_object, refresh=attempts > 1, response_format={"type": "json_object"})
+            except Exception as e:
+                error = e
+                break
+            try:
+                data = json.loads(content)
+            except ValueError as e:
+                error = e
+            if not isinstance(data, dict):
+                data = {}
+                error = ValueError("the response was not a JSON object")
+        if not data:
+            self.record_fallback("compact_attributes", error)
+        return self.validate_compact_attributes(data, name, description, gender)
+
+    def validate_compact_attributes(self, data, name, description, gender):
+        roles_lang_body = copy.deepcopy(DEFAULT_ROLES_LANG_BODY)
+        roles = data.get("Roles")
+        if isinstance(roles, dict):
+            for role in ROLE_KEYS:
+                if isinstance(roles.get(role), bool):
+                    roles_lang_body[role] = roles[role]
+        languages = data.get("Languages")
+        if isinstance(languages, dict):
+            for lang, default in roles_lang_body["Languages"].items():
+                roles_lang_body["Languages"][lang] = int_in_range(languages.get(lang), 1, 4, default)
+        roles_lang_body["Languages"]["English"] = 4
+        roles_lang_body["BodyType"] = int_in_range(data.get("BodyType"), 1, 7, 1)
+
+        moves = copy.deepcopy(DEFAULT_FINISHERS)
+        finishers = data.get("Finishers")
+        if isinstance(finishers, dict):
+            for key in moves:
+                move = finishers.get(key)
+                if isinstance(move, dict) and move.get("MoveName") and move.get("MoveDesc"):
+                    moves[key] = {"MoveName": str(move["MoveName"]), "MoveDesc": str(move["MoveDesc"])}
+
+        popularity = {region: "Unknown" for region in POPULARITY_REGIONS}
+        region_popularity = data.get("RegionPopularity")
+        if isinstance(region_popularity, dict):
+            for region in POPULARITY_REGIONS:
+                if region_popularity.get(region) in POPULARITY_CATEGORIES:
+                    popularity[region] = region_popularity[region]
+
+        alignment = str(data.get("Alignment", "")).strip().lower()
+        face_gimmick = str(data.get("FaceGimmick") or "").strip()
+        heel_gimmick = str(data.get("HeelGimmick") or "").strip()
+
+        return {
+            "age": int_in_range(data.get("Age"), 16, 50, 30),
+            "style": int_in_range(data.get("Style"), 1, 17, 1),
+            "race": int_in_range(data.get("Race"), 1, 9, 9),
+            "alignment": alignment == "face" if alignment in ("face", "heel") else random.choice([True, False]),
+            "gimmick_face": face_gimmick or self.generate_gimmick(name, description, gender, "face"),
+            "gimmick_heel": heel_gimmick or self.generate_gimmick(name, description, gender, "heel"),
+            "preset": str(data.get("SkillPreset", "")).strip(),
+            "roles_lang_body": roles_lang_body,
+            "moves": moves,
+            "popularity": popularity,
+            "physical": str(data.get("PhysicalDescription") or "").strip()
+        }
 
     def get_region_popularity_from_gpt(self, name, bio, description):
         prompt = (
@@ -1270,28 +2133,18 @@ class WrestleverseApp:
             "Return JSON only."
         )
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
+            content = self.chat_completion(
+                prompt, "region_popularity",
+                validate=lambda text: is_json_object(text) and all(key in json.loads(text) for key in POPULARITY_REGIONS)
             )
-            content = response.choices[0].message.content.strip()
             popularity_data = json.loads(content)
-            required_keys = ["America","Canada","Mexico","British Isles","Japan","Europe","Oceania","India"]
-            if all(key in popularity_data for key in required_keys):
+            if all(key in popularity_data for key in POPULARITY_REGIONS):
                 return popularity_data
             else:
-                return {r: "Unknown" for r in required_keys}
-        except:
-            return {
-                "America": "Unknown",
-                "Canada": "Unknown",
-                "Mexico": "Unknown",
-                "British Isles": "Unknown",
-                "Japan": "Unknown",
-                "Europe": "Unknown",
-                "Oceania": "Unknown",
-                "India": "Unknown"
-            }
+                return {r: "Unknown" for r in POPULARITY_REGIONS}
+        except Exception as e:
+            self.record_fallback("region_popularity", e)
+            return {r: "Unknown" for r in POPULARITY_REGIONS}
 
     def convert_popularity_categories_to_values(self, categories):
         def range_for_category(cat):
@@ -1337,13 +2190,7 @@ class WrestleverseApp:
             prompt += f" The wrestler's gimmick or description is: {description}."
         if gender:
             prompt += f" The wrestler is {gender}."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return self.chat_completion(prompt, "wrestler_name")
 
     def generate_gimmick(self, name, description, gender, alignment):
         prompt = f"Generate a wrestling gimmick for a {alignment} wrestler. Return only a couple of words for the gimmick and not other text."
@@ -1353,13 +2200,7 @@ class WrestleverseApp:
             prompt += f" Description: {description}."
         if gender:
             prompt += f" Gender: {gender}."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return self.chat_completion(prompt, "gimmick")
 
     def generate_bio(self, name, gender, description, skill_preset_name):
         prompt = self.bio_prompt
@@ -1371,13 +2212,7 @@ class WrestleverseApp:
             prompt += f" Description: {description}."
         if skill_preset_name:
             prompt += f" Their wrestling style is best described as {skill_preset_name}."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return self.chat_completion(prompt, "wrestler_bio")
 
     def select_skill_preset_with_chatgpt(self, name, description, gender):
         preset_names = [preset["name"] for preset in self.skill_presets]
@@ -1389,13 +2224,7 @@ class WrestleverseApp:
             prompt += f"Gender: {gender}\n"
         prompt += "Available Skill Presets: " + ", ".join(preset_names) + "\n"
         prompt += "Provide only the name of the most suitable skill preset."
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        selected_preset_name = response.choices[0].message.content.strip()
+        selected_preset_name = self.chat_completion(prompt, "skill_preset")
         return selected_preset_name
 
     def generate_skills(self, uid, skill_preset):
@@ -1411,85 +2240,6 @@ class WrestleverseApp:
             skills[skill] = value
         return skills
 
-    def open_settings(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        settings_title = ttk.Label(self.root, text="Settings", font=("Helvetica", 16))
-        settings_title.pack(pady=10)
-        
-        api_key_label = ttk.Label(self.root, text="ChatGPT API Key:")
-        api_key_label.pack(pady=5)
-        self.api_key_var = tk.StringVar(value=self.api_key)
-        api_key_entry = ttk.Entry(self.root, textvariable=self.api_key_var, width=50)
-        api_key_entry.pack(pady=5)
-        
-        uid_start_label = ttk.Label(self.root, text="UID Start:")
-        uid_start_label.pack(pady=5)
-        self.uid_start_var = tk.IntVar(value=self.uid_start)
-        uid_start_entry = ttk.Entry(self.root, textvariable=self.uid_start_var, width=10)
-        uid_start_entry.pack(pady=5)
-        
-        bio_prompt_label = ttk.Label(self.root, text="Bio Prompt:")
-        bio_prompt_label.pack(pady=5)
-        self.bio_prompt_var = tk.StringVar(value=self.bio_prompt)
-        bio_prompt_entry = ttk.Entry(self.root, textvariable=self.bio_prompt_var, width=50)
-        bio_prompt_entry.pack(pady=5)
-        
-        access_db_label = ttk.Label(self.root, text="Access Database Path (Optional):")
-        access_db_label.pack(pady=5)
-        self.access_db_var = tk.StringVar(value=self.access_db_path)
-        access_db_entry = ttk.Entry(self.root, textvariable=self.access_db_var, width=50)
-        access_db_entry.pack(pady=5)
-        browse_db_btn = ttk.Button(self.root, text="Browse", command=self.browse_access_db)
-        browse_db_btn.pack(pady=5)
-        
-        pictures_label = ttk.Label(self.root, text="Pictures Path (Optional):")
-        pictures_label.pack(pady=5)
-        self.pictures_var = tk.StringVar(value=self.pictures_path)
-        pictures_entry = ttk.Entry(self.root, textvariable=self.pictures_var, width=50)
-        pictures_entry.pack(pady=5)
-        browse_pics_btn = ttk.Button(self.root, text="Browse", command=self.browse_pictures_path)
-        browse_pics_btn.pack(pady=5)
-
-        start_date_label = ttk.Label(self.root, text="Start Date (YYYY-MM-DD):")
-        start_date_label.pack(pady=5)
-        self.start_date_var = tk.StringVar(value=self.start_date_str)
-        start_date_entry = ttk.Entry(self.root, textvariable=self.start_date_var, width=15)
-        start_date_entry.pack(pady=5)
-        
-        save_btn = ttk.Button(self.root, text="Save", command=self.save_settings)
-        save_btn.pack(pady=10)
-        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
-        back_btn.pack(side="bottom", pady=10)
-
-    def browse_access_db(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Access Database Files", "*.accdb;*.mdb")])
-        if file_path:
-            self.access_db_var.set(file_path)
-
-    def save_settings(self):
-        self.api_key = self.api_key_var.get()
-        self.uid_start = self.uid_start_var.get()
-        self.bio_prompt = self.bio_prompt_var.get()
-        self.access_db_path = self.access_db_var.get()
-        self.pictures_path = self.pictures_var.get()
-        self.start_date_str = self.start_date_var.get()
-        settings = {
-            "api_key": self.api_key,
-            "uid_start": self.uid_start,
-            "bio_prompt": self.bio_prompt,
-            "access_db_path": self.access_db_path,
-            "pictures_path": self.pictures_path,
-            "start_date": self.start_date_str
-        }
-        with open("settings.json", "w") as settings_file:
-            json.dump(settings, settings_file)
-        messagebox.showinfo("Settings", "Settings saved successfully!")
-        if self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
-        else:
-            self.client = None
-
     def load_settings(self):
         try:
             with open("settings.json", "r") as settings_file:
@@ -1500,6 +2250,29 @@ class WrestleverseApp:
                 self.access_db_path = settings.get("access_db_path", "")
                 self.pictures_path = settings.get("pictures_path", "")
                 self.start_date_str = settings.get("start_date", "")
+                self.concurrency = settings.get("concurrency", 4)
+                self.compact_mode = settings.get("compact_mode", False)
+                self.cache_enabled = settings.get("cache_enabled", True)
+                self.cache_ttl_days = settings.get("cache_ttl_days", 30)
+                self.cache_max_entries = settings.get("cache_max_entries", 50000)
+                self.fast_executemany = settings.get("fast_executemany", False)
+                self.image_concurrency = settings.get("image_concurrency", 3)
+                self.image_requests_per_minute = settings.get("image_requests_per_minute", 5)
+                self.image_b64 = settings.get("image_b64", True)
+                self.image_model = settings.get("image_model", "dall-e-3")
+                self.image_size = settings.get("image_size", "1024x1024")
+                self.company_master_image = settings.get("company_master_image", False)
+                self.workers_jsonl_path = settings.get("workers_jsonl_path", "")
+                self.max_retries = settings.get("max_retries", 5)
+                self.chat_requests_per_minute = settings.get("chat_requests_per_minute", 500)
+                self.chat_tokens_per_minute = settings.get("chat_tokens_per_minute", 60000)
+                self.log_level = settings.get("log_level", "INFO")
+                self.structured_events = settings.get("structured_events", False)
+                self.model_backend = settings.get("model_backend", "openai")
+                self.fake_latency_ms = settings.get("fake_latency_ms", 100)
+                self.fake_latency_sigma = settings.get("fake_latency_sigma", 0.5)
+                self.fake_failure_rate = settings.get("fake_failure_rate", 0.0)
+                self.fake_seed = settings.get("fake_seed", 0)
         except FileNotFoundError:
             self.api_key = ""
             self.uid_start = 1
@@ -1507,89 +2280,40 @@ class WrestleverseApp:
             self.access_db_path = ""
             self.pictures_path = ""
             self.start_date_str = ""
-
-    def open_skill_presets(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        title_label = ttk.Label(self.root, text="Skill Presets", font=("Helvetica", 16))
-        title_label.pack(pady=10)
-        presets_frame = ttk.Frame(self.root)
-        presets_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        self.presets_listbox = tk.Listbox(presets_frame)
-        self.presets_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar = ttk.Scrollbar(presets_frame, orient="vertical", command=self.presets_listbox.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.presets_listbox.config(yscrollcommand=scrollbar.set)
-        self.presets_listbox.delete(0, tk.END)
-        for preset in self.skill_presets:
-            self.presets_listbox.insert("end", preset["name"])
-        buttons_frame = ttk.Frame(self.root)
-        buttons_frame.pack(pady=10)
-        add_btn = ttk.Button(buttons_frame, text="Add Preset", command=self.add_skill_preset)
-        add_btn.pack(side="left", padx=5)
-        edit_btn = ttk.Button(buttons_frame, text="Edit Preset", command=self.edit_skill_preset)
-        edit_btn.pack(side="left", padx=5)
-        delete_btn = ttk.Button(buttons_frame, text="Delete Preset", command=self.delete_skill_preset)
-        delete_btn.pack(side="left", padx=5)
-        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
-        back_btn.pack(side="bottom", pady=10)
-
-    def add_skill_preset(self):
-        self.preset_window = tk.Toplevel(self.root)
-        self.preset_window.title("Add Skill Preset")
-        self.preset_window.geometry("400x500")
-        name_label = ttk.Label(self.preset_window, text="Preset Name:")
-        name_label.pack(pady=5)
-        self.preset_name_var = tk.StringVar()
-        name_entry = ttk.Entry(self.preset_window, textvariable=self.preset_name_var)
-        name_entry.pack(pady=5)
-        container = ttk.Frame(self.preset_window)
-        container.pack(fill="both", expand=True)
-        canvas = tk.Canvas(container)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        scrollbar.pack(side="right", fill="y")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        skills_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=skills_frame, anchor='nw')
-        self.skill_entries = {}
-        for i, skill in enumerate(self.get_all_skills()):
-            row = ttk.Frame(skills_frame)
-            row.pack(fill="x", pady=2)
-            skill_label = ttk.Label(row, text=skill, width=15)
-            skill_label.pack(side="left")
-            min_var = tk.IntVar(value=20)
-            max_var = tk.IntVar(value=90)
-            if skill in self.get_skills_with_defaults():
-                default_value = self.get_skills_with_defaults()[skill]
-                min_var.set(default_value)
-                max_var.set(default_value)
-            min_entry = ttk.Entry(row, textvariable=min_var, width=5)
-            min_entry.pack(side="left", padx=5)
-            max_entry = ttk.Entry(row, textvariable=max_var, width=5)
-            max_entry.pack(side="left", padx=5)
-            self.skill_entries[skill] = {"min": min_var, "max": max_var}
-        save_btn = ttk.Button(self.preset_window, text="Save Preset", command=self.save_new_preset)
-        save_btn.pack(pady=10)
+            self.concurrency = 4
+            self.compact_mode = False
+            self.cache_enabled = True
+            self.cache_ttl_days = 30
+            self.cache_max_entries = 50000
+            self.fast_executemany = False
+            self.image_concurrency = 3
+            self.image_requests_per_minute = 5
+            self.image_b64 = True
+            self.image_model = "dall-e-3"
+            self.image_size = "1024x1024"
+            self.company_master_image = False
+            self.workers_jsonl_path = ""
+            self.max_retries = 5
+            self.chat_requests_per_minute = 500
+            self.chat_tokens_per_minute = 60000
+            self.log_level = "INFO"
+            self.structured_events = False
+            self.model_backend = "openai"
+            self.fake_latency_ms = 100
+            self.fake_latency_sigma = 0.5
+            self.fake_failure_rate = 0.0
+            self.fake_seed = 0
 
     def get_style_from_gpt(self, bio):
         prompt = (
             "Based on this wrestler's biography, select the most appropriate wrestling style number from this list:\n"
-            "1-Regular\n2-Entertainer\n3-Comedy\n4-Powerhouse\n5-Impactful\n6-Striker\n"
-            "7-Brawler\n8-Hardcore\n9-Psychopath\n10-Luchador\n11-High Flyer\n"
-            "12-Technician\n13-Technician Flyer\n14-Technician Striker\n15-Daredevil\n"
-            "16-MMA Crossover\n17-Never Wrestles\n\n"
+            f"{WRESTLING_STYLES}\n"
             f"Biography: {bio}\n\n"
             "Respond with ONLY the number (1-17)."
         )
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
-            )
-            style_text = response.choices[0].message.content.strip()
+            style_text = self.chat_completion(prompt, "style", validate=lambda text: int_in_range(text, 1, 17, None) is not None)
             try:
                 style = int(style_text)
                 if 1 <= style <= 17:
@@ -1597,146 +2321,29 @@ class WrestleverseApp:
             except ValueError:
                 pass
             return 1
-        except:
+        except Exception as e:
+            self.record_fallback("style", e)
             return 1
 
-    def save_new_preset(self):
-        preset_name = self.preset_name_var.get().strip()
-        if not preset_name:
-            messagebox.showerror("Error", "Preset name cannot be empty.")
-            return
-        if any(preset["name"] == preset_name for preset in self.skill_presets):
-            messagebox.showerror("Error", "A preset with that name already exists.")
-            return
-        preset_skills = {}
-        for skill, vars in self.skill_entries.items():
-            try:
-                min_value = int(vars["min"].get())
-                max_value = int(vars["max"].get())
-                if not (0 <= min_value <= 100) or not (0 <= max_value <= 100):
-                    raise ValueError
-                if min_value > max_value:
-                    messagebox.showerror("Error", f"For skill {skill}, min value cannot be greater than max value.")
-                    return
-                preset_skills[skill] = {"min": min_value, "max": max_value}
-            except ValueError:
-                messagebox.showerror("Error", f"Invalid input for skill {skill}.")
-                return
-        new_preset = {
-            "name": preset_name,
-            "skills": preset_skills
-        }
-        self.skill_presets.append(new_preset)
-        self.save_skill_presets()
-        messagebox.showinfo("Success", "Skill preset saved successfully.")
-        self.preset_window.destroy()
-        self.open_skill_presets()
-
-    def edit_skill_preset(self):
-        selected_indices = self.presets_listbox.curselection()
-        if not selected_indices:
-            messagebox.showerror("Error", "Please select a preset to edit.")
-            return
-        index = selected_indices[0]
-        preset = self.skill_presets[index]
-        self.preset_window = tk.Toplevel(self.root)
-        self.preset_window.title("Edit Skill Preset")
-        self.preset_window.geometry("400x500")
-        name_label = ttk.Label(self.preset_window, text="Preset Name:")
-        name_label.pack(pady=5)
-        self.preset_name_var = tk.StringVar(value=preset["name"])
-        name_entry = ttk.Entry(self.preset_window, textvariable=self.preset_name_var)
-        name_entry.pack(pady=5)
-        container = ttk.Frame(self.preset_window)
-        container.pack(fill="both", expand=True)
-        canvas = tk.Canvas(container)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        scrollbar.pack(side="right", fill="y")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        skills_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=skills_frame, anchor='nw')
-        self.skill_entries = {}
-        for i, skill in enumerate(self.get_all_skills()):
-            row = ttk.Frame(skills_frame)
-            row.pack(fill="x", pady=2)
-            skill_label = ttk.Label(row, text=skill, width=15)
-            skill_label.pack(side="left")
-            min_var = tk.IntVar()
-            max_var = tk.IntVar()
-            min_var.set(preset["skills"][skill]["min"])
-            max_var.set(preset["skills"][skill]["max"])
-            min_entry = ttk.Entry(row, textvariable=min_var, width=5)
-            min_entry.pack(side="left", padx=5)
-            max_entry = ttk.Entry(row, textvariable=max_var, width=5)
-            max_entry.pack(side="left", padx=5)
-            self.skill_entries[skill] = {"min": min_var, "max": max_var}
-        save_btn = ttk.Button(self.preset_window, text="Save Preset", command=lambda: self.save_edited_preset(index))
-        save_btn.pack(pady=10)
-
-    def save_edited_preset(self, index):
-        preset_name = self.preset_name_var.get().strip()
-        if not preset_name:
-            messagebox.showerror("Error", "Preset name cannot be empty.")
-            return
-        if any(i != index and preset["name"] == preset_name for i, preset in enumerate(self.skill_presets)):
-            messagebox.showerror("Error", "A preset with that name already exists.")
-            return
-        preset_skills = {}
-        for skill, vars in self.skill_entries.items():
-            try:
-                min_value = int(vars["min"].get())
-                max_value = int(vars["max"].get())
-                if not (0 <= min_value <= 100) or not (0 <= max_value <= 100):
-                    raise ValueError
-                if min_value > max_value:
-                    messagebox.showerror("Error", f"For skill {skill}, min value cannot be greater than max value.")
-                    return
-                preset_skills[skill] = {"min": min_value, "max": max_value}
-            except ValueError:
-                messagebox.showerror("Error", f"Invalid input for skill {skill}.")
-                return
-        self.skill_presets[index]["name"] = preset_name
-        self.skill_presets[index]["skills"] = preset_skills
-        self.save_skill_presets()
-        messagebox.showinfo("Success", "Skill preset updated successfully.")
-        self.preset_window.destroy()
-        self.open_skill_presets()
-
-    def delete_skill_preset(self):
-        selected_indices = self.presets_listbox.curselection()
-        if not selected_indices:
-            messagebox.showerror("Error", "Please select a preset to delete.")
-            return
-        index = selected_indices[0]
-        preset = self.skill_presets[index]
-        confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the preset '{preset['name']}'?")
-        if confirm:
-            del self.skill_presets[index]
-            self.save_skill_presets()
-            messagebox.showinfo("Success", "Skill preset deleted successfully.")
-            self.open_skill_presets()
-
-    def load_skill_presets(self):
-        try:
-            with open("skill_presets.json", "r") as f:
-                self.skill_presets = json.load(f)
-        except FileNotFoundError:
-            skills_list = self.get_all_skills()
-            skills_with_defaults = self.get_skills_with_defaults()
-            default_preset = {
-                "name": "Default",
-                "skills": {}
-            }
-            for skill in skills_list:
-                if skill in skills_with_defaults:
-                    default_value = skills_with_defaults[skill]
-                    default_preset["skills"][skill] = {"min": default_value, "max": default_value}
-                else:
-                    default_preset["skills"][skill] = {"min": 20, "max": 90}
-            self.skill_presets = [default_preset]
-            self.save_skill_presets()
+    def load_skill_presets(self):
+        try:
+            with open("skill_presets.json", "r") as f:
+                self.skill_presets = json.load(f)
+        except FileNotFoundError:
+            skills_list = self.get_all_skills()
+            skills_with_defaults = self.get_skills_with_defaults()
+            default_preset = {
+                "name": "Default",
+                "skills": {}
+            }
+            for skill in skills_list:
+                if skill in skills_with_defaults:
+                    default_value = skills_with_defaults[skill]
+                    default_preset["skills"][skill] = {"min": default_value, "max": default_value}
+                else:
+                    default_preset["skills"][skill] = {"min": 20, "max": 90}
+            self.skill_presets = [default_preset]
+            self.save_skill_presets()
 
     def save_skill_presets(self):
         with open("skill_presets.json", "w") as f:
@@ -1775,56 +2382,52 @@ class WrestleverseApp:
             "ScoutRef": 6
         }
 
-    def get_companies(self):
-        if self.access_db_path and os.path.exists(self.access_db_path):
-            try:
-                conn_str = (
-                    r'DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};'
-                    f'DBQ={self.access_db_path};'
-                    'PWD=20YearsOfTEW;'
-                )
-                conn = pyodbc.connect(conn_str)
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT UID, Name FROM tblFed")
-                companies = cursor.fetchall()
-                conn.close()
-                
-                company_list = [(int(company[0]), company[1]) for company in companies]
-                return company_list
-            except Exception as e:
-                logging.error(f"Error getting companies: {e}", exc_info=True)
-                return []
-        return []
+    def open_database(self):
+        if self.access_db_path:
+            return open_tew_database(self.access_db_path, self.fast_executemany)
+        return None
 
-    def generate_contract(self, worker_data, worker_uid, company_choice, contract_uid):
-        companies = self.get_companies()
+    def get_company_directory(self):
+        with self.company_directory_lock:
+            if self.company_directory is None:
+                try:
+                    companies = self.load_companies()
+                except Exception as e:
+                    # Leave the cache empty so the next contract tries the database again
+                    logging.error(f"Error getting companies: {e}", exc_info=True)
+                    return CompanyDirectory([])
+                self.company_directory = CompanyDirectory(companies)
+            return self.company_directory
+
+    def invalidate_company_directory(self):
+        with self.company_directory_lock:
+            self.company_directory = None
+
+    def load_companies(self):
+        database = self.open_database()
+        if not database:
+            return []
+        with database.transaction() as cursor:
+            cursor.execute("SELECT UID, Name FROM tblFed")
+            companies = cursor.fetchall()
+        return [(int(company[0]), company[1]) for company in companies]
+
+    def generate_contract(self, worker_data, worker_uid, company_choice, contract_uid, is_face=None):
+        directory = self.get_company_directory()
         fed_uid = None
         
-        if companies:
+        if directory.companies:
             if company_choice == "Random":
-                company = random.choice(companies)
-                fed_uid = company[0]
+                fed_uid = directory.random_uid()
             elif company_choice == "Freelancer":
                 return None
             else:
-                for company in companies:
-                    if company[1] == company_choice:
-                        fed_uid = company[0]
-                        break
+                fed_uid = directory.uid_for(company_choice)
                 if fed_uid is None:
                     return None
 
-        alignment_prompt = f"For a wrestler named {worker_data['name']}, should they be face or heel? Answer with 'face' or 'heel'."
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": alignment_prompt}]
-            )
-            alignment = response.choices[0].message.content.strip().lower()
-            is_face = (alignment == "face")
-        except:
-            is_face = random.choice([True, False])
+        if is_face is None:
+            is_face = self.get_alignment_from_gpt(worker_data['name'])
 
         contract_began_year = self.start_date.year - random.randint(1,5)
         contract_began_month = random.randint(1,12)
@@ -1901,150 +2504,121 @@ class WrestleverseApp:
         prompt = (
             f"Based on the name '{name}' and description '{description}', select the most appropriate "
             "race from this list and respond with ONLY the corresponding number:\n"
-            "1: White\n2: Black\n3: Asian\n4: Hispanic\n5: American Indian\n"
-            "6: Middle Eastern\n7: South Asian\n8: Pacific\n9: Other\n"
+            f"{RACES}"
             "Respond with only the number."
         )
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
-            )
-            race_str = response.choices[0].message.content.strip()
+            race_str = self.chat_completion(prompt, "race", validate=lambda text: int_in_range(text, 1, 9, None) is not None)
             race = int(race_str)
             if 1 <= race <= 9:
                 return race
             return 9
-        except:
+        except ValueError:
             return 9
+        except Exception as e:
+            self.record_fallback("race", e)
+            return 9
+
+    def chat_completion(self, prompt, label, use_cache=True, model="gpt-3.5-turbo", validate=None, refresh=False, **kwargs):
+        # Only answers that pass validate are cached; refresh skips the cached answer but stores the new one
+        messages = [{"role": "user", "content": prompt}]
+        key = None
+        if use_cache and self.response_cache.enabled:
+            key = self.response_cache.make_key(model, messages, kwargs)
+            cached = None if refresh else self.response_cache.get(key)
+            if cached is not None and (validate is None or validate(cached)):
+                self.metrics.record(label, "cache_hits")
+                return cached
+        # Roughly four characters per token, plus room for the answer
+        tokens = len(prompt) // 4 + kwargs.get("max_tokens", 200)
+        response = self.call_with_retries(
+            label,
+            lambda: self.get_client().chat.completions.with_raw_response.create(
+                model=model,
+                messages=messages,
+                **kwargs
+            ),
+            [(self.chat_request_limiter, 1), (self.chat_token_limiter, tokens)]
+        )
+        content = response.choices[0].message.content.strip()
+        if key and (validate is None or validate(content)):
+            self.response_cache.put(key, model, content)
+        return content
 
-    def get_response_from_gpt(self, prompt):
+    def get_response_from_gpt(self, prompt, label="general"):
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.choices[0].message.content.strip()
-        except:
+            return self.chat_completion(prompt, label)
+        except Exception as e:
+            self.record_fallback(label, e)
             return ""
 
-    def open_image_generator(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        title_label = ttk.Label(self.root, text="Image Generator", font=("Helvetica", 16))
-        title_label.pack(pady=20)
-        
-        generate_wrestler_images_btn = ttk.Button(self.root, text="Generate Wrestler Images", command=self.generate_wrestler_images)
-        generate_wrestler_images_btn.pack(pady=10)
-        
-        generate_company_images_btn = ttk.Button(self.root, text="Generate Company Images", command=self.generate_company_images)
-        generate_company_images_btn.pack(pady=10)
-        
-        self.status_label = ttk.Label(self.root, text="")
-        self.status_label.pack(pady=10)
-        
-        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
-        back_btn.pack(side="bottom", pady=10)
-
     def generate_wrestler_images(self):
-        if not self.api_key:
-            messagebox.showerror("Error", "Please set your API key in settings first.")
+        if not self.api_key and self.model_backend != "fake":
+            self.notify("error", "Error", "Please set your API key in settings first.")
             return
         
         if not self.pictures_path:
-            messagebox.showerror("Error", "Please set your pictures path in settings first.")
+            self.notify("error", "Error", "Please set your pictures path in settings first.")
             return
         
         try:
-            excel_path = "wrestleverse_workers.xlsx"
-            if not os.path.exists(excel_path):
-                messagebox.showerror("Error", "Wrestlers Excel file not found.")
+            df = self.worker_store.frame("Notes")
+            if df.empty:
+                self.notify("error", "Error", "No generated wrestlers found.")
                 return
             
             people_dir = os.path.join(self.pictures_path, "People")
             os.makedirs(people_dir, exist_ok=True)
             
-            df = pd.read_excel(excel_path, sheet_name="Notes")
-            pending_images = df[df['image_generated'] == False]
+            generated_pictures = self.image_status.done("worker")
+            pending_images = df[(df['image_generated'] == False) & ~df['Picture'].isin(generated_pictures)]
             
             if pending_images.empty:
-                messagebox.showinfo("Info", "No pending images to generate.")
+                self.notify("info", "Info", "No pending images to generate.")
                 return
             
-            total_images = len(pending_images)
-            generated_count = 0
-            
-            self.status_label.config(text=f"Generating images: 0/{total_images}")
-            self.root.update_idletasks()
-            
+            jobs = []
             for index, row in pending_images.iterrows():
-                try:
-                    prompt = (
-                        f"Professional wrestling promotional photo. {row['physical_description']} "
-                        "The image should be a high-quality, professional headshot style photo "
-                        "with good lighting and a neutral background. The subject should be "
-                        "looking directly at the camera with a confident expression."
-                    )
-                    
-                    response = self.client.images.generate(
-                        model="dall-e-3",
-                        prompt=prompt,
-                        size="1024x1024",
-                        quality="standard",
-                        n=1,
-                    )
-                    
-                    image_url = response.data[0].url
-                    response = requests.get(image_url)
-                    response.raise_for_status()
-                    
-                    resized_image = self.resize_image(response.content, (150, 150))
-                    
-                    image_name = row['Picture'][:26]
-                    image_path = os.path.join(people_dir, image_name)
-                    
-                    with open(image_path, 'wb') as f:
-                        f.write(resized_image)
-                    
-                    df.at[index, 'image_generated'] = True
-                    generated_count += 1
-                    
-                    self.status_label.config(text=f"Generating images: {generated_count}/{total_images}")
-                    self.root.update_idletasks()
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logging.error(f"Error generating image for {row['Name']}: {str(e)}")
-                    messagebox.showerror("Error", f"Failed to generate image for {row['Name']}: {str(e)}")
-                    continue
+                prompt = (
+                    f"Professional wrestling promotional photo. {row['physical_description']} "
+                    "The image should be a high-quality, professional headshot style photo "
+                    "with good lighting and a neutral background. The subject should be "
+                    "looking directly at the camera with a confident expression."
+                )
+                jobs.append({
+                    "title": row['Name'],
+                    "prompt": prompt,
+                    "targets": [image_target("worker", row['Picture'], (150, 150), os.path.join(people_dir, row['Picture'][:26]))]
+                })
             
-            with pd.ExcelWriter(excel_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-                df.to_excel(writer, sheet_name="Notes", index=False)
+            generated_count, failures = self.run_image_jobs(jobs)
+            self.report_image_failures(failures)
             
-            messagebox.showinfo("Success", f"Generated {generated_count} images successfully!")
+            self.notify("info", "Success", f"Generated {generated_count} images successfully!")
             
+        except JobCancelled:
+            self.notify("info", "Info", "Image generation cancelled. Finished images are kept.")
         except Exception as e:
             logging.error(f"Error in generate_wrestler_images: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.notify("error", "Error", f"An error occurred: {str(e)}")
         finally:
-            self.status_label.config("")
-            self.root.update_idletasks()
+            self.set_status("")
 
     def generate_company_images(self):
-        if not self.api_key:
-            messagebox.showerror("Error", "Please set your API key in settings first.")
+        import pandas as pd
+        if not self.api_key and self.model_backend != "fake":
+            self.notify("error", "Error", "Please set your API key in settings first.")
             return
             
         if not self.pictures_path:
-            messagebox.showerror("Error", "Please set your pictures path in settings first.")
+            self.notify("error", "Error", "Please set your pictures path in settings first.")
             return
             
         try:
             excel_path = "wrestleverse_companies.xlsx"
             if not os.path.exists(excel_path):
-                messagebox.showerror("Error", "Companies Excel file not found.")
+                self.notify("error", "Error", "Companies Excel file not found.")
                 return
                 
             logos_dir = os.path.join(self.pictures_path, "Logos")
@@ -2055,123 +2629,190 @@ class WrestleverseApp:
                 os.makedirs(directory, exist_ok=True)
             
             df = pd.read_excel(excel_path, sheet_name="Notes")
+            self.sync_company_image_flags(df)
             pending_images = df[df['image_generated'] == False]
             
             if pending_images.empty:
-                messagebox.showinfo("Info", "No pending images to generate.")
+                self.notify("info", "Info", "No pending images to generate.")
                 return
             
-            total_companies = len(pending_images)
-            generated_count = 0
-            
-            self.status_label.config(text=f"Generating images: 0/{total_companies}")
-            self.root.update_idletasks()
+            done_logos = self.image_status.done("logo")
+            done_banners = self.image_status.done("banner")
+            done_backdrops = self.image_status.done("backdrop")
             
+            jobs = []
             for index, row in pending_images.iterrows():
-                try:
-                    company_name = row['Name']
-                    description = row['Description']
-                    
-                    logo_filename = (row['Logo'].replace('"', '').replace('\\', '')[:26])
-                    banner_filename = (row['Banner'].replace('"', '').replace('\\', '')[:26] + '.jpg')
-                    backdrop_filename = (row['Backdrop'].replace('"', '').replace('\\', '')[:26])
-                    
+                company_name = row['Name']
+                description = row['Description']
+                
+                logo_filename = (row['Logo'].replace('"', '').replace('\\', '')[:26])
+                banner_filename = (row['Banner'].replace('"', '').replace('\\', '')[:26] + '.jpg')
+                backdrop_filename = (row['Backdrop'].replace('"', '').replace('\\', '')[:26])
+                
+                logo_target = image_target("logo", row['Logo'], (150, 150), os.path.join(logos_dir, logo_filename))
+                banner_target = image_target("banner", row['Banner'], (500, 40), os.path.join(banners_dir, banner_filename))
+                backdrop_target = image_target("backdrop", row['Backdrop'], (150, 150), os.path.join(backdrops_dir, backdrop_filename))
+                
+                if self.company_master_image:
+                    # One artwork per company; the three variants are cut from it locally
+                    logo_target["crop"] = "logo"
+                    banner_target["crop"] = "banner"
+                    targets = [
+                        target for target, done in (
+                            (logo_target, done_logos), (banner_target, done_banners), (backdrop_target, done_backdrops)
+                        )
+                        if target["name"] not in done
+                    ]
+                    master_prompt = (
+                        f"Professional wrestling company artwork for \"{company_name}\". "
+                        f"Company description: {description}. "
+                        "Place a bold, memorable logo with the company name in the centre, set against a dramatic "
+                        "arena backdrop in the company's colours, with a strong horizontal band of branding across the image."
+                    )
+                    jobs.append({"title": company_name, "prompt": master_prompt, "targets": targets})
+                    continue
+                
+                if row['Logo'] not in done_logos:
                     logo_prompt = (
                         f"Professional wrestling company logo for \"{company_name}\". "
                         f"Company description: {description}. "
                         "The logo should be professional, memorable, and include the company name. "
                         "Use a transparent or solid background."
                     )
-                    
-                    response = self.client.images.generate(
-                        model="dall-e-3",
-                        prompt=logo_prompt,
-                        size="1024x1024",
-                        quality="standard",
-                        n=1,
-                    )
-                    
-                    image_url = response.data[0].url
-                    response = requests.get(image_url)
-                    response.raise_for_status()
-                    
-                    resized_logo = self.resize_image(response.content, (150, 150))
-                    with open(os.path.join(logos_dir, logo_filename), 'wb') as f:
-                        f.write(resized_logo)
-                    
-                    time.sleep(1)
-                    
+                    jobs.append({"title": company_name, "prompt": logo_prompt, "targets": [logo_target]})
+                
+                if row['Banner'] not in done_banners:
                     banner_prompt = (
                         f"Professional wrestling company banner for \"{company_name}\". "
                         f"Company description: {description}. "
                         "Create a wide promotional banner (1:5 aspect ratio) with dynamic wrestling imagery. "
                         "Include the company name prominently."
                     )
-                    
-                    response = self.client.images.generate(
-                        model="dall-e-3",
-                        prompt=banner_prompt,
-                        size="1024x1024",
-                        quality="standard",
-                        n=1,
-                    )
-                    
-                    image_url = response.data[0].url
-                    response = requests.get(image_url)
-                    response.raise_for_status()
-                    
-                    resized_banner = self.resize_image(response.content, (500, 40))
-                    with open(os.path.join(banners_dir, banner_filename), 'wb') as f:
-                        f.write(resized_banner)
-                    
-                    time.sleep(1)
-                    
+                    jobs.append({"title": company_name, "prompt": banner_prompt, "targets": [banner_target]})
+                
+                if row['Backdrop'] not in done_backdrops:
                     backdrop_prompt = (
                         f"Professional wrestling backdrop for \"{company_name}\". "
                         f"Company description: {description}. "
                         "Create a dramatic arena backdrop with the company's branding."
                     )
-                    
-                    response = self.client.images.generate(
-                        model="dall-e-3",
-                        prompt=backdrop_prompt,
-                        size="1024x1024",
-                        quality="standard",
-                        n=1,
-                    )
-                    
-                    image_url = response.data[0].url
-                    response = requests.get(image_url)
-                    response.raise_for_status()
-                    
-                    resized_backdrop = self.resize_image(response.content, (150, 150))
-                    with open(os.path.join(backdrops_dir, backdrop_filename), 'wb') as f:
-                        f.write(resized_backdrop)
-                    
-                    df.at[index, 'image_generated'] = True
-                    generated_count += 1
-                    
-                    self.status_label.config(text=f"Generating images: {generated_count}/{total_companies}")
-                    self.root.update_idletasks()
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logging.error(f"Error generating images for {company_name}: {str(e)}")
-                    messagebox.showerror("Error", f"Failed to generate images for {company_name}: {str(e)}")
-                    continue
+                    jobs.append({"title": company_name, "prompt": backdrop_prompt, "targets": [backdrop_target]})
+            
+            generated_count, failures = self.run_image_jobs(jobs)
+            self.report_image_failures(failures)
             
+            self.sync_company_image_flags(df)
             with pd.ExcelWriter(excel_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
                 df.to_excel(writer, sheet_name="Notes", index=False)
             
-            messagebox.showinfo("Success", f"Generated images for {generated_count} companies successfully!")
+            self.notify("info", "Success", f"Generated {generated_count} company images successfully!")
             
+        except JobCancelled:
+            self.notify("info", "Info", "Image generation cancelled. Finished images are kept.")
         except Exception as e:
             logging.error(f"Error in generate_company_images: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.notify("error", "Error", f"An error occurred: {str(e)}")
         finally:
-            self.status_label.config(text="")
-            self.root.update_idletasks()
+            self.set_status("")
+
+    def run_image_jobs(self, jobs):
+        total_images = sum(len(job["targets"]) for job in jobs)
+        generated_count = 0
+        failures = []
+        self.report_progress("images", 0, total_images)
+
+        # Downloads run on threads; decode/resize/encode is CPU bound and runs on processes
+        resize_workers = max(1, min(os.cpu_count() or 1, 4))
+        with ThreadPoolExecutor(max_workers=max(1, int(self.image_concurrency or 1))) as executor, \
+                ProcessPoolExecutor(max_workers=resize_workers) as resize_executor:
+            futures = {executor.submit(self.fetch_image_job, job): ("fetch", job) for job in jobs}
+            pending = set(futures)
+            while pending:
+                if self.cancel_event.is_set():
+                    for other in pending:
+                        other.cancel()
+                    raise JobCancelled()
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, job = futures.pop(future)
+                    try:
+                        result = future.result()
+                        if stage == "fetch":
+                            sizes = [(target["size"], target["crop"]) for target in job["targets"]]
+                            resize_future = resize_executor.submit(derive_images, result, sizes)
+                            futures[resize_future] = ("resize", job)
+                            pending.add(resize_future)
+                        else:
+                            for target, image_data in zip(job["targets"], result):
+                                with open(target["path"], 'wb') as f:
+                                    f.write(image_data)
+                                self.image_status.mark(target["kind"], target["name"])
+                                self.log_event("image_generated", kind=target["kind"], name=target["name"])
+                                generated_count += 1
+                    except Exception as e:
+                        logging.error(f"Error generating images for {job['title']}: {str(e)}")
+                        failures.append((job, e))
+                if done:
+                    self.report_progress("images", generated_count, total_images)
+
+        return generated_count, failures
+
+    def report_image_failures(self, failures):
+        if not failures:
+            return
+        names = ", ".join(sorted({job['title'] for job, e in failures})[:10])
+        self.notify(
+            "error",
+            "Error",
+            f"Failed to generate {sum(len(job['targets']) for job, e in failures)} images (for {names}). "
+            f"The last error was: {str(failures[-1][1])}"
+        )
+
+    def fetch_image_job(self, job):
+        # A job with several targets is a master artwork that the company images are cut from
+        label = "image_" + (job["targets"][0]["kind"] if len(job["targets"]) == 1 else "master")
+        response = self.generate_image(job["prompt"], label)
+        if self.image_b64:
+            return base64.b64decode(response.data[0].b64_json)
+        return self.download_image(response.data[0].url)
+
+    def generate_image(self, prompt, label="image"):
+        return self.call_with_retries(
+            label,
+            lambda: self.get_client().images.with_raw_response.generate(
+                model=self.image_model,
+                prompt=prompt,
+                size=self.image_size,
+                quality="standard",
+                n=1,
+                response_format="b64_json" if self.image_b64 else "url",
+            ),
+            [(self.image_rate_limiter, 1)]
+        )
+
+    def download_image(self, image_url):
+        import requests
+        with self.http_lock:
+            if self.http_session is None:
+                self.http_session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(10, int(self.image_concurrency or 1)))
+                self.http_session.mount("https://", adapter)
+                self.http_session.mount("http://", adapter)
+            session = self.http_session
+        buffer = io.BytesIO()
+        with session.get(image_url, stream=True, timeout=120) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=65536):
+                buffer.write(chunk)
+        return buffer.getvalue()
+
+    def sync_company_image_flags(self, df):
+        generated = (
+            df['Logo'].isin(self.image_status.done("logo")) &
+            df['Banner'].isin(self.image_status.done("banner")) &
+            df['Backdrop'].isin(self.image_status.done("backdrop"))
+        )
+        df.loc[generated, 'image_generated'] = True
 
     def get_race_name(self, race_number):
         race_map = {
@@ -2186,19 +2827,923 @@ class WrestleverseApp:
         }
         return race_map.get(race_number, "Unknown")
 
-    def resize_image(self, image_data, size):
-        image = Image.open(io.BytesIO(image_data))
-        image = image.resize(size, Image.Resampling.LANCZOS)
-        output = io.BytesIO()
-        image.save(output, format='JPEG')
-        return output.getvalue()
+class WrestleverseApp(WrestleverseCore):
+    def __init__(self, root, model_backend=None):
+        self.root = root
+        self.root.title("Wrestleverse")
+        self.root.geometry("600x500")
+        self.job_queue = queue.Queue()
+        self.job_thread = None
+        super().__init__()
+        if model_backend:
+            self.model_backend = model_backend
+        self.wrestlers = []
+        self.companies = []
+        self.setup_main_menu()
 
-    def browse_pictures_path(self):
-        directory = filedialog.askdirectory()
-        if directory:
-            self.pictures_var.set(directory)
+    def add_company_form(self):
+        company_frame = ttk.Frame(self.companies_frame, relief="ridge", borderwidth=2)
+        company_frame.pack(fill="x", pady=5)
+        name_label = ttk.Label(company_frame, text="Name:")
+        name_label.grid(row=0, column=0, padx=5, pady=5)
+        name_entry = ttk.Entry(company_frame)
+        name_entry.grid(row=0, column=1, padx=5, pady=5)
+        description_label = ttk.Label(company_frame, text="Description:")
+        description_label.grid(row=1, column=0, padx=5, pady=5)
+        description_entry = ttk.Entry(company_frame, width=40)
+        description_entry.grid(row=1, column=1, columnspan=3, padx=5, pady=5)
+        size_label = ttk.Label(company_frame, text="Size:")
+        size_label.grid(row=2, column=0, padx=5, pady=5)
+        size_var = tk.StringVar(value="Medium")
+        size_dropdown = ttk.Combobox(company_frame, textvariable=size_var, values=["Tiny", "Small", "Medium", "Large"])
+        size_dropdown.grid(row=2, column=1, padx=5, pady=5)
+        remove_btn = ttk.Button(company_frame, text="❌", command=lambda: self.remove_company_form(company_frame))
+        remove_btn.grid(row=0, column=4, padx=5, pady=5)
+        self.companies.append({
+            "frame": company_frame,
+            "name": name_entry,
+            "description": description_entry,
+            "size": size_var
+        })
+
+    def remove_company_form(self, company_frame):
+        company_frame.destroy()
+        self.companies = [company for company in self.companies if company["frame"] != company_frame]
+
+    def generate_companies(self):
+        logging.debug("generate_companies function was invoked.")
+        
+        if not self.api_key and self.model_backend != "fake":
+            messagebox.showerror("Error", "Please set your API key in settings before generating companies.")
+            logging.error("API key not set.")
+            return
+
+        company_data_list = []
+        for company in self.companies:
+            name = company["name"].get().strip() if company["name"] else ""
+            description = company["description"].get().strip() if company["description"] else ""
+            size = company["size"].get().strip() if company["size"] else "Medium"
+            company_data_list.append({"name": name, "description": description, "size": size})
+
+        journal = CheckpointJournal(COMPANIES_CHECKPOINT_PATH)
+        if journal.exists() and not messagebox.askyesno(
+            "Unfinished Run",
+            "An unfinished company run can still be resumed. Start a new run and discard it?"
+        ):
+            return
+        self.start_job(self.run_company_job, company_data_list, journal)
+
+    def resume_companies(self):
+        if not self.api_key and self.model_backend != "fake":
+            messagebox.showerror("Error", "Please set your API key in settings before generating companies.")
+            return
+        journal = CheckpointJournal(COMPANIES_CHECKPOINT_PATH)
+        if not journal.exists():
+            messagebox.showinfo("Info", "There is no unfinished company run to resume.")
+            return
+        job, completed = journal.load()
+        if not job:
+            messagebox.showerror("Error", "The company checkpoint file could not be read.")
+            return
+        self.start_job(self.run_company_job, job["companies"], journal, job, completed)
+
+    def start_job(self, func, *args):
+        if self.job_thread and self.job_thread.is_alive():
+            messagebox.showerror("Error", "Another job is still running. Wait for it to finish or cancel it first.")
+            return
+        self.job_thread = threading.Thread(target=self.run_job, args=(func, args), daemon=True)
+        self.job_thread.start()
+        self.root.after(100, self.poll_job_queue)
+
+    def cancel_job(self):
+        if self.job_thread and self.job_thread.is_alive():
+            self.cancel_event.set()
+            self.set_status("Status: Cancelling after in-flight requests finish...")
+
+    def poll_job_queue(self):
+        while True:
+            try:
+                action, args = self.job_queue.get_nowait()
+            except queue.Empty:
+                break
+            if action == "status":
+                try:
+                    self.status_label.config(text=args[0])
+                except tk.TclError:
+                    pass
+            elif action == "info":
+                messagebox.showinfo(*args)
+            elif action == "error":
+                messagebox.showerror(*args)
+        if (self.job_thread and self.job_thread.is_alive()) or not self.job_queue.empty():
+            self.root.after(100, self.poll_job_queue)
+
+    def set_status(self, text):
+        self.job_queue.put(("status", (text,)))
+
+    def notify(self, kind, title, message):
+        self.job_queue.put((kind, (title, message)))
+
+    def setup_main_menu(self):
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        title_label = ttk.Label(self.root, text="Wrestleverse", font=("Helvetica", 20))
+        title_label.pack(pady=20)
+        generate_wrestlers_btn = ttk.Button(self.root, text="Generate Wrestlers", command=self.open_wrestler_generator)
+        generate_wrestlers_btn.pack(pady=10)
+        generate_company_btn = ttk.Button(self.root, text="Generate Company", command=self.open_company_generator)
+        generate_company_btn.pack(pady=10)
+        skill_presets_btn = ttk.Button(self.root, text="Skill Presets", command=self.open_skill_presets)
+        skill_presets_btn.pack(pady=10)
+        generate_images_btn = ttk.Button(self.root, text="Generate Images", command=self.open_image_generator)
+        generate_images_btn.pack(pady=10)
+        settings_btn = ttk.Button(self.root, text="⚙ Settings", command=self.open_settings)
+        settings_btn.pack(side="bottom", pady=10)
+
+    def open_company_generator(self):
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        title_label = ttk.Label(self.root, text="Company Generator", font=("Helvetica", 16))
+        title_label.pack(pady=10)
+        add_company_btn = ttk.Button(self.root, text="Add Company", command=self.add_company_form)
+        add_company_btn.pack(pady=10)
+        self.companies_frame = ttk.Frame(self.root)
+        self.companies_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.status_label = ttk.Label(self.root, text="Status: Waiting to generate companies...")
+        self.status_label.pack(pady=10)
+        generate_btn = ttk.Button(self.root, text="Generate Companies", command=self.generate_companies)
+        generate_btn.pack(side="bottom", pady=10)
+        resume_btn = ttk.Button(self.root, text="Resume Last Run", command=self.resume_companies)
+        resume_btn.pack(side="bottom", pady=10)
+        cancel_btn = ttk.Button(self.root, text="Cancel", command=self.cancel_job)
+        cancel_btn.pack(side="bottom", pady=10)
+        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
+        back_btn.pack(side="bottom", pady=10)
+
+    def open_wrestler_generator(self):
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        title_label = ttk.Label(self.root, text="Wrestler Generator", font=("Helvetica", 16))
+        title_label.pack(pady=10)
+        add_wrestler_btn = ttk.Button(self.root, text="Add Wrestler", command=self.add_wrestler_form)
+        add_wrestler_btn.pack(pady=10)
+        self.wrestlers_frame = ttk.Frame(self.root)
+        self.wrestlers_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.status_label = ttk.Label(self.root, text="Status: Waiting to generate wrestlers...")
+        self.status_label.pack(pady=10)
+        generate_btn = ttk.Button(self.root, text="Generate Wrestlers", command=self.generate_wrestlers)
+        generate_btn.pack(side="bottom", pady=10)
+        resume_btn = ttk.Button(self.root, text="Resume Last Run", command=self.resume_wrestlers)
+        resume_btn.pack(side="bottom", pady=10)
+        cancel_btn = ttk.Button(self.root, text="Cancel", command=self.cancel_job)
+        cancel_btn.pack(side="bottom", pady=10)
+        export_btn = ttk.Button(self.root, text="Export to Excel", command=self.export_workers_excel)
+        export_btn.pack(side="bottom", pady=10)
+        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
+        back_btn.pack(side="bottom", pady=10)
+
+    def export_workers_excel(self):
+        try:
+            self.worker_store.export_excel(WORKERS_EXCEL_PATH, self.image_status.done("worker"))
+            messagebox.showinfo("Success", f"Wrestlers exported to {WORKERS_EXCEL_PATH}")
+        except Exception as e:
+            logging.error(f"Error exporting workers: {e}", exc_info=True)
+            messagebox.showerror("Error", f"Could not export workers: {str(e)}")
+
+    def add_wrestler_form(self):
+        wrestler_frame = ttk.Frame(self.wrestlers_frame, relief="ridge", borderwidth=2)
+        wrestler_frame.pack(fill="x", pady=5)
+        name_label = ttk.Label(wrestler_frame, text="Name:")
+        name_label.grid(row=0, column=0, padx=5, pady=5)
+        name_entry = ttk.Entry(wrestler_frame)
+        name_entry.grid(row=0, column=1, padx=5, pady=5)
+        gender_label = ttk.Label(wrestler_frame, text="Gender:")
+        gender_label.grid(row=0, column=2, padx=5, pady=5)
+        gender_var = tk.StringVar(value="Male")
+        gender_dropdown = ttk.Combobox(wrestler_frame, textvariable=gender_var, values=["Male", "Female"])
+        gender_dropdown.grid(row=0, column=3, padx=5, pady=5)
+        company_label = ttk.Label(wrestler_frame, text="Company:")
+        company_label.grid(row=1, column=0, padx=5, pady=5)
+        
+        company_names = ["Random"] + self.get_company_directory().names()
+        
+        company_var = tk.StringVar(value="Random")
+        company_dropdown = ttk.Combobox(wrestler_frame, textvariable=company_var, values=company_names)
+        company_dropdown.grid(row=1, column=1, padx=5, pady=5)
+        exclusive_label = ttk.Label(wrestler_frame, text="Exclusive:")
+        exclusive_label.grid(row=1, column=2, padx=5, pady=5)
+        exclusive_var = tk.StringVar(value="Random")
+        exclusive_dropdown = ttk.Combobox(wrestler_frame, textvariable=exclusive_var, values=["Random", "Yes", "No"])
+        exclusive_dropdown.grid(row=1, column=3, padx=5, pady=5)
+        description_label = ttk.Label(wrestler_frame, text="Description:")
+        description_label.grid(row=2, column=0, padx=5, pady=5)
+        description_entry = ttk.Entry(wrestler_frame, width=40)
+        description_entry.grid(row=2, column=1, columnspan=3, padx=5, pady=5)
+        skill_preset_label = ttk.Label(wrestler_frame, text="Skill Preset:")
+        skill_preset_label.grid(row=3, column=0, padx=5, pady=5)
+        skill_preset_var = tk.StringVar(value="Interpret")
+        skill_preset_names = ["Interpret"] + [preset["name"] for preset in self.skill_presets]
+        skill_preset_dropdown = ttk.Combobox(wrestler_frame, textvariable=skill_preset_var, values=skill_preset_names)
+        skill_preset_dropdown.grid(row=3, column=1, padx=5, pady=5)
+        remove_btn = ttk.Button(wrestler_frame, text="❌", command=lambda: self.remove_wrestler_form(wrestler_frame))
+        remove_btn.grid(row=0, column=4, padx=5, pady=5)
+        self.wrestlers.append({
+            "frame": wrestler_frame,
+            "name": name_entry,
+            "gender": gender_var,
+            "company": company_var,
+            "exclusive": exclusive_var,
+            "description": description_entry,
+            "skill_preset": skill_preset_var
+        })
+
+    def remove_wrestler_form(self, wrestler_frame):
+        wrestler_frame.destroy()
+        self.wrestlers = [wrestler for wrestler in self.wrestlers if wrestler["frame"] != wrestler_frame]
+
+    def generate_wrestlers(self):
+        if not self.api_key and self.model_backend != "fake":
+            messagebox.showerror("Error", "Please set your API key in settings before generating wrestlers.")
+            return
+
+        wrestler_data_list = []
+        for wrestler in self.wrestlers:
+            try:
+                if wrestler["frame"].winfo_exists():
+                    data = {
+                        'name': wrestler["name"].get().strip() if wrestler["name"].winfo_exists() else "",
+                        'gender': wrestler["gender"].get().strip() if hasattr(wrestler["gender"], "get") else "Male",
+                        'company': wrestler["company"].get().strip() if hasattr(wrestler["company"], "get") else "Random",
+                        'exclusive': wrestler["exclusive"].get().strip() if hasattr(wrestler["exclusive"], "get") else "Random",
+                        'description': wrestler["description"].get().strip() if wrestler["description"].winfo_exists() else "",
+                        'skill_preset': wrestler["skill_preset"].get().strip() if hasattr(wrestler["skill_preset"], "get") else "Default"
+                    }
+                    wrestler_data_list.append(data)
+            except (tk.TclError, AttributeError):
+                continue
+
+        journal = CheckpointJournal(WORKERS_CHECKPOINT_PATH)
+        if journal.exists() and not messagebox.askyesno(
+            "Unfinished Run",
+            "An unfinished wrestler run can still be resumed. Start a new run and discard it?"
+        ):
+            return
+        self.start_job(self.run_wrestler_job, wrestler_data_list, journal)
+
+    def resume_wrestlers(self):
+        if not self.api_key and self.model_backend != "fake":
+            messagebox.showerror("Error", "Please set your API key in settings before generating wrestlers.")
+            return
+        journal = CheckpointJournal(WORKERS_CHECKPOINT_PATH)
+        if not journal.exists():
+            messagebox.showinfo("Info", "There is no unfinished wrestler run to resume.")
+            return
+        job, completed = journal.load()
+        if not job:
+            messagebox.showerror("Error", "The wrestler checkpoint file could not be read.")
+            return
+        self.start_job(self.run_wrestler_job, job["roster"], journal, job, completed)
+
+    def open_settings(self):
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        settings_title = ttk.Label(self.root, text="Settings", font=("Helvetica", 16))
+        settings_title.pack(pady=10)
+        
+        api_key_label = ttk.Label(self.root, text="ChatGPT API Key:")
+        api_key_label.pack(pady=5)
+        self.api_key_var = tk.StringVar(value=self.api_key)
+        api_key_entry = ttk.Entry(self.root, textvariable=self.api_key_var, width=50)
+        api_key_entry.pack(pady=5)
+        
+        uid_start_label = ttk.Label(self.root, text="UID Start:")
+        uid_start_label.pack(pady=5)
+        self.uid_start_var = tk.IntVar(value=self.uid_start)
+        uid_start_entry = ttk.Entry(self.root, textvariable=self.uid_start_var, width=10)
+        uid_start_entry.pack(pady=5)
+        
+        bio_prompt_label = ttk.Label(self.root, text="Bio Prompt:")
+        bio_prompt_label.pack(pady=5)
+        self.bio_prompt_var = tk.StringVar(value=self.bio_prompt)
+        bio_prompt_entry = ttk.Entry(self.root, textvariable=self.bio_prompt_var, width=50)
+        bio_prompt_entry.pack(pady=5)
+        
+        access_db_label = ttk.Label(self.root, text="Access Database Path (Optional):")
+        access_db_label.pack(pady=5)
+        self.access_db_var = tk.StringVar(value=self.access_db_path)
+        access_db_entry = ttk.Entry(self.root, textvariable=self.access_db_var, width=50)
+        access_db_entry.pack(pady=5)
+        browse_db_btn = ttk.Button(self.root, text="Browse", command=self.browse_access_db)
+        browse_db_btn.pack(pady=5)
+        
+        pictures_label = ttk.Label(self.root, text="Pictures Path (Optional):")
+        pictures_label.pack(pady=5)
+        self.pictures_var = tk.StringVar(value=self.pictures_path)
+        pictures_entry = ttk.Entry(self.root, textvariable=self.pictures_var, width=50)
+        pictures_entry.pack(pady=5)
+        browse_pics_btn = ttk.Button(self.root, text="Browse", command=self.browse_pictures_path)
+        browse_pics_btn.pack(pady=5)
+
+        start_date_label = ttk.Label(self.root, text="Start Date (YYYY-MM-DD):")
+        start_date_label.pack(pady=5)
+        self.start_date_var = tk.StringVar(value=self.start_date_str)
+        start_date_entry = ttk.Entry(self.root, textvariable=self.start_date_var, width=15)
+        start_date_entry.pack(pady=5)
+
+        workers_jsonl_label = ttk.Label(self.root, text="Stream Wrestlers to JSONL File (Optional):")
+        workers_jsonl_label.pack(pady=5)
+        self.workers_jsonl_var = tk.StringVar(value=self.workers_jsonl_path)
+        workers_jsonl_entry = ttk.Entry(self.root, textvariable=self.workers_jsonl_var, width=50)
+        workers_jsonl_entry.pack(pady=5)
+
+        concurrency_label = ttk.Label(self.root, text="Concurrent Wrestlers:")
+        concurrency_label.pack(pady=5)
+        self.concurrency_var = tk.IntVar(value=self.concurrency)
+        concurrency_entry = ttk.Entry(self.root, textvariable=self.concurrency_var, width=10)
+        concurrency_entry.pack(pady=5)
+
+        image_concurrency_label = ttk.Label(self.root, text="Concurrent Images:")
+        image_concurrency_label.pack(pady=5)
+        self.image_concurrency_var = tk.IntVar(value=self.image_concurrency)
+        image_concurrency_entry = ttk.Entry(self.root, textvariable=self.image_concurrency_var, width=10)
+        image_concurrency_entry.pack(pady=5)
+
+        self.image_b64_var = tk.BooleanVar(value=self.image_b64)
+        image_b64_check = ttk.Checkbutton(self.root, text="Receive images inline (skip the separate download)", variable=self.image_b64_var)
+        image_b64_check.pack(pady=5)
+
+        self.company_master_image_var = tk.BooleanVar(value=self.company_master_image)
+        company_master_image_check = ttk.Checkbutton(self.root, text="One artwork per company (logo, banner and backdrop cut from it)", variable=self.company_master_image_var)
+        company_master_image_check.pack(pady=5)
+
+        self.compact_mode_var = tk.BooleanVar(value=self.compact_mode)
+        compact_mode_check = ttk.Checkbutton(self.root, text="Compact mode (one attribute call per wrestler)", variable=self.compact_mode_var)
+        compact_mode_check.pack(pady=5)
+
+        self.cache_enabled_var = tk.BooleanVar(value=self.cache_enabled)
+        cache_enabled_check = ttk.Checkbutton(self.root, text="Reuse cached responses for repeated prompts", variable=self.cache_enabled_var)
+        cache_enabled_check.pack(pady=5)
+        clear_cache_btn = ttk.Button(self.root, text="Clear Response Cache", command=self.clear_response_cache)
+        clear_cache_btn.pack(pady=5)
+        
+        save_btn = ttk.Button(self.root, text="Save", command=self.save_settings)
+        save_btn.pack(pady=10)
+        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
+        back_btn.pack(side="bottom", pady=10)
+
+    def clear_response_cache(self):
+        self.response_cache.clear()
+        messagebox.showinfo("Settings", "Response cache cleared.")
+
+    def browse_access_db(self):
+        file_path = filedialog.askopenfilename(filetypes=[
+            ("Access Database Files", "*.accdb;*.mdb"),
+            ("SQLite Stand-in Databases", "*.sqlite;*.sqlite3;*.db")
+        ])
+        if file_path:
+            self.access_db_var.set(file_path)
+
+    def save_settings(self):
+        self.api_key = self.api_key_var.get()
+        self.uid_start = self.uid_start_var.get()
+        self.bio_prompt = self.bio_prompt_var.get()
+        self.access_db_path = self.access_db_var.get()
+        self.invalidate_company_directory()
+        self.pictures_path = self.pictures_var.get()
+        self.start_date_str = self.start_date_var.get()
+        self.concurrency = max(1, self.concurrency_var.get())
+        self.image_concurrency = max(1, self.image_concurrency_var.get())
+        self.image_b64 = self.image_b64_var.get()
+        self.company_master_image = self.company_master_image_var.get()
+        self.workers_jsonl_path = self.workers_jsonl_var.get().strip()
+        self.compact_mode = self.compact_mode_var.get()
+        self.cache_enabled = self.cache_enabled_var.get()
+        self.response_cache.enabled = self.cache_enabled
+        settings = {
+            "api_key": self.api_key,
+            "uid_start": self.uid_start,
+            "bio_prompt": self.bio_prompt,
+            "access_db_path": self.access_db_path,
+            "pictures_path": self.pictures_path,
+            "start_date": self.start_date_str,
+            "concurrency": self.concurrency,
+            "compact_mode": self.compact_mode,
+            "cache_enabled": self.cache_enabled,
+            "cache_ttl_days": self.cache_ttl_days,
+            "cache_max_entries": self.cache_max_entries,
+            "fast_executemany": self.fast_executemany,
+            "image_concurrency": self.image_concurrency,
+            "image_requests_per_minute": self.image_requests_per_minute,
+            "image_b64": self.image_b64,
+            "image_model": self.image_model,
+            "image_size": self.image_size,
+            "company_master_image": self.company_master_image,
+            "workers_jsonl_path": self.workers_jsonl_path,
+            "max_retries": self.max_retries,
+            "chat_requests_per_minute": self.chat_requests_per_minute,
+            "chat_tokens_per_minute": self.chat_tokens_per_minute,
+            "log_level": self.log_level,
+            "structured_events": self.structured_events,
+            "model_backend": self.model_backend,
+            "fake_latency_ms": self.fake_latency_ms,
+            "fake_latency_sigma": self.fake_latency_sigma,
+            "fake_failure_rate": self.fake_failure_rate,
+            "fake_seed": self.fake_seed
+        }
+        with open("settings.json", "w") as settings_file:
+            json.dump(settings, settings_file)
+        messagebox.showinfo("Settings", "Settings saved successfully!")
+        self.client = None
+
+    def open_skill_presets(self):
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        title_label = ttk.Label(self.root, text="Skill Presets", font=("Helvetica", 16))
+        title_label.pack(pady=10)
+        presets_frame = ttk.Frame(self.root)
+        presets_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.presets_listbox = tk.Listbox(presets_frame)
+        self.presets_listbox.pack(side="left", fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(presets_frame, orient="vertical", command=self.presets_listbox.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.presets_listbox.config(yscrollcommand=scrollbar.set)
+        self.presets_listbox.delete(0, tk.END)
+        for preset in self.skill_presets:
+            self.presets_listbox.insert("end", preset["name"])
+        buttons_frame = ttk.Frame(self.root)
+        buttons_frame.pack(pady=10)
+        add_btn = ttk.Button(buttons_frame, text="Add Preset", command=self.add_skill_preset)
+        add_btn.pack(side="left", padx=5)
+        edit_btn = ttk.Button(buttons_frame, text="Edit Preset", command=self.edit_skill_preset)
+        edit_btn.pack(side="left", padx=5)
+        delete_btn = ttk.Button(buttons_frame, text="Delete Preset", command=self.delete_skill_preset)
+        delete_btn.pack(side="left", padx=5)
+        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
+        back_btn.pack(side="bottom", pady=10)
+
+    def add_skill_preset(self):
+        self.preset_window = tk.Toplevel(self.root)
+        self.preset_window.title("Add Skill Preset")
+        self.preset_window.geometry("400x500")
+        name_label = ttk.Label(self.preset_window, text="Preset Name:")
+        name_label.pack(pady=5)
+        self.preset_name_var = tk.StringVar()
+        name_entry = ttk.Entry(self.preset_window, textvariable=self.preset_name_var)
+        name_entry.pack(pady=5)
+        container = ttk.Frame(self.preset_window)
+        container.pack(fill="both", expand=True)
+        canvas = tk.Canvas(container)
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
+        scrollbar.pack(side="right", fill="y")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        skills_frame = ttk.Frame(canvas)
+        canvas.create_window((0, 0), window=skills_frame, anchor='nw')
+        self.skill_entries = {}
+        for i, skill in enumerate(self.get_all_skills()):
+            row = ttk.Frame(skills_frame)
+            row.pack(fill="x", pady=2)
+            skill_label = ttk.Label(row, text=skill, width=15)
+            skill_label.pack(side="left")
+            min_var = tk.IntVar(value=20)
+            max_var = tk.IntVar(value=90)
+            if skill in self.get_skills_with_defaults():
+                default_value = self.get_skills_with_defaults()[skill]
+                min_var.set(default_value)
+                max_var.set(default_value)
+            min_entry = ttk.Entry(row, textvariable=min_var, width=5)
+            min_entry.pack(side="left", padx=5)
+            max_entry = ttk.Entry(row, textvariable=max_var, width=5)
+            max_entry.pack(side="left", padx=5)
+            self.skill_entries[skill] = {"min": min_var, "max": max_var}
+        save_btn = ttk.Button(self.preset_window, text="Save Preset", command=self.save_new_preset)
+        save_btn.pack(pady=10)
+
+    def save_new_preset(self):
+        preset_name = self.preset_name_var.get().strip()
+        if not preset_name:
+            messagebox.showerror("Error", "Preset name cannot be empty.")
+            return
+        if any(preset["name"] == preset_name for preset in self.skill_presets):
+            messagebox.showerror("Error", "A preset with that name already exists.")
+            return
+        preset_skills = {}
+        for skill, vars in self.skill_entries.items():
+            try:
+                min_value = int(vars["min"].get())
+                max_value = int(vars["max"].get())
+                if not (0 <= min_value <= 100) or not (0 <= max_value <= 100):
+                    raise ValueError
+                if min_value > max_value:
+                    messagebox.showerror("Error", f"For skill {skill}, min value cannot be greater than max value.")
+                    return
+                preset_skills[skill] = {"min": min_value, "max": max_value}
+            except ValueError:
+                messagebox.showerror("Error", f"Invalid input for skill {skill}.")
+                return
+        new_preset = {
+            "name": preset_name,
+            "skills": preset_skills
+        }
+        self.skill_presets.append(new_preset)
+        self.save_skill_presets()
+        messagebox.showinfo("Success", "Skill preset saved successfully.")
+        self.preset_window.destroy()
+        self.open_skill_presets()
+
+    def edit_skill_preset(self):
+        selected_indices = self.presets_listbox.curselection()
+        if not selected_indices:
+            messagebox.showerror("Error", "Please select a preset to edit.")
+            return
+        index = selected_indices[0]
+        preset = self.skill_presets[index]
+        self.preset_window = tk.Toplevel(self.root)
+        self.preset_window.title("Edit Skill Preset")
+        self.preset_window.geometry("400x500")
+        name_label = ttk.Label(self.preset_window, text="Preset Name:")
+        name_label.pack(pady=5)
+        self.preset_name_var = tk.StringVar(value=preset["name"])
+        name_entry = ttk.Entry(self.preset_window, textvariable=self.preset_name_var)
+        name_entry.pack(pady=5)
+        container = ttk.Frame(self.preset_window)
+        container.pack(fill="both", expand=True)
+        canvas = tk.Canvas(container)
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
+        scrollbar.pack(side="right", fill="y")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        skills_frame = ttk.Frame(canvas)
+        canvas.create_window((0, 0), window=skills_frame, anchor='nw')
+        self.skill_entries = {}
+        for i, skill in enumerate(self.get_all_skills()):
+            row = ttk.Frame(skills_frame)
+            row.pack(fill="x", pady=2)
+            skill_label = ttk.Label(row, text=skill, width=15)
+            skill_label.pack(side="left")
+            min_var = tk.IntVar()
+            max_var = tk.IntVar()
+            min_var.set(preset["skills"][skill]["min"])
+            max_var.set(preset["skills"][skill]["max"])
+            min_entry = ttk.Entry(row, textvariable=min_var, width=5)
+            min_entry.pack(side="left", padx=5)
+            max_entry = ttk.Entry(row, textvariable=max_var, width=5)
+            max_entry.pack(side="left", padx=5)
+            self.skill_entries[skill] = {"min": min_var, "max": max_var}
+        save_btn = ttk.Button(self.preset_window, text="Save Preset", command=lambda: self.save_edited_preset(index))
+        save_btn.pack(pady=10)
+
+    def save_edited_preset(self, index):
+        preset_name = self.preset_name_var.get().strip()
+        if not preset_name:
+            messagebox.showerror("Error", "Preset name cannot be empty.")
+            return
+        if any(i != index and preset["name"] == preset_name for i, preset in enumerate(self.skill_presets)):
+            messagebox.showerror("Error", "A preset with that name already exists.")
+            return
+        preset_skills = {}
+        for skill, vars in self.skill_entries.items():
+            try:
+                min_value = int(vars["min"].get())
+                max_value = int(vars["max"].get())
+                if not (0 <= min_value <= 100) or not (0 <= max_value <= 100):
+                    raise ValueError
+                if min_value > max_value:
+                    messagebox.showerror("Error", f"For skill {skill}, min value cannot be greater than max value.")
+                    return
+                preset_skills[skill] = {"min": min_value, "max": max_value}
+            except ValueError:
+                messagebox.showerror("Error", f"Invalid input for skill {skill}.")
+                return
+        self.skill_presets[index]["name"] = preset_name
+        self.skill_presets[index]["skills"] = preset_skills
+        self.save_skill_presets()
+        messagebox.showinfo("Success", "Skill preset updated successfully.")
+        self.preset_window.destroy()
+        self.open_skill_presets()
+
+    def delete_skill_preset(self):
+        selected_indices = self.presets_listbox.curselection()
+        if not selected_indices:
+            messagebox.showerror("Error", "Please select a preset to delete.")
+            return
+        index = selected_indices[0]
+        preset = self.skill_presets[index]
+        confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the preset '{preset['name']}'?")
+        if confirm:
+            del self.skill_presets[index]
+            self.save_skill_presets()
+            messagebox.showinfo("Success", "Skill preset deleted successfully.")
+            self.open_skill_presets()
+
+    def open_image_generator(self):
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        title_label = ttk.Label(self.root, text="Image Generator", font=("Helvetica", 16))
+        title_label.pack(pady=20)
+        
+        generate_wrestler_images_btn = ttk.Button(self.root, text="Generate Wrestler Images", command=lambda: self.start_job(self.generate_wrestler_images))
+        generate_wrestler_images_btn.pack(pady=10)
+        
+        generate_company_images_btn = ttk.Button(self.root, text="Generate Company Images", command=lambda: self.start_job(self.generate_company_images))
+        generate_company_images_btn.pack(pady=10)
+        
+        self.status_label = ttk.Label(self.root, text="")
+        self.status_label.pack(pady=10)
+        
+        cancel_btn = ttk.Button(self.root, text="Cancel", command=self.cancel_job)
+        cancel_btn.pack(side="bottom", pady=10)
+        
+        back_btn = ttk.Button(self.root, text="Back", command=self.setup_main_menu)
+        back_btn.pack(side="bottom", pady=10)
+
+    def browse_pictures_path(self):
+        directory = filedialog.askdirectory()
+        if directory:
+            self.pictures_var.set(directory)
+
+class WrestleverseCli(WrestleverseCore):
+    def __init__(self):
+        super().__init__()
+        self.errors = 0
+
+    def set_status(self, text):
+        logging.info(text)
+        print(text, file=sys.stderr, flush=True)
+
+    def show_metrics(self, text):
+        super().show_metrics(text)
+        print(text, file=sys.stderr, flush=True)
+
+    def notify(self, kind, title, message):
+        super().notify(kind, title, message)
+        if kind == "error":
+            self.errors += 1
+        print(f"{title}: {message}", file=sys.stderr, flush=True)
+
+class BenchmarkCore(WrestleverseCore):
+    def __init__(self, args):
+        super().__init__()
+        self.api_key = "fake"
+        self.model_backend = "fake"
+        self.fake_latency_ms = args.latency_ms
+        self.fake_latency_sigma = args.latency_sigma
+        self.fake_failure_rate = args.failure_rate
+        self.fake_seed = args.seed
+        self.access_db_path = os.path.join(os.getcwd(), "tew.sqlite") if args.sqlite else ""
+        self.pictures_path = os.path.join(os.getcwd(), "pictures")
+        self.image_b64 = True
+        self.compact_mode = args.compact
+        self.response_cache.enabled = False
+        if args.concurrency:
+            self.concurrency = max(1, args.concurrency)
+            self.image_concurrency = max(1, args.concurrency)
+        self.durations = []
+
+    def set_status(self, text):
+        pass
+
+    def log_event(self, event, **fields):
+        super().log_event(event, **fields)
+        if event in ("wrestler_generated", "company_generated"):
+            self.durations.append(fields["seconds"])
+
+def run_benchmark_stage(stage, size, args):
+    core = BenchmarkCore(args)
+    if stage == "workers":
+        roster = [
+            {"name": f"Benchmark Wrestler {i}", "gender": random.choice(["Male", "Female"]), "company": "Random",
+             "exclusive": "Random", "description": "", "skill_preset": "Interpret"}
+            for i in range(size)
+        ]
+        func, func_args = core.run_wrestler_job, (roster, CheckpointJournal(WORKERS_CHECKPOINT_PATH))
+    elif stage == "companies":
+        companies = [{"name": f"Benchmark Promotion {i}", "description": "", "size": "Medium"} for i in range(size)]
+        func, func_args = core.run_company_job, (companies, CheckpointJournal(COMPANIES_CHECKPOINT_PATH))
+    else:
+        func, func_args = core.generate_wrestler_images, ()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    core.run_job(func, func_args)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Images have no per-item event, so use the request latencies instead
+    latencies = core.durations or core.metrics.labels.get("image_worker", {}).get("latencies", [])
+    summary = core.metrics.summary()
+    return {
+        "stage": stage,
+        "size": size,
+        "seconds": round(elapsed, 3),
+        "per_minute": round(size / elapsed * 60, 1) if elapsed else 0.0,
+        "p50_seconds": round(percentile(latencies, 0.5), 3),
+        "p95_seconds": round(percentile(latencies, 0.95), 3),
+        "peak_mb": round(peak / (1024 * 1024), 1),
+        "calls": sum(entry["calls"] for entry in summary.values()),
+        "retries": core.retry_count,
+        "fallbacks": core.fallback_count
+    }
+
+def run_benchmark(args):
+    # Load pandas up front so its one-off import is not counted against the first run's memory
+    import pandas as pd
+    results = []
+    original_dir = os.getcwd()
+    for size in args.sizes:
+        workdir = tempfile.mkdtemp(prefix=f"wrestleverse_benchmark_{size}_")
+        os.chdir(workdir)
+        try:
+            # Image runs draw from the wrestlers generated in the same directory
+            if "images" in args.stages and "workers" not in args.stages:
+                run_benchmark_stage("workers", size, args)
+            for stage in ["workers", "companies", "images"]:
+                if stage in args.stages:
+                    result = run_benchmark_stage(stage, size, args)
+                    results.append(result)
+                    print(
+                        f"{stage:<10}{size:>7}{result['seconds']:>10.1f}{result['per_minute']:>10.1f}"
+                        f"{result['p50_seconds']:>8.2f}{result['p95_seconds']:>8.2f}{result['peak_mb']:>10.1f}"
+                        f"{result['calls']:>8}{result['retries']:>9}{result['fallbacks']:>10}",
+                        flush=True
+                    )
+        finally:
+            os.chdir(original_dir)
+            shutil.rmtree(workdir, ignore_errors=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"latency_ms": args.latency_ms, "failure_rate": args.failure_rate, "results": results}, f, indent=2)
+    return results
+
+def read_specs(path, defaults):
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    specs = []
+    for row in rows:
+        spec = dict(defaults)
+        for key in defaults:
+            value = row.get(key)
+            if value is not None and str(value).strip():
+                spec[key] = str(value).strip()
+        specs.append(spec)
+    return specs
+
+def open_checkpoint(path, args):
+    journal = CheckpointJournal(path)
+    if args.resume:
+        if not journal.exists():
+            print("There is no unfinished run to resume.", file=sys.stderr)
+            return None, None, None
+        job, completed = journal.load()
+        if not job:
+            print("The checkpoint file could not be read.", file=sys.stderr)
+            return None, None, None
+        return journal, job, completed
+    if journal.exists() and not args.fresh:
+        print(
+            "An unfinished run can still be resumed. Pass --resume to continue it or --fresh to discard it.",
+            file=sys.stderr
+        )
+        return None, None, None
+    return journal, None, None
+
+def main(argv=None):
+    setup_logging()
+    parser = argparse.ArgumentParser(prog="wrestleverse", description="Generate TEW wrestlers, companies and images.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    workers_parser = subparsers.add_parser("generate-workers", help="Generate wrestlers from a CSV or JSONL roster")
+    workers_parser.add_argument("--input", help="Roster file with name, gender, company, exclusive, description and skill_preset columns")
+    workers_parser.add_argument("--concurrency", type=int, help="Wrestlers generated at the same time")
+    workers_parser.add_argument("--compact", action="store_true", help="Fetch all wrestler attributes in one call")
+    workers_parser.add_argument("--jsonl", help="Append each finished wrestler to this JSONL file as it completes")
+    workers_parser.add_argument("--resume", action="store_true", help="Continue the last unfinished run")
+    workers_parser.add_argument("--fresh", action="store_true", help="Discard an unfinished run and start over")
+
+    companies_parser = subparsers.add_parser("generate-companies", help="Generate companies from a CSV or JSONL file")
+    companies_parser.add_argument("--input", help="File with name, description and size columns")
+    companies_parser.add_argument("--resume", action="store_true", help="Continue the last unfinished run")
+    companies_parser.add_argument("--fresh", action="store_true", help="Discard an unfinished run and start over")
+
+    images_parser = subparsers.add_parser("generate-images", help="Generate pending wrestler or company images")
+    images_parser.add_argument("target", choices=["workers", "companies"])
+    images_parser.add_argument("--concurrency", type=int, help="Image requests in flight at the same time")
+
+    export_parser = subparsers.add_parser("export-workers", help="Write the generated workers to an Excel workbook")
+    export_parser.add_argument("--output", default=WORKERS_EXCEL_PATH)
+
+    sync_parser = subparsers.add_parser("sync-database", help="Copy TEW rows missing from one database into another")
+    sync_parser.add_argument("--source", required=True, help="Database to copy from (.accdb, .mdb or .sqlite)")
+    sync_parser.add_argument("--target", required=True, help="Database to copy into (.accdb, .mdb or .sqlite)")
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="Time the pipeline offline against the fake model backend")
+    benchmark_parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Entries generated per run")
+    benchmark_parser.add_argument("--stages", nargs="+", choices=["workers", "companies", "images"], default=["workers", "companies", "images"])
+    benchmark_parser.add_argument("--latency-ms", type=float, default=100, help="Median simulated call latency")
+    benchmark_parser.add_argument("--latency-sigma", type=float, default=0.5, help="Spread of the log-normal latency")
+    benchmark_parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of calls that fail with 429 or 5xx")
+    benchmark_parser.add_argument("--seed", type=int, default=0)
+    benchmark_parser.add_argument("--concurrency", type=int, help="Wrestlers or images in flight at the same time")
+    benchmark_parser.add_argument("--compact", action="store_true", help="Fetch all wrestler attributes in one call")
+    benchmark_parser.add_argument("--sqlite", action="store_true", help="Also save into a SQLite stand-in for the TEW database")
+    benchmark_parser.add_argument("--output", help="Also write the results to this JSON file")
+
+    parser.add_argument("--backend", choices=["openai", "fake"], help="Model backend; fake answers offline with canned data")
+
+    args = parser.parse_args(argv)
+
+    if not args.command:
+        if tk is None:
+            parser.error("tkinter is not available; use one of the batch commands")
+        root = tk.Tk()
+        app = WrestleverseApp(root, args.backend)
+        root.after_idle(lambda: logging.info(f"Main menu ready {time.perf_counter() - STARTUP_STARTED:.2f}s after launch"))
+        root.mainloop()
+        return 0
+
+    if args.command == "benchmark":
+        print(
+            f"{'Stage':<10}{'Size':>7}{'Seconds':>10}{'Per min':>10}{'p50 s':>8}{'p95 s':>8}{'Peak MB':>10}"
+            f"{'Calls':>8}{'Retries':>9}{'Defaults':>10}"
+        )
+        run_benchmark(args)
+        return 0
+
+    if args.command == "sync-database":
+        source = open_tew_database(args.source)
+        target = open_tew_database(args.target)
+        if not source or not target:
+            print("Both databases must exist; .sqlite files are created when missing.", file=sys.stderr)
+            return 1
+        copied = sync_tew_tables(source, target)
+        for table, count in copied.items():
+            print(f"{table}: {count} rows copied", file=sys.stderr)
+        return 0
+
+    core = WrestleverseCli()
+    if args.backend:
+        core.model_backend = args.backend
+    if core.model_backend == "fake" and not core.api_key:
+        core.api_key = "fake"
+    if not core.api_key and os.environ.get("OPENAI_API_KEY"):
+        core.api_key = os.environ["OPENAI_API_KEY"]
+
+    if args.command == "generate-workers":
+        if args.concurrency:
+            core.concurrency = max(1, args.concurrency)
+        if args.compact:
+            core.compact_mode = True
+        if args.jsonl:
+            core.workers_jsonl_path = args.jsonl
+        journal, job, completed = open_checkpoint(WORKERS_CHECKPOINT_PATH, args)
+        if not journal:
+            return 1
+        if job:
+            roster = job["roster"]
+        elif args.input:
+            roster = read_specs(args.input, {
+                "name": "", "gender": "Male", "company": "Random",
+                "exclusive": "Random", "description": "", "skill_preset": "Default"
+            })
+        else:
+            parser.error("--input is required unless --resume is given")
+        if not core.api_key:
+            parser.error("set api_key in settings.json or OPENAI_API_KEY")
+        core.run_job(core.run_wrestler_job, (roster, journal, job, completed))
+    elif args.command == "generate-companies":
+        journal, job, completed = open_checkpoint(COMPANIES_CHECKPOINT_PATH, args)
+        if not journal:
+            return 1
+        if job:
+            companies = job["companies"]
+        elif args.input:
+            companies = read_specs(args.input, {"name": "", "description": "", "size": "Medium"})
+        else:
+            parser.error("--input is required unless --resume is given")
+        if not core.api_key:
+            parser.error("set api_key in settings.json or OPENAI_API_KEY")
+        core.run_job(core.run_company_job, (companies, journal, job, completed))
+    elif args.command == "generate-images":
+        if args.concurrency:
+            core.image_concurrency = max(1, args.concurrency)
+        if args.target == "workers":
+            core.run_job(core.generate_wrestler_images, ())
+        else:
+            core.run_job(core.generate_company_images, ())
+    elif args.command == "export-workers":
+        core.worker_store.export_excel(args.output, core.image_status.done("worker"))
+        print(f"Wrestlers exported to {args.output}", file=sys.stderr)
+
+    return 1 if core.errors else 0
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = WrestleverseApp(root)
-    root.mainloop()
+    # Frozen builds re-run this script in each pool worker process
+    multiprocessing.freeze_support()
+    sys.exit(main())